@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Benchmark narzutu dekoratora enforce_quality.
+
+Porównuje wywołanie funkcji opakowanej w enforce_quality (po pierwszej
+walidacji, czyli z werdyktem w cache) z gołym wrapperem functools.wraps.
+
+Uruchomienie:
+    python benchmarks/bench_enforce_quality.py [liczba_wywołań]
+"""
+
+import functools
+import json
+import os
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from quality_guard_exceptions import config_registry, enforce_quality, verdict_cache
+
+
+def passthrough(func):
+    """Referencyjny wrapper bez żadnej logiki"""
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        return func(*args, **kwargs)
+
+    return wrapper
+
+
+def add_numbers(x, y):
+    """Dodaje dwie liczby i zwraca wynik."""
+    return x + y
+
+
+def _measure(func, number: int) -> float:
+    """Zwraca najlepszy czas pojedynczego wywołania w nanosekundach"""
+    timer = timeit.Timer(lambda: func(1, 2))
+    best = min(timer.repeat(repeat=5, number=number))
+    return best / number * 1e9
+
+
+def main(number: int = 200_000):
+    workdir = tempfile.mkdtemp()
+    original_cwd = os.getcwd()
+    os.chdir(workdir)
+    try:
+        with open("quality-guard.json", "w") as f:
+            json.dump({"require_tests": False}, f)
+        config_registry.reset()
+
+        bare = add_numbers
+        wrapped = passthrough(add_numbers)
+        guarded = enforce_quality(add_numbers)
+        guarded(1, 2)  # Pierwsze wywołanie wypełnia cache werdyktów
+
+        bare_ns = _measure(bare, number)
+        wrapped_ns = _measure(wrapped, number)
+        guarded_ns = _measure(guarded, number)
+    finally:
+        os.chdir(original_cwd)
+        config_registry.reset()
+        verdict_cache.clear()
+
+    print(f"📊 Narzut enforce_quality ({number} wywołań, najlepszy z 5 pomiarów)")
+    print(f"   funkcja bez dekoratora:   {bare_ns:8.1f} ns/wywołanie")
+    print(f"   functools.wraps passthru: {wrapped_ns:8.1f} ns/wywołanie")
+    print(f"   enforce_quality (cache):  {guarded_ns:8.1f} ns/wywołanie")
+    print(f"   stosunek do passthrough:  {guarded_ns / wrapped_ns:8.2f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
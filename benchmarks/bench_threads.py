@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Test obciążeniowy walidatora i dekoratorów przy wielu wątkach.
+
+Dla 1, 2, 4, 8, 16 i 32 wątków wywołuje współdzielone funkcje opakowane
+w enforce_quality (przechodzącą i łamiącą reguły) oraz waliduje je wspólną
+instancją QualityGuardValidator. Sprawdza poprawność każdego wyniku i podaje
+przepustowość. Pod GIL-em przepustowość nie rośnie z liczbą wątków - ważne
+jest, że nie spada gwałtownie (brak rywalizacji o blokady) i nie ma błędów.
+
+Uruchomienie:
+    python benchmarks/bench_threads.py [wywołań_na_wątek]
+"""
+
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from quality_guard_exceptions import (
+    QualityGuardException,
+    QualityGuardValidator,
+    config_registry,
+    enforce_quality,
+    verdict_cache,
+)
+
+THREAD_COUNTS = (1, 2, 4, 8, 16, 32)
+
+
+def add_numbers(x, y):
+    """Dodaje dwie liczby i zwraca wynik."""
+    return x + y
+
+
+def no_docs(x):
+    return x
+
+
+def _run(thread_count: int, calls: int, target) -> tuple:
+    """Uruchamia target(calls) w thread_count wątkach; zwraca (czas, błędy)"""
+    barrier = threading.Barrier(thread_count + 1)
+    errors = []
+
+    def worker():
+        barrier.wait()
+        try:
+            target(calls)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker) for _ in range(thread_count)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start, errors
+
+
+def main(calls: int = 20_000):
+    workdir = tempfile.mkdtemp()
+    original_cwd = os.getcwd()
+    os.chdir(workdir)
+    try:
+        with open("quality-guard.json", "w") as f:
+            json.dump({"require_tests": False}, f)
+        config_registry.reset()
+
+        good = enforce_quality(add_numbers)
+        bad = enforce_quality(no_docs)
+        validator = QualityGuardValidator()
+
+        def call_wrappers(n):
+            for i in range(n):
+                if good(i, 1) != i + 1:
+                    raise AssertionError("zły wynik")
+                try:
+                    bad(i)
+                except QualityGuardException:
+                    pass
+                else:
+                    raise AssertionError("brak wyjątku")
+
+        def validate_shared(n):
+            for _ in range(n):
+                if validator.validate_function(add_numbers):
+                    raise AssertionError("fałszywe naruszenie")
+                if len(validator.validate_function(no_docs)) != 1:
+                    raise AssertionError("zgubione naruszenie")
+
+        print(f"📊 Wątki: {calls} wywołań na wątek (dekoratory), {calls // 100} walidacji na wątek")
+        print(f"   {'wątki':>6} {'dekoratory/s':>14} {'walidacje/s':>14} {'błędy':>6}")
+        for count in THREAD_COUNTS:
+            wrap_time, wrap_errors = _run(count, calls, call_wrappers)
+            val_time, val_errors = _run(count, calls // 100, validate_shared)
+            print(f"   {count:>6} {2 * count * calls / wrap_time:>14,.0f} "
+                  f"{2 * count * (calls // 100) / val_time:>14,.0f} "
+                  f"{len(wrap_errors) + len(val_errors):>6}")
+    finally:
+        os.chdir(original_cwd)
+        config_registry.reset()
+        verdict_cache.clear()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000)
@@ -26,6 +26,11 @@ def wrap_module_functions(module_name: str) -> None:
     import importlib
     try:
         module = sys.modules[module_name]
+
+        # Jedno parsowanie modułu - wrappery korzystają z gotowych werdyktów
+        from quality_guard_exceptions import prime_module_verdicts
+        prime_module_verdicts(module)
+
         for name, obj in list(module.__dict__.items()):
             if (inspect.isfunction(obj) and 
                 obj.__module__ == module_name and 
@@ -3,17 +3,35 @@
 
 import sys
 import os
+import atexit
+import bisect
 import ast
 import inspect
+import io
 import functools
+import hashlib
 import importlib
+import importlib.abc
+import importlib.util
 import traceback
+import warnings
+import weakref
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Callable, Union
-from dataclasses import dataclass
+from typing import Dict, List, Any, Optional, Callable, Set, Union
 from enum import Enum
 import json
+import multiprocessing
+import queue
 import re
+import site
+import sysconfig
+import textwrap
+import threading
+import time
+import tokenize
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor, wait as futures_wait
+from types import CodeType, MappingProxyType
 
 
 class QualityLevel(Enum):
@@ -24,25 +42,99 @@ class QualityLevel(Enum):
     CRITICAL = "critical"
 
 
-@dataclass
 class QualityViolation:
-    """Reprezentuje naruszenie standardów jakości"""
-    rule_name: str
-    message: str
-    suggestion: str
-    level: QualityLevel
-    file_path: str = ""
-    line_number: int = 0
-    function_name: str = ""
-    context: Dict[str, Any] = None
+    """Reprezentuje naruszenie standardów jakości.
+
+    Rekord ze slotami: nazwy reguł i ścieżki są internowane, a message
+    i suggestion mogą być szablonami (str.format) renderowanymi z params
+    dopiero przy odczycie - tworzenie naruszenia nie formatuje tekstów.
+    """
+
+    __slots__ = ("rule_name", "level", "file_path", "line_number", "function_name", "context",
+                 "params", "_message", "_suggestion")
+
+    def __init__(self, rule_name: str, message: str, suggestion: str, level: QualityLevel,
+                 file_path: str = "", line_number: int = 0, function_name: str = "",
+                 context: Dict[str, Any] = None, params: Dict[str, Any] = None):
+        self.rule_name = sys.intern(rule_name)
+        self.level = level
+        self.file_path = sys.intern(file_path) if isinstance(file_path, str) else file_path
+        self.line_number = line_number
+        self.function_name = function_name
+        self.context = context
+        self.params = params
+        self._message = message
+        self._suggestion = suggestion
+
+    def _render(self, template: str) -> str:
+        return template if self.params is None else template.format_map(self.params)
+
+    @property
+    def message(self) -> str:
+        return self._render(self._message)
+
+    @property
+    def suggestion(self) -> str:
+        return self._render(self._suggestion)
+
+    def _key(self) -> tuple:
+        return (self.rule_name, self.message, self.suggestion, self.level, self.file_path,
+                self.line_number, self.function_name, self.context)
+
+    def __eq__(self, other):
+        if not isinstance(other, QualityViolation):
+            return NotImplemented
+        return self._key() == other._key()
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return (f"QualityViolation(rule_name={self.rule_name!r}, level={self.level}, "
+                f"file_path={self.file_path!r}, line_number={self.line_number!r}, "
+                f"function_name={self.function_name!r})")
+
+    def __str__(self) -> str:
+        return self.message
+
+
+def _rebuild_exception(cls: type, violations: List[QualityViolation]) -> "QualityGuardException":
+    """Odtwarza wyjątek po unpickle bez wywoływania __init__ podklasy (inne argumenty)"""
+    error = cls.__new__(cls)
+    QualityGuardException.__init__(error, violations)
+    return error
 
 
 class QualityGuardException(Exception):
-    """Bazowy wyjątek Quality Guard"""
+    """Bazowy wyjątek Quality Guard.
+
+    Raport jest formatowany dopiero przy odczycie; args, repr() i pickle
+    wyglądają jak dla Exception(komunikat).
+    """
 
     def __init__(self, violations: List[QualityViolation]):
         self.violations = violations
-        super().__init__(self._format_message())
+        self._message = None
+        super().__init__()
+
+    def __str__(self) -> str:
+        # Raport jest formatowany dopiero gdy ktoś go czyta
+        if self._message is None:
+            self._message = self._format_message()
+        return self._message
+
+    @property
+    def args(self) -> tuple:
+        return (str(self),)
+
+    @args.setter
+    def args(self, value: tuple):
+        self._message = str(value[0]) if len(value) == 1 else str(tuple(value))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({str(self)!r})"
+
+    def __reduce__(self):
+        return _rebuild_exception, (type(self), self.violations), self.__dict__
 
     def _format_message(self) -> str:
         """Formatuje komunikat błędu"""
@@ -71,6 +163,11 @@ class QualityGuardException(Exception):
         return "\n".join(lines)
 
 
+class QualityGuardWarning(UserWarning):
+    """Ostrzeżenie Quality Guard (enforcement_level == "warning")"""
+    pass
+
+
 class MissingTestException(QualityGuardException):
     """Wyjątek: Brak testów jednostkowych"""
 
@@ -153,6 +250,15 @@ class UnauthorizedFunctionException(QualityGuardException):
         super().__init__([violation])
 
 
+def _source_stamp(file_path: str) -> Optional[tuple]:
+    """Zwraca (mtime_ns, size) pliku źródłowego lub None gdy plik nie istnieje"""
+    try:
+        stat = os.stat(file_path)
+    except (OSError, TypeError, ValueError):
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
 class QualityConfig:
     """Konfiguracja Quality Guard"""
 
@@ -178,6 +284,27 @@ class QualityConfig:
                 "ARCHITECTURE.md"
             ],
             "enforcement_level": "error",  # error, warning, info
+            "validation_mode": "lazy",  # eager, lazy, per_call
+            "install_mode": "wrap",  # wrap, static (install_globally)
+            "project_roots": [],  # dodatkowe katalogi kodu użytkownika (względem projektu)
+            "prevalidation": {  # walidacja projektu w puli procesów przy instalacji hooka
+                "enabled": False,
+                "workers": None,  # domyślnie os.cpu_count()
+                "timeout": 30  # sekundy czekania loadera na werdykt, potem walidacja na miejscu
+            },
+            "sampling": {  # tylko dla per_call
+                "every_n": 1,
+                "min_interval": 0,
+                "warmup_seconds": None
+            },
+            "telemetry": {  # zapis naruszeń gdy enforcement_level != "error"
+                "path": None,  # domyślnie .quality_guard_cache/violations.jsonl
+                "max_bytes": 10 * 1024 * 1024,
+                "backup_count": 3,
+                "queue_size": 10000,
+                "flush_interval": 1.0,
+                "fsync_interval": 5.0
+            },
             "auto_generate": {
                 "tests": True,
                 "docs": True
@@ -197,274 +324,2061 @@ class QualityConfig:
     def get(self, key: str, default=None):
         return self.config.get(key, default)
 
+    @classmethod
+    def shared(cls) -> "QualityConfig":
+        """Zwraca współdzieloną, niemodyfikowalną konfigurację projektu"""
+        return config_registry.snapshot()
+
+
+PROJECT_ROOT_MARKERS = ("quality-guard.json", "pyproject.toml", "setup.py", ".git")
+
+
+def find_project_root(start: Optional[str] = None) -> Path:
+    """Znajduje katalog główny projektu idąc w górę od start (domyślnie CWD)"""
+    env_root = os.environ.get("QUALITY_GUARD_ROOT")
+    if env_root:
+        return Path(env_root).resolve()
+
+    start_dir = Path(start or os.getcwd()).resolve()
+    for marker in PROJECT_ROOT_MARKERS:
+        for directory in (start_dir, *start_dir.parents):
+            if (directory / marker).exists():
+                return directory
+    return start_dir
+
+
+def _freeze(value: Any) -> Any:
+    """Zamienia słowniki i listy na niemodyfikowalne odpowiedniki"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+class ConfigRegistry:
+    """Procesowy rejestr konfiguracji Quality Guard.
+
+    Ścieżka do quality-guard.json jest wyznaczana raz względem katalogu
+    głównego projektu. Plik jest ponownie sprawdzany (stat) najwyżej co
+    reload_interval sekund lub po reload(); czytany tylko gdy zmienił się
+    jego mtime/rozmiar. generation rośnie przy każdej zmianie konfiguracji,
+    więc wrappery wiedzą kiedy zapamiętany werdykt jest nieaktualny.
+    """
+
+    CONFIG_NAME = "quality-guard.json"
+
+    def __init__(self, reload_interval: float = 2.0):
+        self.reload_interval = reload_interval
+        self._lock = threading.Lock()
+        self._path: Optional[Path] = None
+        self._stamp: Optional[tuple] = None
+        self._snapshot: Optional[QualityConfig] = None
+        self._checked_at = 0.0
+        self.generation = 0
+
+    @property
+    def path(self) -> Path:
+        if self._path is None:
+            self._path = find_project_root() / self.CONFIG_NAME
+        return self._path
+
+    def snapshot(self) -> QualityConfig:
+        """Zwraca aktualny snapshot; szybka ścieżka bez blokady i bez I/O"""
+        snapshot = self._snapshot
+        if snapshot is not None and time.monotonic() - self._checked_at < self.reload_interval:
+            return snapshot
+        return self.reload(force=False)
+
+    def reload(self, force: bool = True) -> QualityConfig:
+        """Sprawdza plik konfiguracji i wczytuje go ponownie jeśli się zmienił"""
+        with self._lock:
+            path = self.path
+            stamp = _source_stamp(str(path))
+            if force or self._snapshot is None or stamp != self._stamp:
+                previous = self._snapshot
+                snapshot = QualityConfig(str(path))
+                snapshot.config = _freeze(snapshot.config)
+                self._snapshot = snapshot
+                self._stamp = stamp
+                if previous is not None and previous.config != snapshot.config:
+                    # Werdykty zależą od progów konfiguracji
+                    verdict_cache.clear()
+                    self.generation += 1
+            self._checked_at = time.monotonic()
+            return self._snapshot
+
+    def reset(self):
+        """Zapomina ścieżkę i snapshot (np. po zmianie katalogu projektu)"""
+        with self._lock:
+            self._path = None
+            self._stamp = None
+            self._snapshot = None
+            self._checked_at = 0.0
+            self.generation += 1
+
+
+config_registry = ConfigRegistry()
+
+
+# INDEKSY NAZW dla reguł require_tests i require_architecture_docs
+
+CACHE_DIR_NAME = ".quality_guard_cache"
+
+_TEST_NAME_RE = re.compile(r"\b([Tt]est\w*)")
+_IDENTIFIER_RE = re.compile(r"[A-Za-z_]\w*")
+_CODE_SPAN_RE = re.compile(r"(`+)(.+?)\1")
+
+
+def _extract_test_names(source: str) -> set:
+    """Zwraca identyfikatory testów zdefiniowane w pliku testowym"""
+    try:
+        tree = ast.parse(source)
+    except (SyntaxError, ValueError):
+        # Plik niepoprawny składniowo - wystarczy tokenizacja nazw
+        return set(_TEST_NAME_RE.findall(source))
+
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.name.startswith("test"):
+            names.add(node.name)
+        elif isinstance(node, ast.ClassDef) and node.name.startswith("Test"):
+            names.add(node.name)
+            names.add("test" + node.name[4:])
+    return names
+
+
+def _extract_doc_symbols(source: str) -> set:
+    """Zwraca identyfikatory z nagłówków, bloków kodu i `code spanów` markdown"""
+    symbols = set()
+    in_fence = False
+
+    for line in source.splitlines():
+        stripped = line.strip()
+        if stripped.startswith("```") or stripped.startswith("~~~"):
+            in_fence = not in_fence
+            continue
+        if in_fence or stripped.startswith("#"):
+            symbols.update(_IDENTIFIER_RE.findall(stripped))
+            continue
+        for _, span in _CODE_SPAN_RE.findall(line):
+            symbols.update(_IDENTIFIER_RE.findall(span))
+    return symbols
+
+
+def _name_prefixes(name: str) -> List[str]:
+    """test_a_b_c -> [test_a_b_c, test_a_b, test_a] (prefiksy na granicy '_')"""
+    prefixes = [name]
+    while "_" in name:
+        name = name.rsplit("_", 1)[0]
+        if name:
+            prefixes.append(name)
+    return prefixes
+
+
+def _write_json_atomic(path: Path, data: Any):
+    """Zapisuje JSON atomowo; błędy zapisu (np. system tylko do odczytu) są ignorowane"""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+class SymbolIndex:
+    """Bazowy indeks nazw wyciąganych z plików projektu.
+
+    Nazwy z plików pasujących do wzorców są zapisywane w pliku cache;
+    przy odświeżeniu parsowane są tylko pliki, którym zmienił się
+    mtime/rozmiar. Zapytanie to sprawdzenie w zbiorze.
+    """
+
+    CACHE_FILE = "symbols.json"
+
+    def __init__(self, patterns: List[str], root: Optional[Path] = None,
+                 cache_path: Optional[Path] = None):
+        self.patterns = tuple(patterns)
+        self.root = Path(root) if root else Path.cwd()
+        self.cache_path = cache_path or self.root / CACHE_DIR_NAME / self.CACHE_FILE
+        self._files: Dict[str, Dict[str, Any]] = {}
+        self._names: set = set()
+        self._fingerprint: Optional[str] = None
+        self._built = False
+        self._lock = threading.Lock()
+
+    def _extract(self, source: str) -> set:
+        raise NotImplementedError
+
+    def _expand(self, name: str) -> List[str]:
+        return [name]
+
+    def _discover(self) -> List[str]:
+        import glob
+
+        found = set()
+        for pattern in self.patterns:
+            for path in glob.glob(str(self.root / pattern), recursive=True):
+                if os.path.isfile(path):
+                    found.add(os.path.relpath(path, self.root))
+        return sorted(found)
+
+    def _load_cache(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.cache_path, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if data.get("patterns") != list(self.patterns):
+            return {}
+        return data.get("files", {})
+
+    def refresh(self) -> "SymbolIndex":
+        """Aktualizuje indeks; ponownie parsuje tylko zmienione pliki"""
+        with self._lock:
+            cached = self._files or self._load_cache()
+            files = {}
+            changed = False
+
+            for rel_path in self._discover():
+                stamp = _source_stamp(str(self.root / rel_path))
+                if stamp is None:
+                    continue
+                entry = cached.get(rel_path)
+                if entry is None or tuple(entry["stamp"]) != stamp:
+                    try:
+                        with open(self.root / rel_path, 'r', encoding='utf-8', errors='replace') as f:
+                            names = sorted(self._extract(f.read()))
+                    except OSError:
+                        continue
+                    entry = {"stamp": list(stamp), "names": names}
+                    changed = True
+                files[rel_path] = entry
+
+            changed = changed or set(files) != set(cached)
+
+            names = set()
+            for entry in files.values():
+                for name in entry["names"]:
+                    names.update(self._expand(name))
+
+            self._files = files
+            self._names = names
+            self._fingerprint = None
+            self._built = True
+
+            if changed:
+                _write_json_atomic(self.cache_path, {"patterns": list(self.patterns), "files": files})
+        return self
+
+    def __contains__(self, name: str) -> bool:
+        if not self._built:
+            self.refresh()
+        return name in self._names
+
+    def fingerprint(self) -> str:
+        """Skrót zbioru nazw - zmienia się gdy zmienią się znalezione symbole"""
+        if not self._built:
+            self.refresh()
+        if self._fingerprint is None:
+            self._fingerprint = hashlib.sha1("\n".join(sorted(self._names)).encode()).hexdigest()
+        return self._fingerprint
+
+
+class UnitTestIndex(SymbolIndex):
+    """Indeks identyfikatorów testów (test_<name>, test<Name>, metody klas Test*).
+
+    Indeksowane są też prefiksy nazw na granicy '_', więc test_foo_edge_cases
+    jest testem dla foo.
+    """
+
+    CACHE_FILE = "test_index.json"
+
+    def _extract(self, source: str) -> set:
+        return _extract_test_names(source)
+
+    def _expand(self, name: str) -> List[str]:
+        return _name_prefixes(name)
+
+    def has_test_for(self, func_name: str) -> bool:
+        """Czy istnieje test_<name> lub test<Name> dla funkcji"""
+        return f"test_{func_name}" in self or f"test{func_name.title()}" in self
+
+
+class DocSymbolIndex(SymbolIndex):
+    """Indeks identyfikatorów z dokumentacji architektury (doc_files).
+
+    Dopasowanie dotyczy całych identyfikatorów, więc `get_user` w
+    dokumentacji nie autoryzuje funkcji get.
+    """
+
+    CACHE_FILE = "doc_index.json"
+
+    def _extract(self, source: str) -> set:
+        return _extract_doc_symbols(source)
+
+    def is_documented(self, func_name: str) -> bool:
+        """Czy funkcja występuje w nagłówku, bloku kodu lub code spanie"""
+        return func_name in self
+
+
+_symbol_indexes: Dict[tuple, SymbolIndex] = {}
+_symbol_indexes_lock = threading.Lock()
+
+
+def _shared_index(index_class: type, patterns: List[str], root: Optional[Path]) -> SymbolIndex:
+    root = Path(root) if root else config_registry.path.parent
+    key = (index_class, root, tuple(patterns))
+    index = _symbol_indexes.get(key)
+    if index is None:
+        with _symbol_indexes_lock:
+            index = _symbol_indexes.setdefault(key, index_class(patterns, root))
+    return index
+
+
+def get_test_index(patterns: List[str], root: Optional[Path] = None) -> UnitTestIndex:
+    """Zwraca współdzielony indeks testów dla wzorców i katalogu projektu"""
+    return _shared_index(UnitTestIndex, patterns, root)
+
+
+def get_doc_index(doc_files: List[str], root: Optional[Path] = None) -> DocSymbolIndex:
+    """Zwraca współdzielony indeks symboli dokumentacji architektury"""
+    return _shared_index(DocSymbolIndex, doc_files, root)
+
+
+# METRYKI FUNKCJI liczone w jednym przejściu po AST
+
+_BRANCH_NODES = (ast.If, ast.While, ast.For, ast.AsyncFor, ast.ExceptHandler)
+_NESTING_NODES = (ast.If, ast.While, ast.For, ast.AsyncFor, ast.Try)
+
+
+class FunctionMetrics:
+    """Zwarty rekord metryk funkcji"""
+    __slots__ = ("lines", "logical_lines", "complexity", "depth", "params",
+                 "docstring_length", "has_annotations")
+
+    def __init__(self, lines: int, logical_lines: int, complexity: int, depth: int, params: int,
+                 docstring_length: int, has_annotations: bool):
+        self.lines = lines
+        self.logical_lines = logical_lines
+        self.complexity = complexity
+        self.depth = depth
+        self.params = params
+        self.docstring_length = docstring_length
+        self.has_annotations = has_annotations
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"FunctionMetrics({fields})"
+
+
+def compute_function_metrics(node: ast.AST, lines: Optional[List[str]] = None) -> FunctionMetrics:
+    """Liczy wszystkie metryki funkcji jednym przejściem po jej AST.
+
+    lines to linie źródłowe funkcji; bez nich liczba linii pochodzi z
+    lineno/end_lineno, a linie logiczne są jej równe.
+    """
+    complexity = 1
+    max_depth = 0
+    stack = [(child, 0) for child in ast.iter_child_nodes(node)]
+    while stack:
+        current, depth = stack.pop()
+        if isinstance(current, _BRANCH_NODES):
+            complexity += 1
+        elif isinstance(current, ast.BoolOp):
+            complexity += len(current.values) - 1
+        if isinstance(current, _NESTING_NODES):
+            depth += 1
+            if depth > max_depth:
+                max_depth = depth
+        stack.extend((child, depth) for child in ast.iter_child_nodes(current))
+
+    if lines is not None:
+        line_count = len(lines)
+        logical_lines = len([line for line in lines if line.strip() and not line.strip().startswith('#')])
+    else:
+        line_count = getattr(node, "end_lineno", getattr(node, "lineno", 1)) - getattr(node, "lineno", 1) + 1
+        logical_lines = line_count
+
+    params = 0
+    has_annotations = False
+    args = getattr(node, "args", None)
+    if isinstance(args, ast.arguments):
+        params = len(args.args) + len(args.kwonlyargs)
+        all_args = getattr(args, "posonlyargs", []) + args.args + args.kwonlyargs + [a for a in (args.vararg, args.kwarg) if a]
+        has_annotations = node.returns is not None or any(a.annotation is not None for a in all_args)
+
+    docstring = None
+    if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef, ast.Module)):
+        docstring = ast.get_docstring(node)
+
+    return FunctionMetrics(
+        lines=line_count,
+        logical_lines=logical_lines,
+        complexity=complexity,
+        depth=max_depth,
+        params=params,
+        docstring_length=len(docstring) if docstring else 0,
+        has_annotations=has_annotations,
+    )
+
+
+# CACHE ŹRÓDEŁ I AST dla walidatora
+
+class FunctionSource:
+    """Węzeł AST funkcji i jej linie źródłowe (razem z dekoratorami)"""
+    __slots__ = ("node", "lines", "first_line", "_metrics")
+
+    def __init__(self, node: ast.AST, lines: List[str], first_line: int):
+        self.node = node
+        self.lines = lines
+        self.first_line = first_line
+        self._metrics: Optional[FunctionMetrics] = None
+
+    @property
+    def metrics(self) -> FunctionMetrics:
+        """Metryki liczone przy pierwszym użyciu i zapamiętywane"""
+        if self._metrics is None:
+            self._metrics = compute_function_metrics(self.node, self.lines)
+        return self._metrics
+
+
+def _first_line(node: ast.AST) -> int:
+    """Pierwsza linia instrukcji razem z dekoratorami"""
+    return min([node.lineno] + [d.lineno for d in getattr(node, "decorator_list", [])])
+
+
+def _fill_function_end_lines(tree: ast.AST, lines: List[str]):
+    """Uzupełnia end_lineno funkcji w Pythonie 3.7, który go nie zapisuje.
+
+    Koniec funkcji to linia przed następną instrukcją tego samego bloku
+    (lub koniec bloku rodzica), bez końcowych pustych linii, komentarzy i
+    linii wciętych nie głębiej niż samo def.
+    """
+    def visit(node: ast.AST, bound: int):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            last_start = max(child.lineno for child in ast.walk(node) if hasattr(child, "lineno"))
+            end = bound
+            while end > last_start:
+                line = lines[end - 1]
+                stripped = line.strip()
+                if stripped and not stripped.startswith('#') and len(line) - len(line.lstrip()) > node.col_offset:
+                    break
+                end -= 1
+            node.end_lineno = end
+
+        # Bloki w kolejności źródła; ostatnia instrukcja bloku kończy się przed następnym blokiem
+        blocks = [block for block in (getattr(node, field, None) for field in ("body", "handlers", "orelse", "finalbody"))
+                  if isinstance(block, list) and block and hasattr(block[0], "lineno")]
+        for block_index, block in enumerate(blocks):
+            block_bound = _first_line(blocks[block_index + 1][0]) - 1 if block_index + 1 < len(blocks) else bound
+            for index, statement in enumerate(block):
+                visit(statement, _first_line(block[index + 1]) - 1 if index + 1 < len(block) else block_bound)
+
+    visit(tree, len(lines))
+
+
+class ModuleSource:
+    """Sparsowany plik źródłowy: linie i mapa co_firstlineno -> węzeł funkcji"""
+    __slots__ = ("stamp", "lines", "tree", "functions", "_sources")
+
+    def __init__(self, stamp: tuple, lines: List[str], tree: ast.Module):
+        self.stamp = stamp
+        self.lines = lines
+        self.tree = tree
+        self.functions: Dict[int, ast.AST] = {}
+        self._sources: Dict[int, FunctionSource] = {}
+        for node in ast.walk(tree):
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                # co_firstlineno wskazuje pierwszy dekorator
+                self.functions[_first_line(node)] = node
+        if any(getattr(node, "end_lineno", None) is None for node in self.functions.values()):
+            _fill_function_end_lines(tree, lines)
+
+    def function_source(self, first_line: int, name: str) -> Optional[FunctionSource]:
+        """Zwraca (zapamiętane) źródło funkcji zaczynającej się w first_line"""
+        source = self._sources.get(first_line)
+        if source is not None:
+            return source if source.node.name == name else None
+
+        node = self.functions.get(first_line)
+        if node is None or node.name != name:
+            return None
+        source = FunctionSource(node, self.lines[first_line - 1:node.end_lineno], first_line)
+        return self._sources.setdefault(first_line, source)
+
+
+class SourceCache:
+    """Procesowy cache LRU sparsowanych modułów.
+
+    Każdy plik jest czytany i parsowany raz; wpis jest unieważniany gdy
+    zmieni się mtime/rozmiar pliku, a najstarsze wpisy są usuwane po
+    przekroczeniu max_files.
+    """
+
+    def __init__(self, max_files: int = 256):
+        self.max_files = max_files
+        self._modules: "OrderedDict[str, ModuleSource]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def module(self, file_path: str) -> Optional[ModuleSource]:
+        """Zwraca sparsowany moduł lub None gdy pliku nie da się przeczytać"""
+        stamp = _source_stamp(file_path)
+        if stamp is None:
+            return None
+
+        # Odczyt bez blokady - dict.get jest atomowy pod GIL, a wpisy są niemodyfikowalne
+        module = self._modules.get(file_path)
+        if module is not None and module.stamp == stamp:
+            try:
+                self._modules.move_to_end(file_path)
+            except KeyError:
+                pass  # Wpis usunięty równolegle przez innego czytelnika
+            return module
+
+        # Parsowanie pod blokadą: plik parsowany raz, a równoległe ast.parse
+        # w starszych CPython kończy się SystemError (AST constructor recursion depth mismatch)
+        with self._lock:
+            module = self._modules.get(file_path)
+            if module is not None and module.stamp == stamp:
+                return module
+            try:
+                with tokenize.open(file_path) as f:
+                    source = f.read()
+                module = ModuleSource(stamp, source.splitlines(keepends=True), ast.parse(source, filename=file_path))
+            except (OSError, SyntaxError, ValueError, UnicodeDecodeError):
+                return None
+
+            self._modules[file_path] = module
+            self._modules.move_to_end(file_path)
+            while len(self._modules) > self.max_files:
+                self._modules.popitem(last=False)
+        return module
+
+    def function_source(self, func: Callable) -> Optional[FunctionSource]:
+        """Zwraca źródło funkcji z cache (po co_filename i co_firstlineno)"""
+        code = getattr(func, "__code__", None)
+        if code is None:
+            return None
+
+        module = self.module(code.co_filename)
+        if module is None:
+            return None
+
+        return module.function_source(code.co_firstlineno, code.co_name)
+
+    def clear(self):
+        with self._lock:
+            self._modules.clear()
+
+    def __len__(self) -> int:
+        return len(self._modules)
+
+
+source_cache = SourceCache()
+
+
+def get_function_source(func: Callable) -> Optional[FunctionSource]:
+    """Źródło funkcji z cache; dla klas i kodu spoza plików przez inspect"""
+    source = source_cache.function_source(func)
+    if source is not None:
+        return source
+
+    try:
+        lines, first_line = inspect.getsourcelines(func)
+        tree = ast.parse(textwrap.dedent("".join(lines)))
+    except (OSError, TypeError, SyntaxError):
+        return None
+    node = tree.body[0] if len(tree.body) == 1 else tree
+    return FunctionSource(node, lines, first_line)
+
+
+def _function_location(func: Callable) -> tuple:
+    """(plik, numer linii) funkcji bez ponownego czytania źródła"""
+    code = getattr(func, "__code__", None)
+    if code is not None:
+        return inspect.getfile(func), code.co_firstlineno
+    return inspect.getfile(func), inspect.getsourcelines(func)[1]
+
+
+# STATYSTYKI CZASU reguł walidatora
+
+def _untimed(rule: str, check: Callable, *args):
+    return check(*args)
+
+
+class CheckTimings:
+    """Liczniki czasu reguł (perf_counter_ns) agregowane per reguła i per funkcja.
+
+    Domyślnie wyłączone - walidator sprawdza wtedy tylko flagę enabled.
+    Włączane przez enable_stats() albo zmienne QG_STATS / QG_STATS_FILE.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self._rules: Dict[str, List[int]] = {}
+        self._functions: Dict[str, List[int]] = {}
+        self._lock = threading.Lock()
+
+    def timed(self, function_key: str) -> Callable:
+        """Zwraca funkcję uruchamiającą regułę z pomiarem czasu"""
+        return functools.partial(self._run, function_key)
+
+    def _run(self, function_key: str, rule: str, check: Callable, *args):
+        start = time.perf_counter_ns()
+        try:
+            return check(*args)
+        finally:
+            self._record(function_key, rule, time.perf_counter_ns() - start)
+
+    def _record(self, function_key: str, rule: str, elapsed_ns: int):
+        with self._lock:
+            for table, key in ((self._rules, rule), (self._functions, function_key)):
+                entry = table.get(key)
+                if entry is None:
+                    entry = table[key] = [0, 0, 0]  # liczba, suma ns, maksimum ns
+                entry[0] += 1
+                entry[1] += elapsed_ns
+                if elapsed_ns > entry[2]:
+                    entry[2] = elapsed_ns
+
+    @staticmethod
+    def _summarize(table: Dict[str, List[int]]) -> Dict[str, Dict[str, int]]:
+        return {
+            key: {"count": count, "total_ns": total, "mean_ns": total // count, "max_ns": maximum}
+            for key, (count, total, maximum) in table.items()
+        }
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "rules": self._summarize(self._rules),
+                "functions": self._summarize(self._functions),
+            }
+
+    def reset(self):
+        with self._lock:
+            self._rules.clear()
+            self._functions.clear()
+
+
+check_timings = CheckTimings()
+
+
+def stats() -> Dict[str, Any]:
+    """Czasy reguł walidatora: {"enabled", "rules": {...}, "functions": {...}}"""
+    return check_timings.snapshot()
+
+
+def enable_stats(enabled: bool = True):
+    check_timings.enabled = enabled
+
+
+def reset_stats():
+    check_timings.reset()
+
+
+def dump_stats(path: Union[str, Path]):
+    """Zapisuje stats() jako JSON (używane przy wyjściu gdy ustawiono QG_STATS_FILE)"""
+    _write_json_atomic(Path(path), stats())
+
+
+if os.environ.get("QG_STATS") or os.environ.get("QG_STATS_FILE"):
+    enable_stats()
+    if os.environ.get("QG_STATS_FILE"):
+        atexit.register(dump_stats, os.environ["QG_STATS_FILE"])
+
+
+# METRYKI PROMETHEUS - eksport w formacie tekstowym (textfile collector)
+
+class EnforcementMetrics:
+    """Liczniki i histogram egzekwowania (bez blokad, wartości przybliżone).
+
+    Narzut wrappera jest mierzony tylko gdy wywołanie przechodzi przez
+    bramkę (walidacja, decyzja próbkowania); wywołania obsłużone gotowym
+    werdyktem nie są mierzone - pomiar kosztowałby więcej niż one same.
+    """
+
+    OVERHEAD_BUCKETS_NS = (100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000, 100_000_000)
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.validations = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.violations: Dict[str, int] = {}
+        self.overhead_buckets = [0] * (len(self.OVERHEAD_BUCKETS_NS) + 1)
+        self.overhead_sum_ns = 0
+        self.overhead_count = 0
+
+    def observe_validation(self, violations: List[QualityViolation]):
+        self.validations += 1
+        for violation in violations:
+            self.violations[violation.rule_name] = self.violations.get(violation.rule_name, 0) + 1
+
+    def observe_overhead(self, elapsed_ns: int):
+        self.overhead_buckets[bisect.bisect_left(self.OVERHEAD_BUCKETS_NS, elapsed_ns)] += 1
+        self.overhead_sum_ns += elapsed_ns
+        self.overhead_count += 1
+
+    def render(self) -> str:
+        """Zwraca metryki w formacie tekstowym Prometheusa (0.0.4)"""
+        lines = [
+            "# HELP quality_guard_validations_total Functions validated by QualityGuardValidator.",
+            "# TYPE quality_guard_validations_total counter",
+            f"quality_guard_validations_total {self.validations}",
+            "# HELP quality_guard_verdict_cache_requests_total Verdict cache lookups by result.",
+            "# TYPE quality_guard_verdict_cache_requests_total counter",
+            f'quality_guard_verdict_cache_requests_total{{result="hit"}} {self.cache_hits}',
+            f'quality_guard_verdict_cache_requests_total{{result="miss"}} {self.cache_misses}',
+            "# HELP quality_guard_violations_total Violations found by rule.",
+            "# TYPE quality_guard_violations_total counter",
+        ]
+        for rule, count in sorted(self.violations.items()):
+            lines.append(f'quality_guard_violations_total{{rule="{rule}"}} {count}')
+
+        lines += [
+            "# HELP quality_guard_wrapper_overhead_ns Time spent in decorator gates before the wrapped call.",
+            "# TYPE quality_guard_wrapper_overhead_ns histogram",
+        ]
+        cumulative = 0
+        for bound, count in zip(self.OVERHEAD_BUCKETS_NS + ("+Inf",), self.overhead_buckets):
+            cumulative += count
+            lines.append(f'quality_guard_wrapper_overhead_ns_bucket{{le="{bound}"}} {cumulative}')
+        lines.append(f"quality_guard_wrapper_overhead_ns_sum {self.overhead_sum_ns}")
+        lines.append(f"quality_guard_wrapper_overhead_ns_count {self.overhead_count}")
+        return "\n".join(lines) + "\n"
+
+
+enforcement_metrics = EnforcementMetrics()
+
+
+def prometheus_metrics() -> str:
+    """Metryki Quality Guard w formacie tekstowym Prometheusa"""
+    return enforcement_metrics.render()
+
+
+def dump_prometheus_metrics(path: Union[str, Path]):
+    """Zapisuje metryki atomowo (node-exporter nie zobaczy połowy pliku)"""
+    path = Path(path)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(prometheus_metrics())
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+def start_metrics_dump(path: Union[str, Path], interval: float = 15.0) -> threading.Event:
+    """Zapisuje metryki co interval sekund i przy wyjściu; zwraca Event zatrzymujący wątek"""
+    stop = threading.Event()
+
+    def run():
+        while not stop.wait(interval):
+            dump_prometheus_metrics(path)
+
+    threading.Thread(target=run, name="quality-guard-metrics", daemon=True).start()
+    atexit.register(dump_prometheus_metrics, path)
+    return stop
+
+
+if os.environ.get("QG_METRICS_FILE"):
+    start_metrics_dump(os.environ["QG_METRICS_FILE"], float(os.environ.get("QG_METRICS_INTERVAL", "15")))
+
+
+# SZABLONY komunikatów - renderowane dopiero przy odczycie naruszenia
+
+MISSING_TEST_MESSAGE = "Funkcja '{func_name}' nie ma testów jednostkowych"
+MISSING_TEST_SUGGESTION = (
+    "Stwórz test w tests/test_{file_stem}.py:\n\n"
+    "def test_{func_name}():\n"
+    "    # Arrange\n"
+    "    # Act\n"
+    "    result = {func_name}()\n"
+    "    # Assert\n"
+    "    assert result is not None"
+)
+MISSING_DOCSTRING_MESSAGE = "Funkcja '{func_name}' nie ma odpowiedniej dokumentacji"
+MISSING_DOCSTRING_SUGGESTION = (
+    "Dodaj docstring:\n\n"
+    'def {func_name}(...):\n'
+    '    """\n'
+    '    Krótki opis funkcji.\n\n'
+    '    Args:\n'
+    '        param1: Opis parametru\n\n'
+    '    Returns:\n'
+    '        Opis zwracanej wartości\n'
+    '    """\n'
+    '    # kod funkcji'
+)
+FUNCTION_TOO_LONG_MESSAGE = "Funkcja '{func_name}' ma {actual_lines} linii kodu (maksimum: {max_lines})"
+HIGH_COMPLEXITY_MESSAGE = "Funkcja '{func_name}' ma kompleksność {actual_complexity} (maksimum: {max_complexity})"
+UNAUTHORIZED_FUNCTION_MESSAGE = "Funkcja '{func_name}' nie jest udokumentowana w architekturze projektu"
+
+
+class ValidationResult(tuple):
+    """Niemodyfikowalny wynik walidacji - krotka naruszeń"""
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return f"ValidationResult({list(self)!r})"
+
 
 class QualityGuardValidator:
     """Główny walidator Quality Guard"""
 
     def __init__(self, config: QualityConfig = None):
-        self.config = config or QualityConfig()
-        self.violations = []
+        self.config = config or QualityConfig.shared()
 
-    def validate_function(self, func: Callable, file_path: str = None, line_number: int = None) -> List[
-        QualityViolation]:
-        """Waliduje funkcję pod kątem standardów jakości"""
-        self.violations = []
+    def validate_function(self, func: Callable, file_path: str = None,
+                          line_number: int = None) -> "ValidationResult":
+        """Waliduje funkcję pod kątem standardów jakości.
 
+        Walidator nie ma stanu zmiennego - każde wywołanie zwraca nowy,
+        niemodyfikowalny wynik, więc jedną instancję można dzielić między wątkami.
+        """
         # Pobierz informacje o funkcji
         func_name = func.__name__
+        source = get_function_source(func)
         file_path = file_path or inspect.getfile(func)
-        line_number = line_number or inspect.getsourcelines(func)[1]
+        line_number = line_number or (source.first_line if source else inspect.getsourcelines(func)[1])
+
+        return self._run_checks(func_name, func.__doc__, source, file_path, line_number)
+
+    def validate_code(self, code: CodeType) -> "ValidationResult":
+        """Waliduje funkcję znając tylko jej obiekt kodu (np. z sys.monitoring)"""
+        module = source_cache.module(code.co_filename)
+        source = module.function_source(code.co_firstlineno, code.co_name) if module else None
+        if source is None:
+            return ValidationResult()
+
+        docstring = ast.get_docstring(source.node, clean=False)
+        return self._run_checks(code.co_name, docstring, source, code.co_filename, source.first_line)
+
+    def validate_module(self, module_or_path: Any) -> "ModuleVerdicts":
+        """Waliduje wszystkie funkcje modułu (także metody i zagnieżdżone) jednym parsowaniem"""
+        if isinstance(module_or_path, (str, os.PathLike)):
+            file_path = os.fspath(module_or_path)
+        else:
+            file_path = getattr(module_or_path, '__file__', None)
+
+        module = source_cache.module(file_path) if file_path else None
+        if module is None:
+            return ModuleVerdicts(file_path, None, {}, {})
+
+        table = {}
+        first_lines = {}
+        for qualname, node in _iter_qualified_functions(module.tree):
+            first_line = min([node.lineno] + [d.lineno for d in node.decorator_list])
+            source = module.function_source(first_line, node.name)
+            table[qualname] = self._run_checks(node.name, ast.get_docstring(node, clean=False), source,
+                                               file_path, first_line)
+            first_lines[qualname] = first_line
+
+        return ModuleVerdicts(file_path, module.stamp, table, first_lines)
+
+    def _run_checks(self, func_name: str, docstring: Optional[str], source: Optional[FunctionSource],
+                    file_path: str, line_number: int) -> "ValidationResult":
+        """Uruchamia wszystkie reguły dla jednej funkcji"""
+        violations = []
+        run = check_timings.timed(f"{file_path}:{func_name}") if check_timings.enabled else _untimed
 
         # Sprawdź testy
         if self.config.get("require_tests"):
-            self._check_tests(func_name, file_path, line_number)
+            violations.append(run("tests", self._check_tests, func_name, file_path, line_number))
 
         # Sprawdź dokumentację
         if self.config.get("require_docstrings"):
-            self._check_documentation(func, func_name, file_path, line_number)
+            violations.append(run("documentation", self._check_documentation,
+                                  docstring, func_name, file_path, line_number))
 
         # Sprawdź długość funkcji
-        self._check_function_length(func, func_name, file_path, line_number)
+        violations.append(run("function_length", self._check_function_length,
+                              source, func_name, file_path, line_number))
 
         # Sprawdź kompleksność
-        self._check_complexity(func, func_name, file_path, line_number)
+        violations.append(run("complexity", self._check_complexity, source, func_name, file_path, line_number))
 
         # Sprawdź autoryzację w dokumentacji architektury
         if self.config.get("require_architecture_docs"):
-            self._check_architecture_authorization(func_name, file_path, line_number)
+            violations.append(run("architecture", self._check_architecture_authorization,
+                                  func_name, file_path, line_number))
 
-        return self.violations
+        result = ValidationResult(v for v in violations if v is not None)
+        enforcement_metrics.observe_validation(result)
+        return result
 
-    def _check_tests(self, func_name: str, file_path: str, line_number: int):
+    def _check_tests(self, func_name: str, file_path: str, line_number: int) -> Optional[QualityViolation]:
         """Sprawdza czy funkcja ma testy"""
         test_patterns = self.config.get("test_patterns", [])
 
-        # Szukaj plików testów
-        for pattern in test_patterns:
-            if self._find_test_for_function(func_name, pattern, file_path):
-                return  # Test znaleziony
+        if get_test_index(test_patterns).has_test_for(func_name):
+            return None  # Test znaleziony
 
         # Brak testów
-        self.violations.append(QualityViolation(
+        return QualityViolation(
             rule_name="missing_test",
-            message=f"Funkcja '{func_name}' nie ma testów jednostkowych",
-            suggestion=f"Stwórz test w tests/test_{Path(file_path).stem}.py:\n\n"
-                       f"def test_{func_name}():\n"
-                       f"    # Arrange\n"
-                       f"    # Act\n"
-                       f"    result = {func_name}()\n"
-                       f"    # Assert\n"
-                       f"    assert result is not None",
+            message=MISSING_TEST_MESSAGE,
+            suggestion=MISSING_TEST_SUGGESTION,
             level=QualityLevel.ERROR,
             file_path=file_path,
             line_number=line_number,
-            function_name=func_name
-        ))
-
-    def _find_test_for_function(self, func_name: str, pattern: str, file_path: str) -> bool:
-        """Szuka testów dla konkretnej funkcji"""
-        import glob
-
-        # Zastąp * w pattern
-        if "*" in pattern:
-            test_files = glob.glob(pattern)
-        else:
-            test_files = [pattern] if os.path.exists(pattern) else []
-
-        for test_file in test_files:
-            if os.path.exists(test_file):
-                try:
-                    with open(test_file, 'r') as f:
-                        content = f.read()
-                        # Szukaj test_function_name
-                        if f"test_{func_name}" in content or f"test{func_name.title()}" in content:
-                            return True
-                except:
-                    continue
-
-        return False
+            function_name=func_name,
+            params={"func_name": func_name,
+                    "file_stem": os.path.splitext(os.path.basename(file_path))[0]}
+        )
 
-    def _check_documentation(self, func: Callable, func_name: str, file_path: str, line_number: int):
+    def _check_documentation(self, docstring: Optional[str], func_name: str, file_path: str, line_number: int) -> Optional[QualityViolation]:
         """Sprawdza dokumentację funkcji"""
-        if not func.__doc__ or len(func.__doc__.strip()) < 10:
-            self.violations.append(QualityViolation(
+        if not docstring or len(docstring.strip()) < 10:
+            return QualityViolation(
                 rule_name="missing_docstring",
-                message=f"Funkcja '{func_name}' nie ma odpowiedniej dokumentacji",
-                suggestion=f"Dodaj docstring:\n\n"
-                           f'def {func_name}(...):\n'
-                           f'    """\n'
-                           f'    Krótki opis funkcji.\n\n'
-                           f'    Args:\n'
-                           f'        param1: Opis parametru\n\n'
-                           f'    Returns:\n'
-                           f'        Opis zwracanej wartości\n'
-                           f'    """\n'
-                           f'    # kod funkcji',
+                message=MISSING_DOCSTRING_MESSAGE,
+                suggestion=MISSING_DOCSTRING_SUGGESTION,
                 level=QualityLevel.ERROR,
                 file_path=file_path,
                 line_number=line_number,
-                function_name=func_name
-            ))
+                function_name=func_name,
+                params={"func_name": func_name}
+            )
+        return None
 
-    def _check_function_length(self, func: Callable, func_name: str, file_path: str, line_number: int):
+    def _check_function_length(self, source: Optional[FunctionSource], func_name: str, file_path: str,
+                               line_number: int) -> Optional[QualityViolation]:
         """Sprawdza długość funkcji"""
         try:
-            source_lines = inspect.getsourcelines(func)[0]
-            actual_lines = len([line for line in source_lines if line.strip() and not line.strip().startswith('#')])
+            actual_lines = source.metrics.logical_lines
             max_lines = self.config.get("max_function_lines", 50)
 
             if actual_lines > max_lines:
-                self.violations.append(QualityViolation(
+                context = {"actual_lines": actual_lines, "max_lines": max_lines}
+                return QualityViolation(
                     rule_name="function_too_long",
-                    message=f"Funkcja '{func_name}' ma {actual_lines} linii kodu (maksimum: {max_lines})",
+                    message=FUNCTION_TOO_LONG_MESSAGE,
                     suggestion="Podziel funkcję na mniejsze funkcje pomocnicze",
                     level=QualityLevel.ERROR,
                     file_path=file_path,
                     line_number=line_number,
                     function_name=func_name,
-                    context={"actual_lines": actual_lines, "max_lines": max_lines}
-                ))
+                    context=context,
+                    params=dict(context, func_name=func_name)
+                )
         except:
             pass  # Nie można określić długości
+        return None
 
-    def _check_complexity(self, func: Callable, func_name: str, file_path: str, line_number: int):
+    def _check_complexity(self, source: Optional[FunctionSource], func_name: str, file_path: str,
+                          line_number: int) -> Optional[QualityViolation]:
         """Sprawdza kompleksność funkcji"""
         try:
-            source = inspect.getsource(func)
-            tree = ast.parse(source)
-            complexity = self._calculate_complexity(tree)
+            complexity = source.metrics.complexity
             max_complexity = self.config.get("max_complexity", 10)
 
             if complexity > max_complexity:
-                self.violations.append(QualityViolation(
+                context = {"actual_complexity": complexity, "max_complexity": max_complexity}
+                return QualityViolation(
                     rule_name="high_complexity",
-                    message=f"Funkcja '{func_name}' ma kompleksność {complexity} (maksimum: {max_complexity})",
+                    message=HIGH_COMPLEXITY_MESSAGE,
                     suggestion="Uprość logikę lub podziel na mniejsze funkcje",
                     level=QualityLevel.ERROR,
                     file_path=file_path,
                     line_number=line_number,
                     function_name=func_name,
-                    context={"actual_complexity": complexity, "max_complexity": max_complexity}
-                ))
+                    context=context,
+                    params=dict(context, func_name=func_name)
+                )
         except:
             pass  # Nie można obliczyć kompleksności
+        return None
 
-    def _calculate_complexity(self, tree: ast.AST) -> int:
-        """Oblicza kompleksność cyklomatyczną"""
-        complexity = 1
-        for node in ast.walk(tree):
-            if isinstance(node, (ast.If, ast.While, ast.For, ast.AsyncFor, ast.ExceptHandler)):
-                complexity += 1
-            elif isinstance(node, ast.BoolOp):
-                complexity += len(node.values) - 1
-        return complexity
-
-    def _check_architecture_authorization(self, func_name: str, file_path: str, line_number: int):
+    def _check_architecture_authorization(self, func_name: str, file_path: str, line_number: int) -> Optional[QualityViolation]:
         """Sprawdza czy funkcja jest udokumentowana w architekturze"""
         doc_files = self.config.get("doc_files", [])
 
-        for doc_file in doc_files:
-            if os.path.exists(doc_file):
-                try:
-                    with open(doc_file, 'r') as f:
-                        content = f.read()
-                        if func_name in content:
-                            return  # Funkcja znaleziona w dokumentacji
-                except:
-                    continue
+        if get_doc_index(doc_files).is_documented(func_name):
+            return None  # Funkcja znaleziona w dokumentacji
 
-        self.violations.append(QualityViolation(
+        return QualityViolation(
             rule_name="unauthorized_function",
-            message=f"Funkcja '{func_name}' nie jest udokumentowana w architekturze projektu",
-            suggestion=f"Dodaj opis funkcji do README.md lub docs/API.md",
+            message=UNAUTHORIZED_FUNCTION_MESSAGE,
+            suggestion="Dodaj opis funkcji do README.md lub docs/API.md",
             level=QualityLevel.WARNING,
             file_path=file_path,
             line_number=line_number,
-            function_name=func_name
-        ))
+            function_name=func_name,
+            params={"func_name": func_name}
+        )
+
+
+# CACHE WERDYKTÓW dla dekoratorów
+
+class Verdict:
+    """Zapamiętany wynik walidacji funkcji"""
+    __slots__ = ("stamp", "violations", "error")
+
+    def __init__(self, stamp: Optional[tuple], violations: List[QualityViolation],
+                 error: Optional[QualityGuardException]):
+        self.stamp = stamp
+        self.violations = violations
+        self.error = error
+
+
+class VerdictCache:
+    """Procesowy cache werdyktów kluczowany obiektem __code__ funkcji.
+
+    Każdy wpis pamięta (mtime_ns, size) pliku źródłowego z chwili walidacji.
+    Szybka ścieżka (get) to jedno wyszukanie w słowniku bez dostępu do dysku;
+    nieaktualne wpisy usuwa refresh().
+    """
+
+    def __init__(self):
+        self._entries: Dict[Any, Verdict] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key_for(func: Callable) -> Any:
+        """Klucz cache: obiekt kodu funkcji (lub sam obiekt dla klas i callable)"""
+        return getattr(func, "__code__", func)
+
+    def get(self, key: Any) -> Optional[Verdict]:
+        return self._entries.get(key)
+
+    def store(self, key: Any, verdict: Verdict):
+        with self._lock:
+            self._entries[key] = verdict
+
+    def verdict_for(self, func: Callable) -> Verdict:
+        """Zwraca werdykt z cache lub waliduje funkcję i zapamiętuje wynik"""
+        key = self.key_for(func)
+        verdict = self._entries.get(key)
+        if verdict is not None:
+            enforcement_metrics.cache_hits += 1
+            return verdict
+
+        enforcement_metrics.cache_misses += 1
+        verdict = validate_verdict(func)
+        with self._lock:
+            return self._entries.setdefault(key, verdict)
+
+    def refresh(self) -> int:
+        """Usuwa wpisy, których plik źródłowy zmienił się od walidacji"""
+        with self._lock:
+            stale = [
+                key for key, verdict in self._entries.items()
+                if verdict.stamp != _source_stamp(_key_file(key))
+            ]
+            for key in stale:
+                del self._entries[key]
+        return len(stale)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def validate_verdict(func: Callable) -> Verdict:
+    """Waliduje funkcję i buduje werdykt z gotowym wyjątkiem (bez cache)"""
+    stamp = _source_stamp(inspect.getfile(func))
+    if isinstance(func, CodeType):
+        violations = QualityGuardValidator().validate_code(func)
+    else:
+        violations = QualityGuardValidator().validate_function(func)
+    return Verdict(stamp, violations, _critical_error(violations))
+
+
+def _key_file(key: Any) -> Optional[str]:
+    """Plik źródłowy dla klucza cache (obiekt kodu, klasa lub callable)"""
+    file_path = getattr(key, "co_filename", None)
+    if file_path is None:
+        try:
+            file_path = inspect.getfile(key)
+        except (TypeError, OSError):
+            return None
+    return file_path
+
+
+verdict_cache = VerdictCache()
+
+
+# WALIDACJA CAŁYCH MODUŁÓW
+
+def _iter_qualified_functions(tree: ast.AST):
+    """Zwraca (qualname, węzeł) dla funkcji, metod i funkcji zagnieżdżonych"""
+    stack = [(node, "") for node in reversed(tree.body)]
+    while stack:
+        node, prefix = stack.pop()
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            qualname = prefix + node.name
+            yield qualname, node
+            child_prefix = qualname + ".<locals>."
+        elif isinstance(node, ast.ClassDef):
+            child_prefix = prefix + node.name + "."
+        else:
+            child_prefix = prefix
+        stack.extend((child, child_prefix) for child in reversed(list(ast.iter_child_nodes(node))))
+
+
+def _critical_error(violations: List[QualityViolation]) -> Optional[QualityGuardException]:
+    critical_violations = [v for v in violations if v.level in [QualityLevel.ERROR, QualityLevel.CRITICAL]]
+    return QualityGuardException(critical_violations) if critical_violations else None
+
+
+def _violation_to_json(violation: QualityViolation) -> Dict[str, Any]:
+    # Zapisywane są szablony i parametry, nie wyrenderowane teksty
+    return {
+        "rule_name": violation.rule_name, "message": violation._message, "suggestion": violation._suggestion,
+        "level": violation.level.value, "file_path": violation.file_path, "line_number": violation.line_number,
+        "function_name": violation.function_name, "context": violation.context, "params": violation.params,
+    }
+
+
+def _violation_from_json(data: Dict[str, Any]) -> QualityViolation:
+    return QualityViolation(**dict(data, level=QualityLevel(data["level"])))
+
+
+class ModuleVerdicts:
+    """Tabela werdyktów modułu: qualname -> lista naruszeń"""
+
+    def __init__(self, file_path: Optional[str], stamp: Optional[tuple],
+                 violations: Dict[str, List[QualityViolation]], first_lines: Dict[str, int]):
+        self.file_path = file_path
+        self.stamp = stamp
+        self.violations = violations
+        self.first_lines = first_lines
+        self._by_first_line = {line: qualname for qualname, line in first_lines.items()}
+
+    def __getitem__(self, qualname: str) -> List[QualityViolation]:
+        return self.violations[qualname]
+
+    def __contains__(self, qualname: str) -> bool:
+        return qualname in self.violations
+
+    def __len__(self) -> int:
+        return len(self.violations)
+
+    def items(self):
+        return self.violations.items()
+
+    def verdict(self, qualname: str) -> Verdict:
+        violations = self.violations[qualname]
+        return Verdict(self.stamp, violations, _critical_error(violations))
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "violations": {qualname: [_violation_to_json(v) for v in violations]
+                           for qualname, violations in self.violations.items()},
+            "first_lines": self.first_lines,
+        }
+
+    @classmethod
+    def from_json(cls, file_path: str, data: Dict[str, Any]) -> "ModuleVerdicts":
+        violations = {qualname: ValidationResult(_violation_from_json(v) for v in found)
+                      for qualname, found in data["violations"].items()}
+        return cls(file_path, _source_stamp(file_path), violations, dict(data["first_lines"]))
+
+    def prime(self, functions) -> int:
+        """Zapisuje werdykty funkcji z tej tabeli w verdict_cache"""
+        primed = 0
+        for func in functions:
+            code = getattr(func, "__code__", None)
+            if code is None or self.file_path is None:
+                continue
+            if os.path.abspath(code.co_filename) != os.path.abspath(self.file_path):
+                continue
+            qualname = self._by_first_line.get(code.co_firstlineno)
+            if qualname is None or qualname.rsplit(".", 1)[-1] != code.co_name:
+                continue
+            verdict_cache.store(code, self.verdict(qualname))
+            primed += 1
+        return primed
+
+
+def validate_module(module_or_path: Any, config: QualityConfig = None) -> ModuleVerdicts:
+    """Waliduje moduł (obiekt lub ścieżkę) jednym parsowaniem"""
+    return QualityGuardValidator(config).validate_module(module_or_path)
+
+
+def _module_functions(module) -> List[Callable]:
+    """Funkcje i metody zdefiniowane w module"""
+    module_name = getattr(module, '__name__', None)
+    functions = []
+    for value in list(vars(module).values()):
+        if getattr(value, '__module__', None) != module_name:
+            continue
+        if inspect.isclass(value):
+            for member in vars(value).values():
+                member = getattr(member, '__func__', member)
+                if inspect.isfunction(member):
+                    functions.append(member)
+        elif inspect.isfunction(value):
+            functions.append(value)
+    return functions
+
+
+def _module_verdicts(module) -> ModuleVerdicts:
+    """Werdykty modułu z prewalidacji w tle albo z walidacji na miejscu"""
+    verdicts = prevalidated_verdicts(getattr(module, '__file__', None))
+    return verdicts if verdicts is not None else validate_module(module)
+
+
+def prime_module_verdicts(module, verdicts: Optional[ModuleVerdicts] = None) -> ModuleVerdicts:
+    """Waliduje moduł raz (lub bierze gotowe werdykty) i zapisuje je w verdict_cache"""
+    if verdicts is None:
+        verdicts = _module_verdicts(module)
+    verdicts.prime(_module_functions(module))
+    return verdicts
+
+
+def _json_default(value: Any) -> Any:
+    return dict(value) if isinstance(value, MappingProxyType) else str(value)
+
+
+def rules_fingerprint(config: QualityConfig = None) -> str:
+    """Skrót wszystkiego od czego zależą werdykty: konfiguracji i indeksów testów/dokumentacji"""
+    config = config or QualityConfig.shared()
+    parts = [json.dumps(config.config, sort_keys=True, default=_json_default)]
+    if config.get("require_tests"):
+        parts.append(get_test_index(config.get("test_patterns", [])).fingerprint())
+    if config.get("require_architecture_docs"):
+        parts.append(get_doc_index(config.get("doc_files", [])).fingerprint())
+    return hashlib.sha1("\0".join(parts).encode()).hexdigest()
+
+
+def verdicts_cache_path(source_path: str) -> Optional[str]:
+    """Plik werdyktów obok pliku .pyc (__pycache__/mod.cpython-XY.qg.json)"""
+    try:
+        pyc_path = importlib.util.cache_from_source(source_path)
+    except (NotImplementedError, ValueError):
+        return None
+    return os.path.splitext(pyc_path)[0] + ".qg.json"
+
+
+def _load_or_validate(file_path: str) -> ModuleVerdicts:
+    """Werdykty pliku .py z pliku obok .pyc albo z walidacji (z zapisem)"""
+    cache_path = verdicts_cache_path(file_path)
+    if cache_path is None:
+        return validate_module(file_path)
+
+    try:
+        with open(file_path, 'rb') as f:
+            source_hash = importlib.util.source_hash(f.read()).hex()
+    except OSError:
+        return validate_module(file_path)
+    config_hash = rules_fingerprint()
+
+    try:
+        with open(cache_path, 'r') as f:
+            data = json.load(f)
+        if data.get("source_hash") == source_hash and data.get("config_hash") == config_hash:
+            return ModuleVerdicts.from_json(file_path, data)
+    except (OSError, ValueError, KeyError, TypeError):
+        pass  # Brak lub uszkodzony plik - walidacja od nowa
+
+    verdicts = validate_module(file_path)
+    if not sys.dont_write_bytecode:
+        _write_json_atomic(Path(cache_path),
+                           dict(verdicts.to_json(), source_hash=source_hash, config_hash=config_hash))
+    return verdicts
+
+
+def cached_module_verdicts(module) -> ModuleVerdicts:
+    """Werdykty modułu z prewalidacji, z pliku obok .pyc albo z walidacji (i zapis dla kolejnych startów).
+
+    Klucz to hash źródła (importlib.util.source_hash) i rules_fingerprint(),
+    więc niezmieniony moduł nie jest ani parsowany, ani walidowany.
+    """
+    file_path = getattr(module, '__file__', None)
+    if not file_path or not file_path.endswith(".py"):
+        return validate_module(module)
+    verdicts = prevalidated_verdicts(file_path)
+    return verdicts if verdicts is not None else _load_or_validate(file_path)
+
+
+# PREWALIDACJA W TLE - pliki projektu walidowane w puli procesów od instalacji hooka
+
+def _prevalidate_file(file_path: str, persist: bool) -> Optional[tuple]:
+    """Waliduje jeden plik w procesie roboczym; zwraca (stamp, rules_fingerprint, werdykty w JSON)"""
+    try:
+        verdicts = _load_or_validate(file_path) if persist else validate_module(file_path)
+        return verdicts.stamp, rules_fingerprint(), verdicts.to_json()
+    except Exception:
+        return None  # Loader zwaliduje plik sam
+
+
+# Pula prewalidacji startuje przez fork tam, gdzie jest dostępny: przy spawn/forkserver
+# (Windows, domyślnie macOS, Linux od Pythona 3.14) każdy proces roboczy importuje od nowa
+# __main__ użytkownika, a z nim instalację hooka. Bez forka (Windows) zostaje metoda domyślna,
+# a Prevalidator.start() w procesie roboczym nie uruchamia kolejnej puli.
+_PREVALIDATION_CONTEXT = (multiprocessing.get_context("fork")
+                          if "fork" in multiprocessing.get_all_start_methods() else None)
+
+
+class Prevalidator:
+    """Wspólna tabela werdyktów plików projektu wypełniana przez pulę procesów.
+
+    Wątek w tle przegląda katalogi projektu i wysyła pliki do puli (najwyżej
+    2 * workers naraz, więc zamknięcie interpretera nie czeka na cały projekt).
+    Loader czeka tylko na werdykt importowanego modułu; pliku jeszcze nie
+    wysłanego do puli nie czeka - zaznacza go i waliduje na miejscu.
+    """
+
+    def __init__(self, roots: List[Union[str, Path]], workers: Optional[int] = None, persist: bool = False,
+                 classifier: Optional["PathClassifier"] = None, timeout: Optional[float] = 30.0):
+        self.roots = [os.path.abspath(root) for root in roots]
+        self.workers = workers or os.cpu_count() or 1
+        self.persist = persist
+        self.timeout = timeout
+        self.classifier = classifier or get_path_classifier()
+        self._futures: Dict[str, Future] = {}
+        self._claimed: Set[str] = set()
+        self._lock = threading.Lock()
+        self._slots = threading.Semaphore(self.workers * 2)
+        self._stopped = threading.Event()
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @classmethod
+    def from_config(cls, config: QualityConfig = None, persist: bool = False,
+                    workers: Optional[int] = None) -> "Prevalidator":
+        """Katalogi jak w PathClassifier.from_config, liczba procesów i limit czasu z prevalidation"""
+        config = config or QualityConfig.shared()
+        root = config_registry.path.parent
+        settings = config.get("prevalidation") or {}
+        workers = workers or settings.get("workers")
+        return cls([root] + [root / extra for extra in config.get("project_roots", [])],
+                   workers=workers, persist=persist, timeout=settings.get("timeout", 30.0))
+
+    def start(self) -> "Prevalidator":
+        if multiprocessing.current_process().name != "MainProcess":
+            self._stopped.set()  # Proces potomny (np. import __main__ przy spawn) - loadery walidują same
+            return self
+        self._pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=_PREVALIDATION_CONTEXT)
+        try:
+            # Procesy robocze powstają przy submit() - tworzymy wszystkie tu, zanim ruszy
+            # wątek podający pliki (fork() z wątku pobocznego grozi zakleszczeniem)
+            for _ in range(self.workers):
+                self._pool.submit(os.getpid)
+        except (OSError, RuntimeError):
+            self._stopped.set()  # Brak procesów (np. sandbox) - loadery walidują same
+            return self
+        self._thread = threading.Thread(target=self._feed, name="quality-guard-prevalidation", daemon=True)
+        self._thread.start()
+        return self
+
+    def iter_source_files(self):
+        """Pliki .py kodu użytkownika (bez katalogów ukrytych, __pycache__ i bibliotek)"""
+        seen = set()
+        for root in self.roots:
+            for dir_path, dir_names, file_names in os.walk(root):
+                dir_names[:] = sorted(
+                    name for name in dir_names
+                    if not name.startswith(('.', '__pycache__')) and name not in LIBRARY_DIR_NAMES
+                    and self.classifier.is_user_path(os.path.join(dir_path, name))
+                )
+                for name in sorted(file_names):
+                    if not name.endswith(".py") or name[:-3] in _QUALITY_GUARD_MODULES:
+                        continue
+                    file_path = os.path.join(dir_path, name)
+                    if file_path not in seen:
+                        seen.add(file_path)
+                        yield file_path
+
+    def _feed(self):
+        try:
+            for file_path in self.iter_source_files():
+                self._slots.acquire()
+                if self._stopped.is_set():
+                    return
+                with self._lock:
+                    claimed = file_path in self._claimed
+                if claimed:
+                    self._slots.release()
+                    continue
+                # submit() może importować moduły przez hook - nie pod blokadą
+                future = self._pool.submit(_prevalidate_file, file_path, self.persist)
+                with self._lock:
+                    self._futures[file_path] = future
+                future.add_done_callback(lambda _: self._slots.release())
+        except (OSError, RuntimeError):
+            self._stopped.set()  # Brak procesów (np. sandbox) lub zamknięta pula - loadery walidują same
+
+    def verdicts_for(self, file_path: str, timeout: Optional[float] = None) -> Optional[ModuleVerdicts]:
+        """Werdykty pliku z puli (czeka tylko na ten plik) lub None gdy loader ma walidować sam
+
+        Domyślnie czeka najwyżej self.timeout sekund - zawieszony proces roboczy
+        nie blokuje importu.
+        """
+        file_path = os.path.abspath(file_path)
+        with self._lock:
+            future = self._futures.get(file_path)
+            if future is None:
+                self._claimed.add(file_path)
+                return None
+        if future.cancel():
+            return None  # Jeszcze w kolejce - szybciej zwalidować na miejscu
+        try:
+            result = future.result(self.timeout if timeout is None else timeout)
+        except Exception:
+            return None  # Przekroczony czas, zepsuta pula
+        if result is None or result[0] != _source_stamp(file_path) or result[1] != rules_fingerprint():
+            return None  # Plik lub reguły (np. po config_registry.reload()) zmieniły się po prewalidacji
+        return ModuleVerdicts.from_json(file_path, result[2])
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Czeka aż wszystkie pliki projektu zostaną zwalidowane"""
+        if self._thread is not None:
+            self._thread.join(timeout)
+        with self._lock:
+            futures = list(self._futures.values())
+        return not futures_wait(futures, timeout).not_done
+
+    def stop(self):
+        self._stopped.set()
+        self._slots.release()  # Odblokowuje wątek czekający na miejsce w puli
+        if self._pool is not None:
+            # Ręcznie zamiast shutdown(cancel_futures=True), które jest dopiero od Pythona 3.9;
+            # czeka tylko na pliki w trakcie walidacji (najwyżej 2 * workers)
+            with self._lock:
+                futures = list(self._futures.values())
+            for future in futures:
+                future.cancel()
+            self._pool.shutdown(wait=True)
+
+    def __len__(self) -> int:
+        return len(self._futures)
+
+
+_prevalidator: Optional[Prevalidator] = None
+
+
+def start_prevalidation(workers: Optional[int] = None, persist: bool = False) -> Prevalidator:
+    """Uruchamia (ponownie) prewalidację projektu w tle"""
+    global _prevalidator
+    stop_prevalidation()
+    _prevalidator = Prevalidator.from_config(persist=persist, workers=workers).start()
+    return _prevalidator
+
+
+def get_prevalidator() -> Optional[Prevalidator]:
+    """Trwająca prewalidacja (None gdy nie została uruchomiona)"""
+    return _prevalidator
+
+
+def stop_prevalidation():
+    global _prevalidator
+    if _prevalidator is not None:
+        _prevalidator.stop()
+        _prevalidator = None
+
+
+def prevalidated_verdicts(file_path: Optional[str]) -> Optional[ModuleVerdicts]:
+    """Werdykty pliku z trwającej prewalidacji (None gdy jej nie ma)"""
+    prevalidator = _prevalidator
+    if prevalidator is None or not file_path:
+        return None
+    return prevalidator.verdicts_for(file_path)
+
+
+# PRÓBKOWANIE walidacji dla gorących funkcji
+
+_PROCESS_START = time.monotonic()
+
+
+class SamplingStats:
+    """Liczniki próbkowania jednej funkcji (bez blokad, wartości przybliżone)"""
+    __slots__ = ("name", "calls", "sampled", "last_sampled")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.calls = 0
+        self.sampled = 0
+        self.last_sampled = float("-inf")
+
+
+class SamplingPolicy:
+    """Polityka próbkowania walidacji w trybie per_call.
+
+    Wywołanie jest walidowane gdy spełnia wszystkie ustawione warunki:
+    co every_n-te wywołanie, nie częściej niż raz na min_interval sekund
+    i tylko w pierwszych warmup_seconds sekundach od startu procesu.
+    """
+
+    def __init__(self, every_n: int = 1, min_interval: float = 0, warmup_seconds: Optional[float] = None):
+        self.every_n = max(int(every_n or 1), 1)
+        self.min_interval = float(min_interval or 0)
+        self.warmup_seconds = warmup_seconds
+
+    @classmethod
+    def from_config(cls, sampling: Optional[Dict[str, Any]]) -> "SamplingPolicy":
+        sampling = sampling or {}
+        return cls(
+            every_n=sampling.get("every_n", 1),
+            min_interval=sampling.get("min_interval", 0),
+            warmup_seconds=sampling.get("warmup_seconds"),
+        )
+
+    @property
+    def samples_everything(self) -> bool:
+        return self.every_n == 1 and not self.min_interval and self.warmup_seconds is None
+
+    def should_sample(self, stats: SamplingStats) -> bool:
+        """Rejestruje wywołanie i decyduje czy je walidować"""
+        call_index = stats.calls
+        stats.calls = call_index + 1
+
+        if call_index % self.every_n:
+            return False
+
+        if self.warmup_seconds is not None or self.min_interval:
+            now = time.monotonic()
+            if self.warmup_seconds is not None and now - _PROCESS_START > self.warmup_seconds:
+                return False
+            if now - stats.last_sampled < self.min_interval:
+                return False
+            stats.last_sampled = now
+
+        stats.sampled += 1
+        return True
+
+
+_sampling_stats: Dict[Any, SamplingStats] = {}
+
+
+def _sampling_stats_for(func: Callable) -> SamplingStats:
+    key = VerdictCache.key_for(func)
+    stats = _sampling_stats.get(key)
+    if stats is None:
+        name = f"{getattr(func, '__module__', '?')}.{getattr(func, '__qualname__', repr(func))}"
+        stats = _sampling_stats.setdefault(key, SamplingStats(name))
+    return stats
+
+
+def sampling_summary() -> Dict[str, Dict[str, int]]:
+    """Podsumowanie próbkowania: wywołania walidowane i pominięte per funkcja"""
+    summary = {}
+    for stats in list(_sampling_stats.values()):
+        entry = summary.setdefault(stats.name, {"calls": 0, "sampled": 0, "skipped": 0})
+        entry["calls"] += stats.calls
+        entry["sampled"] += stats.sampled
+        entry["skipped"] += stats.calls - stats.sampled
+    return summary
+
+
+def reset_sampling_stats():
+    _sampling_stats.clear()
+
+
+# TELEMETRIA naruszeń - dopisywany plik JSONL zapisywany w tle
+
+class TelemetrySink:
+    """Zapisuje naruszenia obserwowane w runtime bez zgłaszania wyjątków.
+
+    record() wkłada listę naruszeń do ograniczonej kolejki (put_nowait) -
+    gdy kolejka jest pełna, rekord jest liczony w dropped, a wątek żądania
+    nigdy nie czeka. Wątek zapisujący zbiera paczki, deduplikuje je po
+    (reguła, funkcja, plik) z licznikiem i dopisuje jedną linię JSON na
+    klucz i paczkę. fsync co fsync_interval, rotacja po max_bytes.
+    """
+
+    _FLUSH = object()
+
+    def __init__(self, path: Union[str, Path], max_bytes: int = 10 * 1024 * 1024, backup_count: int = 3,
+                 queue_size: int = 10000, flush_interval: float = 1.0, fsync_interval: float = 5.0):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.flush_interval = flush_interval
+        self.fsync_interval = fsync_interval
+        self.dropped = 0
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._counts: Dict[tuple, int] = {}
+        self._unsynced = False
+        self._thread = None
+        self._start_lock = threading.Lock()
+
+    def record(self, violations: List[QualityViolation]) -> bool:
+        """Zgłasza naruszenia do zapisu; zwraca False gdy kolejka jest pełna"""
+        if self._thread is None:
+            self._start()
+        try:
+            self._queue.put_nowait(violations)
+            return True
+        except queue.Full:
+            self.dropped += 1
+            return False
+
+    def counters(self) -> Dict[tuple, int]:
+        """Łączne liczniki zapisanych naruszeń: (reguła, funkcja, plik) -> liczba"""
+        return dict(self._counts)
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Czeka aż wszystko, co już jest w kolejce, trafi na dysk (z fsync)"""
+        if self._thread is None:
+            return True
+        done = threading.Event()
+        try:
+            self._queue.put((self._FLUSH, done), timeout=timeout)
+        except queue.Full:
+            return False
+        return done.wait(timeout)
+
+    def _start(self):
+        with self._start_lock:
+            if self._thread is None:
+                thread = threading.Thread(target=self._run, name="quality-guard-telemetry", daemon=True)
+                thread.start()
+                self._thread = thread
+                atexit.register(self.flush)
+
+    def _run(self):
+        last_sync = time.monotonic()
+        while True:
+            items = self._collect()
+            waiters = [item[1] for item in items if isinstance(item, tuple)]
+            batch: Dict[tuple, List[Any]] = {}
+            for item in items:
+                if isinstance(item, tuple):
+                    continue
+                for violation in item:
+                    key = (violation.rule_name, violation.function_name, violation.file_path)
+                    entry = batch.get(key)
+                    if entry is None:
+                        batch[key] = [1, violation]
+                    else:
+                        entry[0] += 1
+
+            now = time.monotonic()
+            sync = bool(waiters) or now - last_sync >= self.fsync_interval
+            try:
+                self._write(batch, sync)
+            except OSError:
+                pass  # Telemetria nie może zatrzymać aplikacji
+            if sync:
+                last_sync = now
+            for done in waiters:
+                done.set()
+
+    def _collect(self) -> List[Any]:
+        """Zbiera paczkę: pierwszy rekord i wszystko co przyjdzie w flush_interval"""
+        try:
+            items = [self._queue.get(timeout=self.fsync_interval)]
+        except queue.Empty:
+            return []
+        deadline = time.monotonic() + self.flush_interval
+        while not isinstance(items[-1], tuple):  # flush() kończy paczkę od razu
+            remaining = deadline - time.monotonic()
+            try:
+                items.append(self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return items
+
+    def _write(self, batch: Dict[tuple, List[Any]], sync: bool):
+        if not batch and not (sync and self._unsynced):
+            return
+        lines = []
+        timestamp = time.time()
+        for key, (count, violation) in batch.items():
+            self._counts[key] = self._counts.get(key, 0) + count
+            lines.append(json.dumps({
+                "ts": round(timestamp, 3), "rule": key[0], "function": key[1], "file": key[2],
+                "line": violation.line_number, "level": violation.level.value, "count": count,
+            }, separators=(",", ":"), ensure_ascii=False))
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if lines and self.path.exists() and self.path.stat().st_size >= self.max_bytes:
+            self._rotate()
+        with open(self.path, "a", encoding="utf-8") as f:
+            if lines:
+                f.write("\n".join(lines) + "\n")
+            self._unsynced = not sync
+            if sync:
+                f.flush()
+                os.fsync(f.fileno())
+
+    def _rotate(self):
+        """violations.jsonl -> violations.jsonl.1 -> ... -> .backup_count"""
+        for index in range(self.backup_count - 1, 0, -1):
+            older = self.path.with_name(f"{self.path.name}.{index}")
+            if older.exists():
+                os.replace(older, self.path.with_name(f"{self.path.name}.{index + 1}"))
+        if self.backup_count > 0:
+            os.replace(self.path, self.path.with_name(f"{self.path.name}.1"))
+        else:
+            self.path.unlink()
+
+
+_telemetry_sinks: Dict[Path, TelemetrySink] = {}
+_telemetry_sinks_lock = threading.Lock()
+
+
+def get_telemetry_sink(config: QualityConfig = None) -> TelemetrySink:
+    """Zwraca współdzielony sink telemetrii dla ustawień "telemetry" z konfiguracji"""
+    settings = dict((config or QualityConfig.shared()).get("telemetry") or {})
+    path = settings.pop("path", None)
+    # Ścieżki względne liczone od katalogu projektu, nie od bieżącego katalogu
+    path = config_registry.path.parent / (path or Path(CACHE_DIR_NAME, "violations.jsonl"))
+    sink = _telemetry_sinks.get(path)
+    if sink is None:
+        with _telemetry_sinks_lock:
+            sink = _telemetry_sinks.get(path)
+            if sink is None:
+                sink = _telemetry_sinks[path] = TelemetrySink(path, **settings)
+    return sink
 
 
 # DECORATORS dla łatwego użycia
 
-def require_tests(func: Callable) -> Callable:
-    """Dekorator wymuszający testy"""
+VALIDATION_MODES = ("eager", "lazy", "per_call")
+
+_PENDING = object()
+
+
+class _Gate:
+    """Decyduje kiedy walidować funkcję i pamięta werdykt w trybie lazy.
+
+    error == _PENDING oznacza, że wywołanie musi przejść przez run();
+    w trybie per_call zostaje tak na zawsze. Z sinkiem telemetrii w trybie
+    lazy naruszenia są zapamiętywane w recorded i kolejne wywołania tylko
+    je zgłaszają, bez ponownego sprawdzania. Werdykt obowiązuje dopóki
+    config_registry.generation jest równe generation bramki.
+    """
+    __slots__ = ("func", "check", "cached", "policy", "stats", "error", "sink", "recorded", "generation")
+
+    def __init__(self, func: Callable, check: Callable, cached: bool,
+                 policy: Optional[SamplingPolicy] = None, sink: Optional[TelemetrySink] = None):
+        self.func = func
+        self.check = check
+        self.cached = cached
+        self.policy = policy
+        self.stats = _sampling_stats_for(func) if policy is not None else None
+        self.error = _PENDING
+        self.sink = sink
+        self.recorded = None
+        self.generation = config_registry.generation
+
+    def _due(self) -> bool:
+        return self.policy is None or self.policy.should_sample(self.stats)
+
+    def _check(self) -> Optional[QualityGuardException]:
+        generation = config_registry.generation  # Przed sprawdzeniem - zmiana w trakcie wymusi kolejne
+        error = self.check(self.func, self.cached)
+        if self.cached:
+            self.generation = generation
+            self.recorded = None
+        if error is not None and self.sink is not None:
+            # Tryb telemetrii: każde wywołanie łamiącej funkcji jest liczone, nic nie jest rzucane
+            if self.cached:
+                self.error, self.recorded = _PENDING, error.violations
+            self.sink.record(error.violations)
+            return None
+        if self.cached:
+            self.error = error
+        return error
+
+    def run(self) -> Optional[QualityGuardException]:
+        recorded = self.recorded
+        if recorded is not None and self.generation == config_registry.generation:
+            self.sink.record(recorded)  # Werdykt już znany - jedno put do kolejki
+            return None
+        start = time.perf_counter_ns()
+        try:
+            return self._check() if self._due() else None
+        finally:
+            enforcement_metrics.observe_overhead(time.perf_counter_ns() - start)
+
+    async def run_async(self) -> Optional[QualityGuardException]:
+        """Jak run(), ale walidacja z I/O działa w executorze, poza pętlą zdarzeń"""
+        recorded = self.recorded
+        if recorded is not None and self.generation == config_registry.generation:
+            self.sink.record(recorded)
+            return None
+        start = time.perf_counter_ns()
+        try:
+            if not self._due():
+                return None
+            if self.cached and verdict_cache.get(VerdictCache.key_for(self.func)) is not None:
+                return self._check()  # Werdykt już policzony - bez I/O
+            import asyncio
+            return await asyncio.get_running_loop().run_in_executor(None, self._check)
+        finally:
+            enforcement_metrics.observe_overhead(time.perf_counter_ns() - start)
 
-    @functools.wraps(func)
-    def wrapper(*args, **kwargs):
-        validator = QualityGuardValidator()
-        violations = validator.validate_function(func)
-        test_violations = [v for v in violations if v.rule_name == "missing_test"]
-
-        if test_violations:
-            raise MissingTestException(
-                func.__name__,
-                inspect.getfile(func),
-                inspect.getsourcelines(func)[1]
-            )
 
-        return func(*args, **kwargs)
+QUALITY_GUARD_MARKER = "_quality_guard_wrapped"
+
 
+def _wrap(func: Callable, gate: _Gate) -> Callable:
+    """Buduje wrapper oznaczony markerem Quality Guard"""
+    wrapper = _build_wrapper(func, gate)
+    setattr(wrapper, QUALITY_GUARD_MARKER, True)
     return wrapper
 
 
-def require_docs(func: Callable) -> Callable:
-    """Dekorator wymuszający dokumentację"""
+def _build_wrapper(func: Callable, gate: _Gate) -> Callable:
+    """Buduje wrapper tego samego rodzaju co func (sync, async, generator)"""
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            error = gate.error
+            if error is _PENDING or gate.generation != config_registry.generation:
+                error = await gate.run_async()
+            if error is not None:
+                raise error.with_traceback(None)
+            return await func(*args, **kwargs)
+
+        return async_wrapper
+
+    if inspect.isasyncgenfunction(func):
+        @functools.wraps(func)
+        async def async_gen_wrapper(*args, **kwargs):
+            error = gate.error
+            if error is _PENDING or gate.generation != config_registry.generation:
+                error = await gate.run_async()
+            if error is not None:
+                raise error.with_traceback(None)
+
+            agen = func(*args, **kwargs)
+            try:
+                value = await agen.__anext__()
+                while True:
+                    try:
+                        sent = yield value
+                    except GeneratorExit:
+                        await agen.aclose()
+                        raise
+                    except BaseException as exc:
+                        value = await agen.athrow(exc)
+                    else:
+                        value = await agen.asend(sent)
+            except StopAsyncIteration:
+                return
+
+        return async_gen_wrapper
+
+    if inspect.isgeneratorfunction(func):
+        @functools.wraps(func)
+        def gen_wrapper(*args, **kwargs):
+            error = gate.error
+            if error is _PENDING or gate.generation != config_registry.generation:
+                error = gate.run()
+            if error is not None:
+                raise error.with_traceback(None)
+            return (yield from func(*args, **kwargs))
+
+        return gen_wrapper
 
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        if not func.__doc__ or len(func.__doc__.strip()) < 10:
-            raise MissingDocumentationException(
-                func.__name__,
-                inspect.getfile(func),
-                inspect.getsourcelines(func)[1]
-            )
-
+        error = gate.error
+        if error is _PENDING or gate.generation != config_registry.generation:
+            error = gate.run()
+        if error is not None:
+            raise error.with_traceback(None)
         return func(*args, **kwargs)
 
     return wrapper
 
 
-def enforce_quality(func: Callable) -> Callable:
-    """Dekorator wymuszający wszystkie standardy jakości"""
+def _guard(func: Callable, check: Callable[[Callable, bool], Optional[QualityGuardException]]) -> Callable:
+    """Opakowuje funkcję zgodnie z trybem walidacji.
 
-    @functools.wraps(func)
-    def wrapper(*args, **kwargs):
-        validator = QualityGuardValidator()
-        violations = validator.validate_function(func)
+    check(func, cached) zwraca wyjątek do rzucenia albo None.
+    - eager: walidacja przy dekoracji, przy sukcesie zwraca oryginalną funkcję
+    - lazy: walidacja przy pierwszym wywołaniu, potem tylko werdykt
+    - per_call: pełna walidacja przy każdym (próbkowanym) wywołaniu
 
-        # Filtruj tylko błędy krytyczne
-        critical_violations = [v for v in violations if v.level in [QualityLevel.ERROR, QualityLevel.CRITICAL]]
+    Przy enforcement_level innym niż "error" naruszenia nie są rzucane,
+    tylko zapisywane przez sink telemetrii (get_telemetry_sink).
 
-        if critical_violations:
-            raise QualityGuardException(critical_violations)
+    Funkcje async, generatory i generatory async dostają wrapper tego
+    samego rodzaju; walidacja korutyn działa w executorze wątków.
+    """
+    config = QualityConfig.shared()
+    mode = config.get("validation_mode", "lazy")
+    if mode not in VALIDATION_MODES:
+        mode = "lazy"
 
-        return func(*args, **kwargs)
+    sink = None
+    if config.get("enforcement_level", "error") != "error":
+        sink = get_telemetry_sink(config)
 
-    return wrapper
+    if mode == "eager":
+        try:
+            error = check(func, True)
+        except (OSError, TypeError):
+            return func  # Brak źródła - funkcji nie da się zweryfikować przy dekoracji
+        if error is not None:
+            if sink is None:
+                raise error
+            sink.record(error.violations)
+        return func
+
+    if mode == "per_call":
+        policy = SamplingPolicy.from_config(config.get("sampling"))
+        gate = _Gate(func, check, cached=False,
+                     policy=None if policy.samples_everything else policy, sink=sink)
+    else:
+        gate = _Gate(func, check, cached=True, sink=sink)
+
+    return _wrap(func, gate)
+
+
+def _verdict(func: Callable, cached: bool) -> Verdict:
+    return verdict_cache.verdict_for(func) if cached else validate_verdict(func)
+
+
+def _check_tests_rule(func: Callable, cached: bool) -> Optional[QualityGuardException]:
+    violations = _verdict(func, cached).violations
+    if any(v.rule_name == "missing_test" for v in violations):
+        return MissingTestException(
+            func.__name__,
+            *_function_location(func)
+        )
+    return None
+
+
+def _check_docs_rule(func: Callable, cached: bool) -> Optional[QualityGuardException]:
+    if not func.__doc__ or len(func.__doc__.strip()) < 10:
+        return MissingDocumentationException(
+            func.__name__,
+            *_function_location(func)
+        )
+    return None
+
+
+def _check_all_rules(func: Callable, cached: bool) -> Optional[QualityGuardException]:
+    # Werdykt zawiera tylko błędy krytyczne (ERROR i CRITICAL)
+    return _verdict(func, cached).error
+
+
+def require_tests(func: Callable) -> Callable:
+    """Dekorator wymuszający testy"""
+    return _guard(func, _check_tests_rule)
+
+
+def require_docs(func: Callable) -> Callable:
+    """Dekorator wymuszający dokumentację"""
+    return _guard(func, _check_docs_rule)
+
+
+def enforce_quality(func: Callable) -> Callable:
+    """Dekorator wymuszający wszystkie standardy jakości"""
+    return _guard(func, _check_all_rules)
 
 
 # METACLASS dla automatycznego wymuszania na klasach
 
+def _descriptor_functions(value: Any) -> List[Callable]:
+    """Funkcje kryjące się za atrybutem klasy (metoda, static/classmethod, property)"""
+    if isinstance(value, (staticmethod, classmethod)):
+        return [value.__func__]
+    if isinstance(value, property):
+        return [f for f in (value.fget, value.fset, value.fdel) if f is not None]
+    if inspect.isfunction(value):
+        return [value]
+    return []
+
+
+def _rewrap_descriptor(value: Any, wrap: Callable[[Callable], Callable]) -> Any:
+    """Opakowuje funkcje atrybutu zachowując rodzaj deskryptora"""
+    if isinstance(value, staticmethod):
+        return staticmethod(wrap(value.__func__))
+    if isinstance(value, classmethod):
+        return classmethod(wrap(value.__func__))
+    if isinstance(value, property):
+        return property(*(wrap(f) if f is not None else None for f in (value.fget, value.fset, value.fdel)),
+                        value.__doc__)
+    return wrap(value)
+
+
 class QualityGuardMeta(type):
-    """Metaclass automatycznie dodająca Quality Guard do wszystkich metod"""
+    """Metaclass walidująca publiczne metody klasy raz, przy jej tworzeniu.
+
+    Przy enforcement_level == "error" naruszenia są zgłaszane od razu
+    (QualityGuardException), w przeciwnym razie tylko zapisywane w
+    __quality_violations__. Metody zostają nieopakowane; opcjonalny
+    lekki wrapper z próbkowaniem włącza argument quality_telemetry:
+
+        class Service(metaclass=QualityGuardMeta, quality_telemetry={"every_n": 100}):
+            ...
+    """
 
-    def __new__(cls, name, bases, dct):
+    def __new__(cls, name, bases, dct, quality_telemetry=None, **kwargs):
+        config = QualityConfig.shared()
+
+        violations = []
         for attr_name, attr_value in dct.items():
-            if callable(attr_value) and not attr_name.startswith('_'):
-                dct[attr_name] = enforce_quality(attr_value)
+            if attr_name.startswith('_'):
+                continue
+            for func in _descriptor_functions(attr_value):
+                try:
+                    violations.extend(verdict_cache.verdict_for(func).violations)
+                except (OSError, TypeError):
+                    continue  # Brak źródła (python -c, exec, REPL, sam .pyc) - metody nie da się zweryfikować
+
+        error = _critical_error(violations)
+        if error is not None and config.get("enforcement_level", "error") == "error":
+            raise error
 
-        return super().__new__(cls, name, bases, dct)
+        if quality_telemetry:
+            policy = quality_telemetry
+            if not isinstance(policy, SamplingPolicy):
+                policy = SamplingPolicy.from_config(
+                    quality_telemetry if isinstance(quality_telemetry, dict) else config.get("sampling"))
+            wrap = functools.partial(_telemetry_wrapper, policy=policy, sink=get_telemetry_sink(config))
+            for attr_name, attr_value in list(dct.items()):
+                if not attr_name.startswith('_') and _descriptor_functions(attr_value):
+                    dct[attr_name] = _rewrap_descriptor(attr_value, wrap)
+
+        new_class = super().__new__(cls, name, bases, dct, **kwargs)
+        new_class.__quality_violations__ = violations
+        return new_class
+
+    def __init__(cls, name, bases, dct, quality_telemetry=None, **kwargs):
+        super().__init__(name, bases, dct, **kwargs)
+
+
+def _telemetry_wrapper(func: Callable, policy: SamplingPolicy, sink: TelemetrySink) -> Callable:
+    """Wrapper liczący wywołania i walidujący tylko próbkowane; naruszenia trafiają do sinka, nigdy nie są rzucane"""
+    return _wrap(func, _Gate(func, _check_all_rules, cached=False, policy=policy, sink=sink))
 
 
 # CONTEXT MANAGER dla kontroli zakresów
 
 class QualityScope:
-    """Context manager dla kontroli jakości w zakresie"""
+    """Context manager walidujący każdą funkcję wywołaną w bloku with.
+
+    Funkcja jest walidowana raz, przy pierwszym wywołaniu, bez dekorowania
+    i opakowywania czegokolwiek. Na Pythonie 3.12+ scope korzysta
+    z sys.monitoring (PEP 669): zdarzenie PY_START jest wyłączane dla obiektu
+    kodu po jego pierwszym zgłoszeniu, więc kolejne wywołania nic nie kosztują.
+    Wyłączenie przetrwa koniec scope (restart_events() włączyłby z powrotem
+    zdarzenia wszystkich narzędzi, także coverage), więc funkcja zgłoszona
+    w jednym scope nie trafia do violations kolejnych - jej werdykt jest
+    już w verdict_cache. Na starszych interpreterach używa sys.setprofile (tylko bieżący wątek).
+
+    Naruszenia są zbierane w scope.violations; przy enforcement_level ==
+    "error" pierwsze krytyczne naruszenie jest zgłaszane przy wyjściu z bloku.
+    """
 
     def __init__(self, config: QualityConfig = None):
-        self.config = config or QualityConfig()
-        self.validator = QualityGuardValidator(self.config)
-        self.original_call = None
+        self.config = config or QualityConfig.shared()
+        self.violations: List[QualityViolation] = []
+        self._seen = set()
+        self._errors = []
+        self._tool_id = None
+        self._previous_profile = None
+        self._local = threading.local()
 
     def __enter__(self):
         # Przechwytuj wywołania funkcji
@@ -474,96 +2388,480 @@ class QualityScope:
     def __exit__(self, exc_type, exc_val, exc_tb):
         # Przywróć oryginalne wywołania
         self._restore_function_calls()
+        if exc_type is None and self._errors and self.config.get("enforcement_level", "error") == "error":
+            raise self._errors[0]
+
+    def _observe(self, code: CodeType) -> bool:
+        """Waliduje (raz) funkcję, której obiekt kodu właśnie startuje.
+
+        Zwraca False dla wywołań zagnieżdżonych w samej walidacji.
+        """
+        if code in self._seen:
+            return True
+        if getattr(self._local, "active", False):
+            return False
+        self._seen.add(code)
+        if code.co_name.startswith('<') or code.co_filename == __file__ or not _is_user_path(code.co_filename):
+            return True  # Moduły, lambdy, comprehensions, Quality Guard i kod systemowy
+
+        self._local.active = True
+        try:
+            verdict = verdict_cache.verdict_for(code)
+        finally:
+            self._local.active = False
+        self.violations.extend(verdict.violations)
+        if verdict.error is not None:
+            self._errors.append(verdict.error)
+        return True
 
     def _monkey_patch_function_calls(self):
-        """Monkey patch dla przechwytywania wywołań funkcji"""
-        # To jest uproszczona implementacja
-        # W prawdziwej implementacji użyj sys.settrace lub podobnych
-        pass
+        """Włącza obserwację startu funkcji (sys.monitoring lub sys.setprofile)"""
+        monitoring = getattr(sys, "monitoring", None)
+        if monitoring is not None:
+            for tool_id in (monitoring.PROFILER_ID, 3, 4, monitoring.OPTIMIZER_ID):
+                if monitoring.get_tool(tool_id) is None:
+                    self._start_monitoring(monitoring, tool_id)
+                    return
+
+        # Fallback: hook profilera (Python < 3.12 lub brak wolnego narzędzia)
+        self._previous_profile = sys.getprofile()
+        sys.setprofile(self._profile)
+
+    def _start_monitoring(self, monitoring, tool_id: int):
+        observe = self._observe
+        disable = monitoring.DISABLE
+
+        def on_start(code, instruction_offset):
+            if observe(code):
+                return disable  # Kolejne wywołania tego kodu nie generują zdarzeń
+            return None
+
+        monitoring.use_tool_id(tool_id, "quality_guard")
+        monitoring.register_callback(tool_id, monitoring.events.PY_START, on_start)
+        monitoring.set_events(tool_id, monitoring.events.PY_START)
+        self._tool_id = tool_id
+
+    def _profile(self, frame, event, arg):
+        if event == "call":
+            self._observe(frame.f_code)
 
     def _restore_function_calls(self):
         """Przywraca oryginalne wywołania"""
-        pass
+        if self._tool_id is not None:
+            monitoring = sys.monitoring
+            monitoring.set_events(self._tool_id, 0)
+            monitoring.register_callback(self._tool_id, monitoring.events.PY_START, None)
+            monitoring.free_tool_id(self._tool_id)
+            self._tool_id = None
+        else:
+            sys.setprofile(self._previous_profile)
+            self._previous_profile = None
 
 
 # AUTOMATYCZNA INSTALACJA w interpreterze
 
-class QualityGuardInstaller:
-    """Instalator Quality Guard na poziomie interpretera"""
+# Katalogi instalacji pakietów - biblioteka niezależnie od położenia
+LIBRARY_DIR_NAMES = frozenset({"site-packages", "dist-packages"})
+
+_QUALITY_GUARD_MODULES = frozenset({"quality_guard", "quality_guard_exceptions", "quality_guard_hook",
+                                    "quality_guard_activator"})
+
+_VERDICT = object()
+
+
+class PathClassifier:
+    """Rozstrzyga czy moduł/plik to kod użytkownika czy biblioteka.
+
+    Budowany raz: ścieżki sysconfig i katalogi site to biblioteka, katalogi
+    projektu to kod użytkownika. Zapytanie idzie po trie komponentów
+    ścieżki i bierze najdłuższy pasujący prefiks - koszt O(głębokość
+    ścieżki), bez przeszukiwania sys.meta_path. Ścieżki spoza trie
+    (np. katalogi tymczasowe) są traktowane jako kod użytkownika.
+    """
+
+    def __init__(self, project_roots: Optional[List[Union[str, Path]]] = None):
+        self._trie: Dict[Any, Any] = {}
+        self._memo: Dict[str, bool] = {}
+        self._stdlib_names = frozenset(getattr(sys, "stdlib_module_names", ())) | frozenset(sys.builtin_module_names)
+
+        for path in self._library_paths():
+            self.add(path, user=False)
+        for root in project_roots if project_roots is not None else [find_project_root()]:
+            self.add(root, user=True)
+
+    @classmethod
+    def from_config(cls, config: QualityConfig = None) -> "PathClassifier":
+        """Katalog projektu plus "project_roots" z konfiguracji (względem projektu)"""
+        config = config or QualityConfig.shared()
+        root = config_registry.path.parent
+        return cls([root] + [root / extra for extra in config.get("project_roots", [])])
 
     @staticmethod
-    def install_globally():
-        """Instaluje Quality Guard globalnie w interpreterze"""
-        import builtins
+    def _library_paths() -> List[str]:
+        paths = [path for key, path in sysconfig.get_paths().items()
+                 if key in ("stdlib", "platstdlib", "purelib", "platlib")]
+        try:
+            paths += site.getsitepackages()
+        except AttributeError:
+            pass  # virtualenv ze starym site.py
+        if site.ENABLE_USER_SITE and site.getusersitepackages():
+            paths.append(site.getusersitepackages())
+        return paths
 
-        # Hook do importów
-        original_import = builtins.__import__
+    @staticmethod
+    def _parts(path: Union[str, Path]) -> tuple:
+        return Path(os.path.normcase(os.path.abspath(path))).parts
+
+    def add(self, path: Union[str, Path], user: bool):
+        """Dodaje prefiks ścieżki (także jego wersję po rozwiązaniu symlinków)"""
+        for variant in {os.fspath(path), os.path.realpath(path)}:
+            node = self._trie
+            for part in self._parts(variant):
+                node = node.setdefault(part, {})
+            node[_VERDICT] = user
+        self._memo.clear()
+
+    def _lookup(self, file_path: str) -> Optional[bool]:
+        """Werdykt najdłuższego pasującego prefiksu (None gdy żaden nie pasuje)"""
+        if not file_path or file_path.startswith('<'):
+            return False  # <frozen ...>, <string>, kod bez pliku
+        verdict = None
+        node = self._trie
+        for part in self._parts(file_path):
+            if part in LIBRARY_DIR_NAMES:
+                return False
+            if node is not None:
+                node = node.get(part)
+                if node is not None and _VERDICT in node:
+                    verdict = node[_VERDICT]
+        return verdict
+
+    def is_user_path(self, file_path: str) -> bool:
+        return self._lookup(file_path) is not False
+
+    def is_user_module(self, fullname: str, origin: Optional[str]) -> bool:
+        """Decyzja dla modułu (zapamiętywana per pełna nazwa)"""
+        verdict = self._memo.get(fullname)
+        if verdict is None:
+            top_level = fullname.partition('.')[0]
+            if top_level in _QUALITY_GUARD_MODULES:
+                verdict = False
+            elif top_level in self._stdlib_names:
+                # Nazwa ze stdlib ("test", "code", "parser"...) to kod użytkownika
+                # tylko gdy origin leży pod katalogiem projektu
+                verdict = origin is not None and self._lookup(origin) is True
+            else:
+                verdict = origin is not None and self.is_user_path(origin)
+            self._memo[fullname] = verdict
+        return verdict
+
+    def is_library_name(self, fullname: str) -> bool:
+        """Szybkie odrzucenie po samej nazwie (Quality Guard) - bez szukania spec.
+
+        Nazw ze stdlib nie odrzuca: projekt może mieć własny pakiet "test"
+        czy "parser", więc o nich decyduje ścieżka origin (is_user_module).
+        """
+        return fullname.partition('.')[0] in _QUALITY_GUARD_MODULES
+
+    def clear(self):
+        self._memo.clear()
+
+
+_path_classifier: Optional[PathClassifier] = None
+
+
+def get_path_classifier(rebuild: bool = False) -> PathClassifier:
+    """Współdzielony klasyfikator ścieżek (budowany przy pierwszym użyciu lub instalacji)"""
+    global _path_classifier
+    if _path_classifier is None or rebuild:
+        _path_classifier = PathClassifier.from_config()
+    return _path_classifier
+
+
+def _is_user_path(file_path: str) -> bool:
+    """Czy plik należy do kodu użytkownika (nie systemowego)"""
+    return get_path_classifier().is_user_path(file_path)
+
+
+class _GuardedLoader:
+    """Proxy loadera: po wykonaniu modułu dodaje do niego Quality Guard"""
+
+    def __init__(self, loader, mode: str = "wrap"):
+        self._loader = loader
+        self._mode = mode
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        if self._mode == "static":
+            # Walidacja z AST przed wykonaniem - moduł z błędami nie startuje
+            verdicts = QualityGuardInstaller._enforce_module_statically(module)
+            self._loader.exec_module(module)
+            verdicts.prime(_module_functions(module))
+            return
+
+        self._loader.exec_module(module)
+        # Każde wykonanie (także reload) tworzy nowe funkcje
+        _processed_modules.discard(module)
+        QualityGuardInstaller._add_quality_guard_to_module(module)
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+
+class QualityGuardImportFinder(importlib.abc.MetaPathFinder):
+    """Finder w sys.meta_path podmieniający loader modułów użytkownika.
+
+    Działa tylko przy pierwszym imporcie modułu - importy modułów już
+    obecnych w sys.modules nie przechodzą przez meta_path.
+    """
+
+    def __init__(self, mode: str = "wrap"):
+        self.mode = mode
+        self._local = threading.local()
+
+    def find_spec(self, fullname, path, target=None):
+        # Inne findery mogą ponownie przejść przez sys.meta_path
+        if getattr(self._local, "active", False):
+            return None
+
+        self._local.active = True
+        try:
+            spec = None
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, "find_spec"):
+                    continue
+                spec = finder.find_spec(fullname, path, target)
+                if spec is not None:
+                    break
+        finally:
+            self._local.active = False
 
+        if spec is None or spec.origin is None or not hasattr(spec.loader, "exec_module"):
+            return spec
+        if get_path_classifier().is_user_module(fullname, spec.origin):
+            spec.loader = _GuardedLoader(spec.loader, self.mode)
+        return spec
 
-        def quality_import(name, globals=None, locals=None, fromlist=(), level=0):
-            module = original_import(name, globals, locals, fromlist, level)
 
-            # Dodaj Quality Guard do modułów użytkownika (nie systemowych)
-            if hasattr(module, '__file__') and module.__file__:
-                if not module.__file__.startswith('/usr/') and not 'site-packages' in module.__file__:
-                    QualityGuardInstaller._add_quality_guard_to_module(module)
+_processed_modules = weakref.WeakSet()
 
-            return module
+INSTALL_MODES = ("wrap", "static")
+
+# Naruszenia znalezione w trybie static: nazwa modułu -> lista naruszeń
+static_violations: Dict[str, List[QualityViolation]] = {}
+
+
+def _is_enforced_qualname(qualname: str) -> bool:
+    """Publiczne funkcje modułu i publiczne metody jego klas"""
+    return "<locals>" not in qualname and not any(part.startswith('_') for part in qualname.split('.'))
+
+
+class QualityGuardInstaller:
+    """Instalator Quality Guard na poziomie interpretera"""
+
+    @staticmethod
+    def install_globally(mode: str = None, prevalidate: bool = None):
+        """Instaluje Quality Guard globalnie w interpreterze.
+
+        mode (domyślnie "install_mode" z konfiguracji):
+            wrap   - publiczne funkcje modułów są opakowywane enforce_quality
+            static - moduły są walidowane z AST przy imporcie, a werdykt
+                     stosowany raz; przestrzeń nazw modułu zostaje nietknięta
+        prevalidate (domyślnie prevalidation.enabled z konfiguracji) - pliki
+            projektu są walidowane w tle w puli procesów, a import czeka
+            tylko na werdykt swojego modułu
+        """
+        config = QualityConfig.shared()
+        mode = mode or config.get("install_mode", "wrap")
+        if mode not in INSTALL_MODES:
+            raise ValueError(f"Nieznany tryb instalacji: {mode!r} (dostępne: {', '.join(INSTALL_MODES)})")
+        get_path_classifier(rebuild=True)
+
+        # Hook do importów - tylko raz
+        finders = [f for f in sys.meta_path if isinstance(f, QualityGuardImportFinder)]
+        if finders and finders[0].mode != mode:
+            QualityGuardInstaller.uninstall_globally()
+            finders = []
+        if not finders:
+            sys.meta_path.insert(0, QualityGuardImportFinder(mode))
+
+        if prevalidate is None:
+            prevalidate = (config.get("prevalidation") or {}).get("enabled", False)
+        if prevalidate and _prevalidator is None:
+            start_prevalidation()
 
-        # Ustaw nową funkcję importu
-        builtins.__import__ = quality_import
-        
         # Oznacz jako zainstalowane
         sys._quality_guard_installed = True
         sys._quality_guard_version = "1.0.0"
 
+    @staticmethod
+    def uninstall_globally():
+        """Usuwa hook importów Quality Guard"""
+        sys.meta_path[:] = [f for f in sys.meta_path if not isinstance(f, QualityGuardImportFinder)]
+        stop_prevalidation()
+        sys._quality_guard_installed = False
+
     @staticmethod
     def _add_quality_guard_to_module(module):
-        """Dodaje Quality Guard do modułu"""
-        for attr_name in dir(module):
-            attr_value = getattr(module, attr_name)
-            if callable(attr_value) and not attr_name.startswith('_'):
-                if hasattr(attr_value, '__module__') and attr_value.__module__ == module.__name__:
-                    try:
-                        wrapped = enforce_quality(attr_value)
-                        setattr(module, attr_name, wrapped)
-                    except:
-                        pass  # Ignoruj błędy
+        """Dodaje Quality Guard do modułu (raz na wykonanie modułu)"""
+        if module in _processed_modules:
+            return
+        _processed_modules.add(module)
 
+        # Jedno parsowanie modułu zamiast walidacji funkcji po kolei
+        try:
+            prime_module_verdicts(module)
+        except Exception:
+            pass
 
-# GENERATOR AUTOMATYCZNYCH TESTÓW I DOKUMENTACJI
+        module_name = getattr(module, '__name__', None)
+        for attr_name, attr_value in list(vars(module).items()):
+            if attr_name.startswith('_') or not callable(attr_value) or inspect.isclass(attr_value):
+                continue  # Klasy zostają klasami (isinstance, dziedziczenie)
+            if getattr(attr_value, QUALITY_GUARD_MARKER, False):
+                continue  # Już opakowana
+            if getattr(attr_value, '__module__', None) == module_name:
+                try:
+                    wrapped = enforce_quality(attr_value)
+                    setattr(module, attr_name, wrapped)
+                except QualityGuardException:
+                    raise  # Tryb eager zgłasza naruszenia przy imporcie
+                except Exception:
+                    pass  # Ignoruj błędy
 
-class AutoGenerator:
-    """Generator automatycznych testów i dokumentacji"""
+    @staticmethod
+    def _enforce_module_statically(module) -> ModuleVerdicts:
+        """Waliduje moduł z AST i stosuje werdykt raz (raise, warn lub zapis)"""
+        verdicts = _module_verdicts(module)  # __file__ jest ustawione jeszcze przed wykonaniem
+        violations = [v for qualname, found in verdicts.items() if _is_enforced_qualname(qualname)
+                      for v in found]
+        module_name = getattr(module, '__name__', None)
+        static_violations.pop(module_name, None)
+        if not violations:
+            return verdicts
+
+        level = QualityConfig.shared().get("enforcement_level", "error")
+        error = _critical_error(violations)
+        if level == "error" and error is not None:
+            raise error
+
+        static_violations[module_name] = violations
+        if level == "warning":
+            warnings.warn(str(QualityGuardException(violations)), QualityGuardWarning)
+        return verdicts
 
-    def __init__(self, config: QualityConfig = None):
-        self.config = config or QualityConfig()
 
-    def generate_test_for_function(self, func: Callable, output_dir: str = "tests"):
-        """Generuje test dla funkcji"""
-        func_name = func.__name__
-        file_path = inspect.getfile(func)
-        module_name = Path(file_path).stem
+# GENERATOR AUTOMATYCZNYCH TESTÓW I DOKUMENTACJI
 
-        test_content = f'''# Auto-generated test for {func_name}
+def _test_template(func_name: str, module_name: str, alias: Optional[str] = None) -> str:
+    # alias - nazwa importu i testu, gdy ta sama nazwa funkcji pochodzi z kilku modułów
+    name = alias or func_name
+    imported = f"{func_name} as {alias}" if alias else func_name
+    return f'''# Auto-generated test for {func_name}
 import pytest
-from {module_name} import {func_name}
+from {module_name} import {imported}
 
-def test_{func_name}():
+def test_{name}():
     """Test for {func_name} function"""
     # TODO: Implement proper test
     # Arrange
     # Act
-    result = {func_name}()  # Adjust parameters as needed
+    result = {name}()  # Adjust parameters as needed
     # Assert
     assert result is not None
 
-def test_{func_name}_edge_cases():
+def test_{name}_edge_cases():
     """Test edge cases for {func_name}"""
     # TODO: Add edge case tests
     pass
 '''
 
+
+def _doc_lines(func_name: str, params: List[str], indent: str) -> List[str]:
+    """Linie szablonu docstringa z wcięciem ciała funkcji"""
+    lines = ['"""', f"Brief description of {func_name}.", "", "Args:"]
+    lines += [f"    {param}: Description of {param}" for param in params]
+    lines += ["", "Returns:", "    Description of return value", "",
+              "Raises:", "    Exception: Description of when exception is raised", '"""']
+    return [indent + line if line else "" for line in lines]
+
+
+def _module_name_for(file_path: Path, root: Path) -> str:
+    """Nazwa importu modułu względem katalogu głównego (pakiet lub katalog)"""
+    base = root.parent if (root / "__init__.py").exists() else root
+    parts = list(file_path.relative_to(base).with_suffix("").parts)
+    if parts[-1] == "__init__":
+        parts.pop()
+    return ".".join(parts)
+
+
+def _module_level_functions(tree: ast.Module) -> List[str]:
+    """Nazwy funkcji modułu, także definiowanych warunkowo w if/try na poziomie modułu"""
+    names = []
+    stack = list(reversed(tree.body))
+    while stack:
+        node = stack.pop()
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            if node.name not in names:
+                names.append(node.name)
+        elif isinstance(node, (ast.If, ast.Try)) or type(node).__name__ == "TryStar":
+            blocks = [node.body] + [handler.body for handler in getattr(node, "handlers", [])]
+            blocks += [node.orelse, getattr(node, "finalbody", [])]
+            stack.extend(reversed([statement for block in blocks for statement in block]))
+    return names
+
+
+def _starts_own_line(lines: List[str], line_number: int, col_offset: int) -> bool:
+    """Czy przed instrukcją w jej linii są tylko białe znaki (col_offset liczony w bajtach UTF-8)"""
+    return not lines[line_number - 1].encode("utf-8")[:col_offset].strip()
+
+
+def _scan_generation_targets(file_path: str) -> Optional[Dict[str, Any]]:
+    """Zbiera z AST pliku funkcje bez docstringa i publiczne funkcje modułu.
+
+    Uruchamiane w procesach roboczych AutoGenerator.generate_for_package.
+    """
+    try:
+        with open(file_path, "rb") as f:
+            raw = f.read()
+        tree = ast.parse(raw, filename=file_path)
+        encoding, _ = tokenize.detect_encoding(io.BytesIO(raw).readline)
+        source_lines = raw.decode(encoding).splitlines()
+    except (OSError, SyntaxError, ValueError, UnicodeDecodeError):
+        return None
+
+    public = [name for name in _module_level_functions(tree) if not name.startswith('_')]
+
+    undocumented = []
+    for qualname, node in _iter_qualified_functions(tree):
+        if "<locals>" in qualname or ast.get_docstring(node) is not None:
+            continue
+        first = node.body[0]
+        if not _starts_own_line(source_lines, first.lineno, first.col_offset) or getattr(first, "decorator_list", None):
+            continue  # Ciało w linii def (także po wieloliniowej sygnaturze) lub dekorowana funkcja zagnieżdżona
+        params = [arg.arg for arg in getattr(node.args, "posonlyargs", []) + node.args.args + node.args.kwonlyargs
+                  if arg.arg not in ("self", "cls")]
+        undocumented.append((node.name, first.lineno, first.col_offset, params))
+
+    return {"file_path": file_path, "public": public, "undocumented": undocumented}
+
+
+class AutoGenerator:
+    """Generator automatycznych testów i dokumentacji"""
+
+    def __init__(self, config: QualityConfig = None):
+        self.config = config or QualityConfig.shared()
+
+    def generate_test_for_function(self, func: Callable, output_dir: str = "tests"):
+        """Generuje test dla funkcji"""
+        func_name = func.__name__
+        file_path = inspect.getfile(func)
+        module_name = Path(file_path).stem
+
+        test_content = _test_template(func_name, module_name)
+
         os.makedirs(output_dir, exist_ok=True)
         test_file = os.path.join(output_dir, f"test_{module_name}.py")
 
@@ -593,22 +2891,122 @@ def test_{func_name}_edge_cases():
         sig = inspect.signature(func)
         params = list(sig.parameters.keys())
 
-        doc_template = f'''"""
-        Brief description of {func.__name__}.
+        doc_template = "\n".join(_doc_lines(func.__name__, params, " " * 8)).lstrip()
 
-        Args:
-{chr(10).join(f"            {param}: Description of {param}" for param in params)}
+        # Zapis do pliku robi generate_for_package (wsadowo, z zachowaniem formatowania)
+        print(f"💡 Sugerowana dokumentacja dla {func.__name__}:")
+        print(doc_template)
 
-        Returns:
-            Description of return value
+    def generate_for_package(self, path: Union[str, Path], output_dir: str = "tests",
+                             workers: Optional[int] = None) -> Dict[str, int]:
+        """Generuje brakujące testy i docstringi dla całego pakietu naraz.
+
+        Pliki są skanowane z AST w puli procesów, a każdy plik docelowy
+        (plik testów lub źródło z nowymi docstringami) jest zapisywany raz.
+        Testy modułu pkg/a/utils.py trafiają do test_a_utils.py (ścieżka względem
+        path); gdy ta sama nazwa funkcji przychodzi z kilku modułów do jednego
+        pliku, kolejne dostają test z nazwą modułu (test_a_utils_helper).
+        Zwraca liczniki: pliki przeskanowane, testy, docstringi, pliki zapisane.
+        """
+        root = Path(path).resolve()
+        out = Path(output_dir).resolve()
+        files = [
+            file_path for file_path in sorted(root.rglob("*.py") if root.is_dir() else [root])
+            if not file_path.name.startswith("test_") and out not in file_path.parents
+            and not any(part.startswith(('.', '__pycache__')) or part == "tests"
+                        for part in file_path.relative_to(root).parts[:-1])
+        ]
+
+        auto_generate = self.config.get("auto_generate", {}) or {}
+        workers = workers or os.cpu_count() or 1
+        if workers > 1 and len(files) > workers:
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    scans = list(pool.map(_scan_generation_targets, map(str, files),
+                                          chunksize=max(1, len(files) // (workers * 4))))
+            except (OSError, RuntimeError):
+                scans = [_scan_generation_targets(str(f)) for f in files]  # Brak procesów (np. sandbox)
+        else:
+            scans = [_scan_generation_targets(str(f)) for f in files]
+        scans = [scan for scan in scans if scan is not None]
+
+        summary = {"files_scanned": len(scans), "tests": 0, "docstrings": 0, "files_written": 0}
+
+        if auto_generate.get("tests", True):
+            base = root if root.is_dir() else root.parent
+            by_test_file: Dict[Path, List[tuple]] = {}
+            owners: Dict[tuple, str] = {}  # (plik testów, funkcja) -> moduł, który dostał test_<funkcja>
+            for scan in scans:
+                file_path = Path(scan["file_path"])
+                module_name = _module_name_for(file_path, base)
+                test_file = out / f"test_{'_'.join(file_path.relative_to(base).with_suffix('').parts)}.py"
+                blocks = by_test_file.setdefault(test_file, [])
+                for name in scan["public"]:
+                    owner = owners.setdefault((test_file, name), module_name)
+                    alias = None if owner == module_name else f"{module_name.replace('.', '_')}_{name}"
+                    blocks.append((f"test_{alias or name}", _test_template(name, module_name, alias)))
+            for test_file, blocks in by_test_file.items():
+                written = self._write_tests(test_file, blocks)
+                summary["tests"] += written
+                summary["files_written"] += bool(written)
+
+        if auto_generate.get("docs", True):
+            for scan in scans:
+                if scan["undocumented"]:
+                    inserted = self._insert_docstrings(scan["file_path"], scan["undocumented"])
+                    summary["docstrings"] += inserted
+                    summary["files_written"] += bool(inserted)
+
+        print(f"✅ Przeskanowano {summary['files_scanned']} plików: {summary['tests']} testów, "
+              f"{summary['docstrings']} docstringów, {summary['files_written']} zapisanych plików")
+        return summary
 
-        Raises:
-            Exception: Description of when exception is raised
-        """'''
+    @staticmethod
+    def _write_tests(test_file: Path, blocks: List[tuple]) -> int:
+        """Dopisuje brakujące testy (pary nazwa testu, treść) do pliku jednym zapisem"""
+        existing_content = test_file.read_text() if test_file.exists() else ""
+        existing = _extract_test_names(existing_content) if existing_content else set()
+
+        missing = []
+        for test_name, block in blocks:
+            if test_name not in existing:
+                existing.add(test_name)
+                missing.append(block)
+        if not missing:
+            return 0
+
+        test_file.parent.mkdir(parents=True, exist_ok=True)
+        content = "\n\n".join(missing)
+        with open(test_file, 'a' if existing_content else 'w') as f:
+            f.write(f"\n\n{content}" if existing_content else content)
+        return len(missing)
 
-        # W prawdziwej implementacji można by modyfikować AST
-        print(f"💡 Sugerowana dokumentacja dla {func.__name__}:")
-        print(doc_template)
+    @staticmethod
+    def _insert_docstrings(file_path: str, undocumented: List[tuple]) -> int:
+        """Wstawia docstringi do źródła jednym przepisaniem pliku.
+
+        Reszta pliku pozostaje bajt w bajt: kodowanie, końce linii i wcięcia
+        są zachowane, bo wstawiane są tylko nowe linie przed ciałem funkcji.
+        """
+        with open(file_path, "rb") as f:
+            raw = f.read()
+        encoding, _ = tokenize.detect_encoding(io.BytesIO(raw).readline)
+        lines = raw.decode(encoding).splitlines(keepends=True)
+        newline = "\r\n" if lines and lines[0].endswith("\r\n") else "\n"
+
+        # Od końca, żeby numery linii wcześniejszych funkcji pozostały aktualne
+        inserted = 0
+        for name, body_line, col_offset, params in sorted(undocumented, key=lambda t: t[1], reverse=True):
+            if not _starts_own_line(lines, body_line, col_offset):
+                continue  # Ciało dzieli linię z kodem - wstawienie zepsułoby wcięcia
+            indent = lines[body_line - 1][:col_offset]
+            lines[body_line - 1:body_line - 1] = [line + newline for line in _doc_lines(name, params, indent)]
+            inserted += 1
+
+        if inserted:
+            with open(file_path, "wb") as f:
+                f.write("".join(lines).encode(encoding))
+        return inserted
 
 
 # PRZYKŁADY UŻYCIA
@@ -623,13 +3021,16 @@ def example_usage():
         """Dodaje dwie liczby"""
         return x + y
 
-    # 2. Metaclass dla całej klasy
-    class MyService(metaclass=QualityGuardMeta):
-        def process_data(self, data):
-            return data * 2
+    # 2. Metaclass dla całej klasy - walidacja przy definicji klasy
+    try:
+        class MyService(metaclass=QualityGuardMeta):
+            def process_data(self, data):
+                return data * 2
 
-        def validate_input(self, input_data):
-            return len(input_data) > 0
+            def validate_input(self, input_data):
+                return len(input_data) > 0
+    except QualityGuardException as e:
+        print(e)
 
     # 3. Context manager dla zakresu
     with QualityScope() as scope:
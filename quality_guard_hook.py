@@ -3,29 +3,19 @@
 # Import hook dla automatycznego Quality Guard
 
 import sys
-import importlib.util
-from importlib.abc import MetaPathFinder, Loader
-from pathlib import Path
+from importlib.abc import MetaPathFinder
+from importlib.machinery import SourceFileLoader
 
-class QualityGuardLoader(Loader):
-    """Loader który dodaje Quality Guard do modułów"""
+class QualityGuardLoader(SourceFileLoader):
+    """Loader który dodaje Quality Guard do modułów.
 
-    def __init__(self, fullname, path):
-        self.fullname = fullname
-        self.path = path
-
-    def create_module(self, spec):
-        """Tworzy moduł z Quality Guard"""
-        return None  # Use default module creation
+    Dziedziczy po SourceFileLoader, więc kod bajtowy jest czytany z
+    __pycache__ i tam zapisywany. Werdykty walidacji leżą obok pliku .pyc.
+    """
 
     def exec_module(self, module):
-        """Wykonuje moduł i dodaje Quality Guard"""
-        # Załaduj normalnie
-        with open(self.path, 'rb') as f:
-            source = f.read()
-
-        code = compile(source, self.path, 'exec')
-        exec(code, module.__dict__)
+        """Wykonuje moduł (z .pyc gdy aktualny) i dodaje Quality Guard"""
+        super().exec_module(module)
 
         # Dodaj Quality Guard do funkcji
         self._add_quality_guard_to_module(module)
@@ -33,7 +23,10 @@ class QualityGuardLoader(Loader):
     def _add_quality_guard_to_module(self, module):
         """Dodaje Quality Guard do wszystkich funkcji w module"""
         try:
-            from quality_guard_exceptions import enforce_quality
+            from quality_guard_exceptions import cached_module_verdicts, enforce_quality, prime_module_verdicts
+
+            # Werdykty z pliku obok .pyc lub jedno parsowanie modułu
+            prime_module_verdicts(module, cached_module_verdicts(module))
 
             for attr_name in dir(module):
                 if not attr_name.startswith('_'):
@@ -48,49 +41,64 @@ class QualityGuardLoader(Loader):
 class QualityGuardFinder(MetaPathFinder):
     """Meta path finder dla Quality Guard"""
 
+    def __init__(self, classifier=None):
+        if classifier is None:
+            from quality_guard_exceptions import PathClassifier
+            classifier = PathClassifier.from_config()
+        self.classifier = classifier
+
     def find_spec(self, fullname, path, target=None):
         """Znajduje specyfikację modułu i dodaje Quality Guard"""
 
-        # Tylko dla modułów użytkownika (nie systemowych)
-        if self._is_user_module(fullname):
-            # Znajdź normalną specyfikację
-            for finder in sys.meta_path:
-                if isinstance(finder, QualityGuardFinder):
-                    continue
+        # Moduły Quality Guard odrzucane po nazwie, bez szukania specyfikacji
+        if self.classifier.is_library_name(fullname):
+            return None
+
+        # Znajdź normalną specyfikację - jedno przeszukanie, bez find_spec
+        for finder in sys.meta_path:
+            if isinstance(finder, QualityGuardFinder) or not hasattr(finder, "find_spec"):
+                continue
 
-                spec = finder.find_spec(fullname, path, target)
-                if spec and spec.origin:
-                    # Podmień loader na nasz
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                # Tylko moduły użytkownika ze źródłem .py
+                if isinstance(spec.loader, SourceFileLoader) and self._is_user_module(fullname, spec.origin):
                     spec.loader = QualityGuardLoader(fullname, spec.origin)
-                    return spec
+                return spec
 
         return None
 
-    def _is_user_module(self, fullname):
-        """Sprawdza czy to moduł użytkownika"""
-        # Pomiń moduły systemowe
-        system_modules = ['os', 'sys', 'json', 'ast', 'inspect', 'functools']
-        if any(fullname.startswith(mod) for mod in system_modules):
-            return False
+    def _is_user_module(self, fullname, origin):
+        """Sprawdza czy to moduł użytkownika (trie ścieżek, wynik zapamiętany per nazwa)"""
+        return self.classifier.is_user_module(fullname, origin)
 
-        # Pomiń site-packages
-        try:
-            import importlib.util
-            spec = importlib.util.find_spec(fullname)
-            if spec and spec.origin:
-                if 'site-packages' in spec.origin:
-                    return False
-        except:
-            pass
-
-        return True
+def install_import_hook(prevalidate=None):
+    """Instaluje import hook.
 
-def install_import_hook():
-    """Instaluje import hook"""
-    finder = QualityGuardFinder()
-    if finder not in sys.meta_path:
-        sys.meta_path.insert(0, finder)
+    prevalidate (domyślnie prevalidation.enabled z konfiguracji) uruchamia
+    walidację plików projektu w tle; werdykty trafiają też obok plików .pyc.
+    """
+    if not any(isinstance(finder, QualityGuardFinder) for finder in sys.meta_path):
+        try:
+            from quality_guard_exceptions import PathClassifier, QualityConfig, start_prevalidation
+        except ImportError:
+            return  # Bez quality_guard_exceptions hook nie ma czego dodawać
+        sys.meta_path.insert(0, QualityGuardFinder(PathClassifier.from_config()))
         print("🪝 Quality Guard import hook zainstalowany")
 
+        if prevalidate is None:
+            prevalidate = (QualityConfig.shared().get("prevalidation") or {}).get("enabled", False)
+        if prevalidate:
+            start_prevalidation(persist=True)
+
+def uninstall_import_hook():
+    """Usuwa import hook i zatrzymuje prewalidację"""
+    sys.meta_path[:] = [finder for finder in sys.meta_path if not isinstance(finder, QualityGuardFinder)]
+    try:
+        from quality_guard_exceptions import stop_prevalidation
+    except ImportError:
+        return
+    stop_prevalidation()
+
 # Auto-instalacja
 install_import_hook()
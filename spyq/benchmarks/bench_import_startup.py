@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Startup benchmark for the SPYQ import hook.
+
+Generates a package of N small modules, imports all of them through
+SPYQFinder and reports wall time and how many times the config files were
+loaded. "per-loader" emulates the previous behaviour, where every loader
+and validator built its own ConfigManager; "shared" is the memoized
+snapshot.
+
+Usage:
+    python benchmarks/bench_import_startup.py [module_count]
+"""
+
+import importlib
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from spyq import importhook, validator
+from spyq.config import ConfigManager, invalidate_config
+
+MODULE_SOURCE = '''
+def handler_{index}(value: int) -> int:
+    """Double the value."""
+    return value * 2
+'''
+
+
+def _make_package(root: Path, count: int) -> str:
+    package = root / "bench_pkg"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    for index in range(count):
+        (package / f"mod_{index}.py").write_text(MODULE_SOURCE.format(index=index))
+    return package.name
+
+
+def _import_all(root: Path, count: int, shared: bool) -> tuple:
+    """Import every module; return (seconds, number of config loads)"""
+    loads = 0
+    original_load = ConfigManager.load
+
+    def counting_load(self):
+        nonlocal loads
+        loads += 1
+        return original_load(self)
+
+    def per_loader_config():
+        return ConfigManager().load()
+
+    def per_validator_file(path, config=None):
+        return validator.validate_file(path)  # Validator loads its own config again
+
+    package = _make_package(root, count)
+    sys.path.insert(0, str(root))
+    finder = importhook.SPYQFinder()
+    sys.meta_path.insert(0, finder)
+    invalidate_config()
+    try:
+        with patch.object(ConfigManager, "load", counting_load):
+            if shared:
+                start = time.perf_counter()
+                for index in range(count):
+                    importlib.import_module(f"{package}.mod_{index}")
+                elapsed = time.perf_counter() - start
+            else:
+                with patch.object(importhook, "get_config", per_loader_config), \
+                        patch.object(validator, "get_config", per_loader_config), \
+                        patch.object(importhook, "validate_file", per_validator_file):
+                    start = time.perf_counter()
+                    for index in range(count):
+                        importlib.import_module(f"{package}.mod_{index}")
+                    elapsed = time.perf_counter() - start
+    finally:
+        sys.meta_path.remove(finder)
+        sys.path.remove(str(root))
+        for name in [name for name in sys.modules if name.startswith(package)]:
+            del sys.modules[name]
+    return elapsed, loads
+
+
+def main(count: int = 500):
+    importhook.uninstall_import_hook()
+    sys.dont_write_bytecode = True
+    original_cwd = os.getcwd()
+    results = {}
+    for label, shared in (("per-loader", False), ("shared", True)):
+        workdir = Path(tempfile.mkdtemp())
+        os.chdir(workdir)
+        try:
+            results[label] = _import_all(workdir, count, shared)
+        finally:
+            os.chdir(original_cwd)
+            shutil.rmtree(workdir)
+    invalidate_config()
+
+    print(f"SPYQ import hook startup ({count} modules)")
+    for label, (elapsed, loads) in results.items():
+        print(f"   {label:>10}: {elapsed * 1000:8.1f} ms, config loads: {loads}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Cold-start benchmark for background prevalidation in the SPYQ import hook.
+
+Generates a package of N modules and imports all of them through the hook,
+with no bytecode or stamps on disk. "serial" validates each module as it is
+imported; "prevalidated" starts the process pool at install, so imports
+only wait for verdicts that are not ready yet. Install time is included.
+
+Usage:
+    python benchmarks/bench_prevalidation.py [module_count] [workers]
+"""
+
+import importlib
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from spyq import importhook
+from spyq.config import invalidate_config
+
+FUNCTION_SOURCE = '''
+def handler_{index}(value: int, scale: int) -> int:
+    """Scale the value, clamping negatives."""
+    if value < 0:
+        for _ in range(scale):
+            value += 1
+    return value * scale
+'''
+
+
+def _make_package(root: Path, count: int) -> str:
+    package = root / "bench_pkg"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    body = "".join(FUNCTION_SOURCE.format(index=index) for index in range(40))
+    for index in range(count):
+        (package / f"mod_{index}.py").write_text(body)
+    return package.name
+
+
+def _cold_start(count: int, prevalidate: bool, workers: int) -> float:
+    workdir = Path(tempfile.mkdtemp())
+    original_cwd = os.getcwd()
+    os.chdir(workdir)
+    package = _make_package(workdir, count)
+    sys.path.insert(0, str(workdir))
+    invalidate_config()
+    try:
+        start = time.perf_counter()
+        importhook.install_import_hook(prevalidate=False)
+        if prevalidate:
+            importhook.start_prevalidation(importhook.get_config(), workers=workers)
+        for index in range(count):
+            importlib.import_module(f"{package}.mod_{index}")
+        elapsed = time.perf_counter() - start
+    finally:
+        importhook.uninstall_import_hook()
+        sys.path.remove(str(workdir))
+        for name in [name for name in sys.modules if name.startswith(package)]:
+            del sys.modules[name]
+        os.chdir(original_cwd)
+        shutil.rmtree(workdir)
+        invalidate_config()
+    return elapsed
+
+
+def main(count: int = 500, workers: int = 0):
+    importhook.uninstall_import_hook()
+    sys.dont_write_bytecode = True  # Every run is a cold start
+    workers = workers or os.cpu_count() or 1
+
+    serial = _cold_start(count, False, workers)
+    prevalidated = _cold_start(count, True, workers)
+
+    print(f"SPYQ cold start ({count} modules, {workers} workers)")
+    print(f"         serial: {serial * 1000:8.1f} ms")
+    print(f"   prevalidated: {prevalidated * 1000:8.1f} ms")
+    print(f"        speedup: {serial / prevalidated:8.2f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 0)
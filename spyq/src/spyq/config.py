@@ -6,8 +6,10 @@ Handles loading and validating configuration from config files.
 
 import json
 import os
+import threading
 from pathlib import Path
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional
 
 # Default configuration
 DEFAULT_CONFIG = {
@@ -17,6 +19,9 @@ DEFAULT_CONFIG = {
     "max_nesting_depth": 4,
     "enable_import_hook": True,
     "validate_on_import": True,
+    "prevalidate": False,
+    "prevalidate_workers": None,
+    "prevalidate_timeout": 30.0,
 }
 
 class ConfigError(Exception):
@@ -63,6 +68,7 @@ class ConfigManager:
         try:
             with open(path, 'w') as f:
                 json.dump(config, f, indent=2)
+            invalidate_config()
             return path
         except IOError as e:
             raise ConfigError(f"Error saving config to {path}: {e}")
@@ -71,6 +77,28 @@ class ConfigManager:
         """Initialize a new configuration file."""
         return self.save(DEFAULT_CONFIG, path)
 
-def get_config() -> Dict[str, Any]:
-    """Get the current configuration."""
-    return ConfigManager().load()
+_config_snapshot: Optional[Mapping[str, Any]] = None
+_config_lock = threading.Lock()
+
+
+def get_config() -> Mapping[str, Any]:
+    """Get the current configuration.
+
+    The config files are read once per process; every caller shares the
+    same read-only snapshot until invalidate_config() is called.
+    """
+    global _config_snapshot
+    snapshot = _config_snapshot
+    if snapshot is None:
+        with _config_lock:
+            if _config_snapshot is None:
+                _config_snapshot = MappingProxyType(ConfigManager().load())
+            snapshot = _config_snapshot
+    return snapshot
+
+
+def invalidate_config() -> None:
+    """Drop the cached snapshot so the next get_config() re-reads the files."""
+    global _config_snapshot
+    with _config_lock:
+        _config_snapshot = None
@@ -9,32 +9,49 @@ import importlib.machinery
 import sys
 import warnings
 from pathlib import Path
-from typing import Any, Optional, Sequence
+from typing import Any, Mapping, Optional, Sequence
 
 from .config import get_config
+from .prevalidate import is_project_file, prevalidated_issues, start_prevalidation, stop_prevalidation
+from .stamps import load_stamp, rules_hash, source_hash, write_stamp
 from .validator import validate_file, ValidationError
 
 class SPYQLoader(importlib.machinery.SourceFileLoader):
-    """A loader that validates source code before importing it."""
+    """A loader that validates source code before importing it.
+
+    Validation results are kept in a stamp file in ``__pycache__`` keyed by
+    the source hash and the rule configuration, independently of the .pyc:
+    an unchanged module is not re-validated, and a config change re-validates
+    it without recompiling.
+    """
     
-    def __init__(self, fullname: str, path: str) -> None:
+    def __init__(self, fullname: str, path: str,
+                 config: Optional[Mapping[str, Any]] = None) -> None:
         super().__init__(fullname, path)
-        self.config = get_config()
+        self.config = config if config is not None else get_config()
     
-    def source_to_code(self, data: bytes, path: str, *, _optimize: int = -1) -> Any:
-        """Convert source code to a code object, validating it first."""
+    def get_code(self, fullname: str) -> Any:
+        """Get the code object (from .pyc when fresh), validating the source first."""
         if self.config.get('validate_on_import', True):
-            self._validate_source(path)
-        return super().source_to_code(data, path, _optimize=_optimize)
+            self._validate_source(self.path)
+        return super().get_code(fullname)
     
     def _validate_source(self, path: str) -> None:
-        """Validate the source file."""
+        """Validate the source file, reusing a matching stamp."""
         try:
-            issues = validate_file(Path(path))
-            if issues:
-                self._report_issues(issues, path)
+            source_digest = source_hash(self.get_data(path))
+            rules_digest = rules_hash(self.config)
+            issues = load_stamp(path, source_digest, rules_digest)
+            if issues is None:
+                issues = prevalidated_issues(path, source_digest, rules_digest)
+            if issues is None:
+                issues = validate_file(Path(path), self.config)
+                write_stamp(path, source_digest, rules_digest, issues)
         except Exception as e:
             warnings.warn(f"Failed to validate {path}: {e}", RuntimeWarning)
+            return
+        if issues:
+            self._report_issues(issues, path)
     
     def _report_issues(self, issues: list, path: str) -> None:
         """Report validation issues."""
@@ -50,30 +67,45 @@ class SPYQLoader(importlib.machinery.SourceFileLoader):
             raise ValidationError(f"Validation failed for {path}")
 
 class SPYQFinder(importlib.abc.MetaPathFinder):
-    """A finder that uses SPYQLoader to load Python modules."""
+    """A finder that uses SPYQLoader to load the project's Python modules.
+
+    Modules outside the project (the current directory), including the
+    stdlib and site-packages, are left to the standard loaders.
+    """
     
     def __init__(self) -> None:
-        self.config = get_config()
         self.original_path_hooks = None
         self.original_path_importer_cache = None
+
+    @property
+    def config(self) -> Mapping[str, Any]:
+        """The shared config snapshot (re-read only after invalidate_config())."""
+        return get_config()
     
     def find_spec(self, fullname: str, path: Optional[Sequence[str]] = None, target=None):
         """Find the spec for the given module."""
-        if not self.config.get('enable_import_hook', True):
+        config = self.config
+        if not config.get('enable_import_hook', True):
             return None
             
         # Let the standard finder find the module first
         for finder in sys.meta_path:
             if finder is not self and hasattr(finder, 'find_spec'):
                 spec = finder.find_spec(fullname, path, target)
-                if spec is not None and spec.origin and spec.origin.endswith('.py'):
+                if (spec is not None and spec.origin and spec.origin.endswith('.py')
+                        and is_project_file(spec.origin, [Path.cwd()])):
                     # Replace the loader with our own
-                    spec.loader = SPYQLoader(fullname, spec.origin)
+                    spec.loader = SPYQLoader(fullname, spec.origin, config)
                     return spec
         return None
 
-def install_import_hook() -> None:
-    """Install the SPYQ import hook."""
+def install_import_hook(prevalidate: Optional[bool] = None) -> None:
+    """Install the SPYQ import hook.
+
+    With ``prevalidate`` (default: the ``prevalidate`` config key) the
+    project's files are validated in a background process pool, and each
+    import waits only for the result of its own module.
+    """
     config = get_config()
     if not config.get('enable_import_hook', True):
         return
@@ -86,6 +118,11 @@ def install_import_hook() -> None:
     # Install our finder
     finder = SPYQFinder()
     sys.meta_path.insert(0, finder)
+    
+    if prevalidate is None:
+        prevalidate = config.get('prevalidate', False)
+    if prevalidate and config.get('validate_on_import', True):
+        start_prevalidation(config)
 
 def uninstall_import_hook() -> None:
     """Uninstall the SPYQ import hook."""
@@ -93,6 +130,7 @@ def uninstall_import_hook() -> None:
         if isinstance(finder, SPYQFinder):
             sys.meta_path.pop(i)
             break
+    stop_prevalidation()
 
 # Install the hook when this module is imported
 install_import_hook()
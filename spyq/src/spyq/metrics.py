@@ -0,0 +1,94 @@
+"""
+SPYQ Function Metrics
+
+Computes all per-function metrics in a single traversal of the AST and
+stores them in a compact, slotted record.
+"""
+
+import ast
+from typing import List, Optional, Sequence
+
+# Nodes that add a decision point to cyclomatic complexity
+BRANCH_NODES = (ast.If, ast.While, ast.For, ast.AsyncFor, ast.ExceptHandler)
+
+# Nodes that open a new nesting level
+NESTING_NODES = (ast.If, ast.While, ast.For, ast.AsyncFor, ast.Try)
+
+
+class FunctionMetrics:
+    """Compact metrics record for a single function."""
+
+    __slots__ = ("lines", "logical_lines", "complexity", "depth", "params",
+                 "docstring_length", "has_annotations")
+
+    def __init__(self, lines: int, logical_lines: int, complexity: int, depth: int,
+                 params: int, docstring_length: int, has_annotations: bool) -> None:
+        self.lines = lines
+        self.logical_lines = logical_lines
+        self.complexity = complexity
+        self.depth = depth
+        self.params = params
+        self.docstring_length = docstring_length
+        self.has_annotations = has_annotations
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"FunctionMetrics({fields})"
+
+
+def compute_function_metrics(node: ast.AST,
+                             lines: Optional[Sequence[str]] = None) -> FunctionMetrics:
+    """Compute every metric of a function in one pass over its AST.
+
+    ``lines`` are the function's source lines. Without them the line count
+    comes from ``lineno``/``end_lineno`` and logical lines equal it.
+    """
+    complexity = 1
+    max_depth = 0
+    stack = [(child, 0) for child in ast.iter_child_nodes(node)]
+    while stack:
+        current, depth = stack.pop()
+        if isinstance(current, BRANCH_NODES):
+            complexity += 1
+        elif isinstance(current, ast.BoolOp):
+            complexity += len(current.values) - 1
+        if isinstance(current, NESTING_NODES):
+            depth += 1
+            if depth > max_depth:
+                max_depth = depth
+        stack.extend((child, depth) for child in ast.iter_child_nodes(current))
+
+    if lines is not None:
+        line_count = len(lines)
+        logical_lines = sum(
+            1 for line in lines if line.strip() and not line.strip().startswith('#')
+        )
+    else:
+        start = getattr(node, 'lineno', 1)
+        line_count = getattr(node, 'end_lineno', start) - start + 1
+        logical_lines = line_count
+
+    params = 0
+    has_annotations = False
+    args = getattr(node, 'args', None)
+    if isinstance(args, ast.arguments):
+        params = len(args.args) + len(args.kwonlyargs)
+        all_args: List[ast.arg] = getattr(args, 'posonlyargs', []) + args.args + args.kwonlyargs
+        all_args += [arg for arg in (args.vararg, args.kwarg) if arg is not None]
+        has_annotations = node.returns is not None or any(
+            arg.annotation is not None for arg in all_args
+        )
+
+    docstring = None
+    if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef, ast.Module)):
+        docstring = ast.get_docstring(node)
+
+    return FunctionMetrics(
+        lines=line_count,
+        logical_lines=logical_lines,
+        complexity=complexity,
+        depth=max_depth,
+        params=params,
+        docstring_length=len(docstring) if docstring else 0,
+        has_annotations=has_annotations,
+    )
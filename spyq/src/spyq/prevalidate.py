@@ -0,0 +1,220 @@
+"""
+SPYQ Background Prevalidation
+
+Validates the project's source files in a process pool as soon as the
+import hook is installed. Results go into a shared table of futures keyed
+by path; a loader waits only for the file it is importing, and validates a
+file itself when the pool has not reached it yet.
+"""
+
+import multiprocessing
+import os
+import sysconfig
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Set, Tuple, Union
+
+from .stamps import load_stamp, rules_hash, source_hash, write_stamp
+from .validator import validate_file
+
+# Directories that never hold project modules
+SKIP_DIR_NAMES = frozenset({"__pycache__", "site-packages", "dist-packages", "node_modules"})
+
+# The interpreter's stdlib and site-packages directories
+LIBRARY_PATHS = tuple(sorted({
+    os.path.abspath(path) for key, path in sysconfig.get_paths().items()
+    if key in ("stdlib", "platstdlib", "purelib", "platlib")
+}))
+
+# Start the pool with fork where available: under spawn/forkserver (Windows,
+# the macOS default, Linux from Python 3.14) every worker re-imports the
+# user's __main__ and with it the import hook. Without fork (Windows) the
+# default method is used and Prevalidator.start() is a no-op in workers.
+POOL_CONTEXT = multiprocessing.get_context("fork") if "fork" in multiprocessing.get_all_start_methods() else None
+
+
+def is_project_file(path: str, roots: Sequence[Union[str, Path]]) -> bool:
+    """Whether the file belongs to the project, using the same rules as the tree walk."""
+    path = os.path.abspath(path)
+    if any(path.startswith(library + os.sep) for library in LIBRARY_PATHS):
+        return False
+    for root in roots:
+        root = os.path.abspath(root)
+        if path.startswith(root + os.sep):
+            parts = Path(path).relative_to(root).parts[:-1]
+            return not any(part.startswith('.') or part in SKIP_DIR_NAMES for part in parts)
+    return False
+
+
+def validate_path(path: str, config: Mapping[str, Any]) -> Tuple[str, str, List[Dict[str, Any]]]:
+    """Validate one file, reusing and refreshing its stamp.
+
+    Returns ``(source_digest, rules_digest, issues)``.
+    """
+    with open(path, 'rb') as f:
+        source_digest = source_hash(f.read())
+    rules_digest = rules_hash(config)
+    issues = load_stamp(path, source_digest, rules_digest)
+    if issues is None:
+        issues = validate_file(Path(path), config)
+        write_stamp(path, source_digest, rules_digest, issues)
+    return source_digest, rules_digest, issues
+
+
+def _validate_in_worker(path: str, config: Dict[str, Any]) -> Optional[tuple]:
+    try:
+        return validate_path(path, config)
+    except Exception:
+        return None  # The loader validates the file itself
+
+
+class Prevalidator:
+    """Shared table of validation results filled by a process pool."""
+
+    def __init__(self, roots: Sequence[Union[str, Path]], config: Mapping[str, Any],
+                 workers: Optional[int] = None, timeout: Optional[float] = 30.0) -> None:
+        self.roots = [os.path.abspath(root) for root in roots]
+        self.config = dict(config)
+        self.workers = workers or os.cpu_count() or 1
+        self.timeout = timeout
+        self._futures: Dict[str, Future] = {}
+        self._claimed: Set[str] = set()
+        self._lock = threading.Lock()
+        # At most 2 * workers files in flight, so exit never waits for the whole tree
+        self._slots = threading.Semaphore(self.workers * 2)
+        self._stopped = threading.Event()
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "Prevalidator":
+        """Start feeding project files to the pool from a background thread."""
+        if multiprocessing.current_process().name != "MainProcess":
+            self._stopped.set()  # A child process, e.g. re-importing __main__ under spawn
+            return self
+        self._pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=POOL_CONTEXT)
+        try:
+            # Workers are forked on submit(); fork them all here, before the feeder
+            # thread exists, since fork() from a multi-threaded process can deadlock
+            for _ in range(self.workers):
+                self._pool.submit(os.getpid)
+        except (OSError, RuntimeError):
+            self._stopped.set()  # No subprocesses here; loaders validate inline
+            return self
+        self._thread = threading.Thread(target=self._feed, name="spyq-prevalidate", daemon=True)
+        self._thread.start()
+        return self
+
+    def iter_source_files(self) -> Iterator[str]:
+        """Project .py files, skipping hidden dirs, caches and virtualenvs."""
+        for root in self.roots:
+            for dir_path, dir_names, file_names in os.walk(root):
+                dir_names[:] = sorted(
+                    name for name in dir_names
+                    if not name.startswith('.') and name not in SKIP_DIR_NAMES
+                    and not os.path.exists(os.path.join(dir_path, name, "pyvenv.cfg"))
+                )
+                for name in sorted(file_names):
+                    if name.endswith('.py'):
+                        yield os.path.join(dir_path, name)
+
+    def _feed(self) -> None:
+        try:
+            for path in self.iter_source_files():
+                self._slots.acquire()
+                if self._stopped.is_set():
+                    return
+                with self._lock:
+                    claimed = path in self._claimed
+                if claimed:
+                    self._slots.release()
+                    continue
+                # submit() may import modules through the hook, so never under the lock
+                future = self._pool.submit(_validate_in_worker, path, self.config)
+                with self._lock:
+                    self._futures[path] = future
+                future.add_done_callback(lambda _: self._slots.release())
+        except (OSError, RuntimeError):
+            self._stopped.set()  # No subprocesses here or pool shut down; loaders validate inline
+
+    def issues_for(self, path: str, source_digest: str, rules_digest: str,
+                   timeout: Optional[float] = None) -> Optional[List[Dict[str, Any]]]:
+        """Issues for the file, waiting only for it; None means validate inline.
+
+        Waits at most ``self.timeout`` seconds by default, so a stuck worker
+        cannot hang the import.
+        """
+        path = os.path.abspath(path)
+        with self._lock:
+            future = self._futures.get(path)
+            if future is None:
+                self._claimed.add(path)
+                return None
+        if future.cancel():
+            return None  # Still queued: validating inline is faster
+        try:
+            result = future.result(self.timeout if timeout is None else timeout)
+        except Exception:
+            return None
+        if result is None or result[:2] != (source_digest, rules_digest):
+            return None  # File or config changed since prevalidation
+        return result[2]
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every project file has been validated."""
+        if self._thread is not None:
+            self._thread.join(timeout)
+        with self._lock:
+            futures = list(self._futures.values())
+        return not wait(futures, timeout).not_done
+
+    def stop(self) -> None:
+        """Cancel queued files and wait for the ones in flight."""
+        self._stopped.set()
+        self._slots.release()
+        if self._pool is not None:
+            # shutdown(cancel_futures=True) needs Python 3.9+
+            with self._lock:
+                futures = list(self._futures.values())
+            for future in futures:
+                future.cancel()
+            self._pool.shutdown(wait=True)
+
+    def __len__(self) -> int:
+        return len(self._futures)
+
+
+_prevalidator: Optional[Prevalidator] = None
+
+
+def start_prevalidation(config: Mapping[str, Any], roots: Optional[Sequence[Union[str, Path]]] = None,
+                        workers: Optional[int] = None) -> Prevalidator:
+    """(Re)start prevalidation of the project (the current directory by default)."""
+    global _prevalidator
+    stop_prevalidation()
+    workers = workers or config.get('prevalidate_workers')
+    timeout = config.get('prevalidate_timeout', 30.0)
+    _prevalidator = Prevalidator(roots or [Path.cwd()], config, workers, timeout).start()
+    return _prevalidator
+
+
+def stop_prevalidation() -> None:
+    """Stop the running prevalidation, if any."""
+    global _prevalidator
+    if _prevalidator is not None:
+        _prevalidator.stop()
+        _prevalidator = None
+
+
+def get_prevalidator() -> Optional[Prevalidator]:
+    """The running prevalidator, or None."""
+    return _prevalidator
+
+
+def prevalidated_issues(path: str, source_digest: str,
+                        rules_digest: str) -> Optional[List[Dict[str, Any]]]:
+    """Issues from the running prevalidation, or None to validate inline."""
+    prevalidator = _prevalidator
+    if prevalidator is None:
+        return None
+    return prevalidator.issues_for(path, source_digest, rules_digest)
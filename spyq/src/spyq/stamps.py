@@ -0,0 +1,77 @@
+"""
+SPYQ Validation Stamps
+
+Stores validation results next to the bytecode cache, in
+``__pycache__/<module>.<tag>.spyq.json``. A stamp is keyed by the source
+hash and a hash of the effective rule configuration, so changing a
+threshold re-validates a module without recompiling its bytecode.
+"""
+
+import hashlib
+import importlib.util
+import json
+import os
+import sys
+from typing import Any, Dict, List, Mapping, Optional
+
+from .config import DEFAULT_CONFIG
+
+# Bump when the validator's rules change in a way that affects results
+STAMP_VERSION = 1
+
+# Config keys the validator reads; anything else does not affect results
+RULE_KEYS = ("max_file_lines", "max_function_lines", "max_function_params", "max_nesting_depth")
+
+
+def rules_hash(config: Mapping[str, Any]) -> str:
+    """Hash of the effective rule configuration (defaults applied)."""
+    rules = {key: config.get(key, DEFAULT_CONFIG.get(key)) for key in RULE_KEYS}
+    payload = json.dumps([STAMP_VERSION, rules], sort_keys=True)
+    return hashlib.sha1(payload.encode()).hexdigest()
+
+
+def source_hash(data: bytes) -> str:
+    """Hash of the source bytes (the one used by hash-based .pyc files)."""
+    return importlib.util.source_hash(data).hex()
+
+
+def stamp_path(source_path: str) -> Optional[str]:
+    """Path of the stamp file for a source file, or None without a cache tag."""
+    try:
+        pyc_path = importlib.util.cache_from_source(source_path)
+    except (NotImplementedError, ValueError):
+        return None
+    return os.path.splitext(pyc_path)[0] + ".spyq.json"
+
+
+def load_stamp(source_path: str, source_digest: str, rules_digest: str) -> Optional[List[Dict[str, Any]]]:
+    """Return the stored issues if the stamp matches both hashes, else None."""
+    path = stamp_path(source_path)
+    if path is None:
+        return None
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            stamp = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if stamp.get("source_hash") != source_digest or stamp.get("rules_hash") != rules_digest:
+        return None
+    issues = stamp.get("issues")
+    return issues if isinstance(issues, list) else None
+
+
+def write_stamp(source_path: str, source_digest: str, rules_digest: str,
+                issues: List[Dict[str, Any]]) -> None:
+    """Store issues for the source file; respects sys.dont_write_bytecode."""
+    path = stamp_path(source_path)
+    if path is None or sys.dont_write_bytecode:
+        return
+    stamp = {"source_hash": source_digest, "rules_hash": rules_digest, "issues": issues}
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(stamp, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass  # Read-only location: validate again next time
@@ -7,9 +7,10 @@ Validates Python code against configured quality rules.
 import ast
 import inspect
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any, Callable, TypeVar
+from typing import Dict, List, Mapping, Optional, Tuple, Any, Callable, TypeVar
 
 from .config import get_config
+from .metrics import FunctionMetrics, compute_function_metrics
 
 class ValidationError(Exception):
     """Raised when validation fails."""
@@ -22,9 +23,10 @@ class ValidationError(Exception):
 class CodeValidator(ast.NodeVisitor):
     """Validates Python code against configured rules."""
     
-    def __init__(self, config: Optional[Dict[str, Any]] = None):
-        self.config = config or get_config()
+    def __init__(self, config: Optional[Mapping[str, Any]] = None):
+        self.config = config if config is not None else get_config()
         self.issues: List[Dict[str, Any]] = []
+        self.source_lines: List[str] = []
     
     def validate_file(self, filepath: Path) -> List[Dict[str, Any]]:
         """Validate a Python file."""
@@ -33,6 +35,7 @@ class CodeValidator(ast.NodeVisitor):
         try:
             with open(filepath, 'r', encoding='utf-8') as f:
                 source = f.read()
+            self.source_lines = source.splitlines()
                 
             # Check file length
             self._check_file_length(source, filepath)
@@ -62,22 +65,30 @@ class CodeValidator(ast.NodeVisitor):
     
     def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
         """Visit function definitions and validate them."""
+        metrics = self._function_metrics(node)
+
         # Check function length
-        self._check_function_length(node)
+        self._check_function_length(node, metrics)
         
         # Check number of parameters
-        self._check_param_count(node)
+        self._check_param_count(node, metrics)
         
         # Check nesting depth
-        self._check_nesting_depth(node)
+        self._check_nesting_depth(node, metrics)
         
         # Continue visiting child nodes
         self.generic_visit(node)
     
-    def _check_function_length(self, node: ast.FunctionDef) -> None:
+    def _function_metrics(self, node: ast.FunctionDef) -> FunctionMetrics:
+        """Compute the metrics record for a function in a single pass."""
+        end_lineno = getattr(node, 'end_lineno', None)
+        lines = self.source_lines[node.lineno - 1:end_lineno] if end_lineno else None
+        return compute_function_metrics(node, lines)
+    
+    def _check_function_length(self, node: ast.FunctionDef, metrics: FunctionMetrics) -> None:
         """Check if function exceeds maximum allowed lines."""
         max_lines = self.config.get('max_function_lines', 50)
-        line_count = node.end_lineno - node.lineno + 1 if hasattr(node, 'end_lineno') else 1
+        line_count = metrics.lines
         
         if line_count > max_lines:
             self._add_issue(
@@ -85,10 +96,10 @@ class CodeValidator(ast.NodeVisitor):
                 node.lineno
             )
     
-    def _check_param_count(self, node: ast.FunctionDef) -> None:
+    def _check_param_count(self, node: ast.FunctionDef, metrics: FunctionMetrics) -> None:
         """Check if function has too many parameters."""
         max_params = self.config.get('max_function_params', 4)
-        param_count = len(node.args.args) + len(node.args.kwonlyargs)
+        param_count = metrics.params
         
         if param_count > max_params:
             self._add_issue(
@@ -96,45 +107,13 @@ class CodeValidator(ast.NodeVisitor):
                 node.lineno
             )
     
-    def _check_nesting_depth(self, node: ast.AST) -> None:
+    def _check_nesting_depth(self, node: ast.AST, metrics: FunctionMetrics) -> None:
         """Check maximum nesting depth in a function."""
         max_depth = self.config.get('max_nesting_depth', 4)
         
-        class DepthVisitor(ast.NodeVisitor):
-            def __init__(self):
-                self.max_depth = 0
-                self.current_depth = 0
-                
-            def visit_If(self, node):
-                self.current_depth += 1
-                self.max_depth = max(self.max_depth, self.current_depth)
-                self.generic_visit(node)
-                self.current_depth -= 1
-                
-            def visit_For(self, node):
-                self.current_depth += 1
-                self.max_depth = max(self.max_depth, self.current_depth)
-                self.generic_visit(node)
-                self.current_depth -= 1
-                
-            def visit_While(self, node):
-                self.current_depth += 1
-                self.max_depth = max(self.max_depth, self.current_depth)
-                self.generic_visit(node)
-                self.current_depth -= 1
-                
-            def visit_Try(self, node):
-                self.current_depth += 1
-                self.max_depth = max(self.max_depth, self.current_depth)
-                self.generic_visit(node)
-                self.current_depth -= 1
-        
-        visitor = DepthVisitor()
-        visitor.visit(node)
-        
-        if visitor.max_depth > max_depth:
+        if metrics.depth > max_depth:
             self._add_issue(
-                f"Code nesting too deep (max {max_depth} levels, found {visitor.max_depth})",
+                f"Code nesting too deep (max {max_depth} levels, found {metrics.depth})",
                 node.lineno
             )
     
@@ -147,9 +126,10 @@ class CodeValidator(ast.NodeVisitor):
             'severity': 'error'
         })
 
-def validate_file(filepath: Path) -> List[Dict[str, Any]]:
+def validate_file(filepath: Path,
+                  config: Optional[Mapping[str, Any]] = None) -> List[Dict[str, Any]]:
     """Validate a Python file against configured rules."""
-    validator = CodeValidator()
+    validator = CodeValidator(config)
     return validator.validate_file(filepath)
 
 def validate_source(source: str, filename: str = "<string>") -> List[Dict[str, Any]]:
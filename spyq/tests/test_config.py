@@ -0,0 +1,74 @@
+"""
+Tests for the shared, memoized configuration snapshot.
+"""
+
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add the src directory to the path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from spyq.config import ConfigManager, get_config, invalidate_config
+from spyq.importhook import SPYQFinder, uninstall_import_hook
+from spyq.validator import CodeValidator
+
+# Importing the hook installs it; these tests drive the finder directly
+uninstall_import_hook()
+
+
+@pytest.fixture
+def project_dir():
+    """Run in an empty project directory with a fresh snapshot."""
+    original_cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        os.chdir(temp_dir)
+        invalidate_config()
+        try:
+            yield Path(temp_dir)
+        finally:
+            os.chdir(original_cwd)
+            invalidate_config()
+
+
+def test_config_read_once(project_dir):
+    """Finder, loaders and validators share one loaded snapshot."""
+    (project_dir / "spyq.json").write_text(json.dumps({"max_function_lines": 10}))
+    (project_dir / "mod.py").write_text("x = 1\n")
+    sys.path.insert(0, str(project_dir))
+    try:
+        with patch.object(ConfigManager, "load", autospec=True,
+                          side_effect=ConfigManager.load) as mock_load:
+            finder = SPYQFinder()
+            spec = finder.find_spec("mod")
+            CodeValidator()
+            assert spec.loader.config is get_config()
+            assert mock_load.call_count == 1
+    finally:
+        sys.path.remove(str(project_dir))
+
+    assert get_config()["max_function_lines"] == 10
+
+
+def test_snapshot_is_read_only(project_dir):
+    """The shared snapshot cannot be modified by a caller."""
+    with pytest.raises(TypeError):
+        get_config()["max_function_lines"] = 1
+
+
+def test_invalidation_rereads_files(project_dir):
+    """invalidate_config() and ConfigManager.save() refresh the snapshot."""
+    assert get_config()["max_file_lines"] == 300
+
+    (project_dir / "spyq.json").write_text(json.dumps({"max_file_lines": 100}))
+    assert get_config()["max_file_lines"] == 300
+    invalidate_config()
+    assert get_config()["max_file_lines"] == 100
+
+    ConfigManager().save({"max_file_lines": 50}, project_dir / "spyq.json")
+    assert get_config()["max_file_lines"] == 50
@@ -0,0 +1,67 @@
+"""
+Tests for the single-pass function metrics engine.
+"""
+
+import ast
+import sys
+import textwrap
+from pathlib import Path
+
+# Add the src directory to the path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from spyq.metrics import compute_function_metrics
+from spyq.validator import CodeValidator
+
+SOURCE = textwrap.dedent('''
+    def process(items: list, limit, *, strict=False) -> int:
+        """Process items up to a limit."""
+        total = 0
+        # Sum positive items
+        for item in items:
+            if item > 0 and item < limit:
+                try:
+                    total += item
+                except ValueError:
+                    pass
+
+        return total
+''').lstrip()
+
+
+def _metrics():
+    node = ast.parse(SOURCE).body[0]
+    return compute_function_metrics(node, SOURCE.splitlines())
+
+def test_compute_function_metrics():
+    """Test that all metrics come from one traversal."""
+    metrics = _metrics()
+    assert metrics.lines == 12
+    assert metrics.logical_lines == 10
+    assert metrics.complexity == 5
+    assert metrics.depth == 3
+    assert metrics.params == 3
+    assert metrics.docstring_length == len("Process items up to a limit.")
+    assert metrics.has_annotations is True
+
+def test_metrics_without_source_lines():
+    """Test line counts derived from the AST positions."""
+    node = ast.parse(SOURCE).body[0]
+    metrics = compute_function_metrics(node)
+    assert metrics.lines == metrics.logical_lines == 12
+
+def test_metrics_record_is_slotted():
+    """Test that metrics records carry no per-instance dict."""
+    assert not hasattr(_metrics(), "__dict__")
+    assert "complexity=5" in repr(_metrics())
+
+def test_validator_uses_metrics(tmp_path):
+    """Test that CodeValidator reports issues from the metrics record."""
+    path = tmp_path / "sample.py"
+    path.write_text(SOURCE)
+    validator = CodeValidator({"max_function_lines": 5, "max_function_params": 2,
+                               "max_nesting_depth": 2, "max_file_lines": 300})
+    messages = [issue["message"] for issue in validator.validate_file(path)]
+    assert any("too long (12 > 5" in message for message in messages)
+    assert any("too many parameters (3 > 2)" in message for message in messages)
+    assert any("found 3" in message for message in messages)
@@ -0,0 +1,162 @@
+"""
+Tests for background prevalidation started by the import hook.
+"""
+
+import importlib.util
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import Future
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+# Add the src directory to the path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from spyq import importhook
+from spyq.config import invalidate_config
+from spyq.importhook import SPYQLoader, install_import_hook, uninstall_import_hook
+from spyq.prevalidate import Prevalidator, get_prevalidator
+from spyq.stamps import rules_hash, source_hash, stamp_path
+from spyq.validator import validate_file
+
+# Importing the hook installs it; each test installs it explicitly
+uninstall_import_hook()
+
+MODULE_SOURCE = '''
+def handler(a, b, c, d, e):
+    """Combine five values."""
+    return a + b + c + d + e
+'''
+
+
+@pytest.fixture
+def project():
+    """A project directory with a few modules and a virtualenv to skip."""
+    original_cwd = os.getcwd()
+    dont_write_bytecode = sys.dont_write_bytecode
+    with tempfile.TemporaryDirectory() as temp_dir:
+        os.chdir(temp_dir)
+        invalidate_config()
+        for index in range(3):
+            Path(temp_dir, f"prevalidated_{index}.py").write_text(MODULE_SOURCE)
+        venv = Path(temp_dir, "venv")
+        venv.mkdir()
+        (venv / "pyvenv.cfg").write_text("")
+        (venv / "skipped.py").write_text(MODULE_SOURCE)
+        try:
+            yield Path(temp_dir)
+        finally:
+            uninstall_import_hook()
+            sys.dont_write_bytecode = dont_write_bytecode
+            os.chdir(original_cwd)
+            invalidate_config()
+
+
+def _digests(path, config):
+    return source_hash(path.read_bytes()), rules_hash(config)
+
+
+def test_results_match_inline_validation(project):
+    """The pool reports the same issues and leaves stamps behind."""
+    sys.dont_write_bytecode = False
+    path = project / "prevalidated_0.py"
+    prevalidator = Prevalidator([project], {}, workers=2).start()
+    try:
+        assert prevalidator.wait(60)
+        issues = prevalidator.issues_for(str(path), *_digests(path, {}))
+    finally:
+        prevalidator.stop()
+
+    assert len(prevalidator) == 3
+    assert issues == validate_file(path, {})
+    assert "too many parameters" in issues[0]["message"]
+    assert os.path.exists(stamp_path(str(path)))
+
+
+def test_loader_waits_for_its_module(project):
+    """With prevalidation on, the loader does not validate the module itself."""
+    sys.dont_write_bytecode = True
+    install_import_hook(prevalidate=True)
+    assert get_prevalidator().wait(60)
+
+    path = str(project / "prevalidated_1.py")
+    loader = SPYQLoader("prevalidated_1", path, {})
+    spec = importlib.util.spec_from_file_location("prevalidated_1", path, loader=loader)
+    module = importlib.util.module_from_spec(spec)
+    with patch.object(importhook, "validate_file") as mock_validate:
+        loader.exec_module(module)
+
+    assert not mock_validate.called
+    assert module.handler(1, 2, 3, 4, 5) == 15
+
+    uninstall_import_hook()
+    assert get_prevalidator() is None
+
+
+def test_claimed_and_stale_files_validate_inline(project):
+    """Files the pool has not reached, or results for other rules, are not used."""
+    path = project / "prevalidated_2.py"
+    prevalidator = Prevalidator([project], {}, workers=2)
+    assert prevalidator.issues_for(str(path), *_digests(path, {})) is None
+
+    prevalidator.start()
+    try:
+        assert prevalidator.wait(60)
+        other = project / "prevalidated_0.py"
+        assert prevalidator.issues_for(str(other), *_digests(other, {"max_function_params": 9})) is None
+    finally:
+        prevalidator.stop()
+    assert len(prevalidator) == 2
+
+
+def test_workers_start_before_feeder_thread(project):
+    """Worker processes are forked by start(), not by the background thread."""
+    prevalidator = Prevalidator([project], {}, workers=2)
+    seen = []
+    with patch.object(Prevalidator, "_feed", lambda self: seen.append(len(self._pool._processes))):
+        prevalidator.start()
+        prevalidator._thread.join(10)
+    prevalidator.stop()
+    assert seen == [2]
+
+
+@pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(), reason="no fork here")
+def test_pool_forks_where_available(project):
+    """Workers are forked, so they do not re-import __main__."""
+    prevalidator = Prevalidator([project], {}, workers=1).start()
+    try:
+        assert prevalidator._pool._mp_context.get_start_method() == "fork"
+    finally:
+        prevalidator.stop()
+
+
+def test_start_in_worker_process_is_noop(project):
+    """A child process re-running the install does not start its own pool."""
+    path = project / "prevalidated_0.py"
+    prevalidator = Prevalidator([project], {}, workers=1)
+    with patch.object(multiprocessing, "current_process",
+                      return_value=SimpleNamespace(name="SpawnProcess-1")):
+        prevalidator.start()
+
+    assert prevalidator._pool is None
+    assert prevalidator.issues_for(str(path), *_digests(path, {})) is None
+    prevalidator.stop()
+
+
+def test_stuck_worker_falls_back_to_inline_validation(project):
+    """A file whose worker never answers is validated inline after the timeout."""
+    path = project / "prevalidated_0.py"
+    prevalidator = Prevalidator([project], {}, workers=1, timeout=0.1)
+    stuck = Future()
+    stuck.set_running_or_notify_cancel()
+    prevalidator._futures[str(path)] = stuck
+
+    started = time.monotonic()
+    assert prevalidator.issues_for(str(path), *_digests(path, {})) is None
+    assert time.monotonic() - started < 5
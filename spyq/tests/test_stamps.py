@@ -0,0 +1,115 @@
+"""
+Tests for config-aware validation stamps used by the import hook.
+"""
+
+import importlib.util
+import json
+import os
+import sys
+import tempfile
+from importlib.machinery import SourceFileLoader
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add the src directory to the path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from spyq import importhook
+from spyq.config import invalidate_config
+from spyq.importhook import SPYQLoader, install_import_hook, uninstall_import_hook
+from spyq.stamps import rules_hash, stamp_path
+
+# Importing the hook installs it; these tests drive the loader directly
+uninstall_import_hook()
+
+MODULE_SOURCE = '''
+def handler(a, b, c):
+    """Combine three values."""
+    return a + b + c
+'''
+
+
+@pytest.fixture
+def module_path():
+    """A module in a fresh project directory, with bytecode writing enabled."""
+    original_cwd = os.getcwd()
+    dont_write_bytecode = sys.dont_write_bytecode
+    with tempfile.TemporaryDirectory() as temp_dir:
+        os.chdir(temp_dir)
+        sys.dont_write_bytecode = False
+        invalidate_config()
+        path = Path(temp_dir, "stamped.py")
+        path.write_text(MODULE_SOURCE)
+        try:
+            yield str(path)
+        finally:
+            sys.dont_write_bytecode = dont_write_bytecode
+            os.chdir(original_cwd)
+            invalidate_config()
+
+
+def _load(path, config):
+    loader = SPYQLoader("stamped", path, config)
+    spec = importlib.util.spec_from_file_location("stamped", path, loader=loader)
+    module = importlib.util.module_from_spec(spec)
+    loader.exec_module(module)
+    return module
+
+
+def test_stamp_written_next_to_bytecode(module_path):
+    """The first import stores bytecode and a stamp with the issues."""
+    _load(module_path, {"max_function_params": 2})
+
+    assert os.path.exists(importlib.util.cache_from_source(module_path))
+    with open(stamp_path(module_path)) as f:
+        stamp = json.load(f)
+    assert stamp["rules_hash"] == rules_hash({"max_function_params": 2})
+    assert "too many parameters" in stamp["issues"][0]["message"]
+
+
+def test_fresh_stamp_skips_validation(module_path):
+    """An unchanged module with unchanged rules is not validated again."""
+    _load(module_path, {})
+
+    with patch.object(importhook, "validate_file") as mock_validate:
+        _load(module_path, {})
+
+    assert not mock_validate.called
+
+
+def test_rule_change_revalidates_without_recompiling(module_path, capsys):
+    """New thresholds re-validate from the stamp key, bytecode stays cached."""
+    _load(module_path, {})
+    capsys.readouterr()
+
+    with patch.object(SourceFileLoader, "source_to_code",
+                      side_effect=AssertionError("recompiled")):
+        module = _load(module_path, {"max_function_params": 2})
+
+    assert module.handler(1, 2, 3) == 6
+    assert "too many parameters" in capsys.readouterr().err
+
+
+def test_rules_hash_ignores_unrelated_keys():
+    """Only rule settings (with defaults applied) affect the hash."""
+    assert rules_hash({}) == rules_hash({"strict": True, "max_file_lines": 300})
+    assert rules_hash({}) != rules_hash({"max_file_lines": 10})
+
+
+def test_stdlib_is_not_validated(module_path, capsys):
+    """Strict mode applies to project modules only; stdlib imports still work."""
+    Path(module_path).with_name("spyq.json").write_text('{"strict": true, "max_file_lines": 10}')
+    invalidate_config()
+    saved = sys.modules.pop("colorsys", None)
+    install_import_hook()
+    try:
+        import colorsys
+        assert colorsys.rgb_to_hsv(0, 0, 0) == (0, 0, 0)
+    finally:
+        uninstall_import_hook()
+        if saved is not None:
+            sys.modules["colorsys"] = saved
+
+    assert "SPYQ Validation issues" not in capsys.readouterr().err
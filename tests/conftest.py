@@ -0,0 +1,38 @@
+"""
+Shared fixtures: an isolated project directory and sample functions to guard.
+"""
+
+import json
+
+import pytest
+
+from quality_guard_exceptions import config_registry, source_cache, verdict_cache
+
+
+def documented_function(x, y):
+    """Adds two numbers and returns the result."""
+    return x + y
+
+
+def undocumented_function(x):
+    return x
+
+
+def write_config(**settings):
+    """Write quality-guard.json (require_tests off unless given) and drop cached config and verdicts."""
+    with open("quality-guard.json", "w") as f:
+        json.dump({"require_tests": False, **settings}, f)
+    config_registry.reset()
+    verdict_cache.clear()
+
+
+@pytest.fixture
+def project_dir(tmp_path, monkeypatch):
+    """Run the test in an empty project directory with a default quality-guard.json."""
+    monkeypatch.chdir(tmp_path)
+    write_config()
+    source_cache.clear()
+    yield tmp_path
+    config_registry.reset()
+    verdict_cache.clear()
+    source_cache.clear()
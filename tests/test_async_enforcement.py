@@ -0,0 +1,100 @@
+"""
+Tests for async- and generator-aware enforce_quality wrappers.
+"""
+
+import asyncio
+import inspect
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from quality_guard_exceptions import (
+    QualityGuardException,
+    QualityGuardValidator,
+    enforce_quality,
+)
+
+
+async def fetch_value(x):
+    """Returns x after yielding to the event loop."""
+    await asyncio.sleep(0)
+    return x
+
+
+async def stream_values(n):
+    """Yields numbers from zero up to n asynchronously."""
+    for i in range(n):
+        received = yield i
+        if received is not None:
+            yield received
+
+
+def count_up(n):
+    """Yields numbers from zero up to n and returns n."""
+    for i in range(n):
+        yield i
+    return n
+
+
+async def undocumented_coroutine(x):
+    return x
+
+
+@pytest.mark.usefixtures("project_dir")
+class TestAsyncEnforcement:
+    """Tests for wrapper kinds and off-loop validation."""
+
+    def test_wrapper_kind_matches_original(self):
+        """Coroutines, async generators and generators keep their kind."""
+        assert inspect.iscoroutinefunction(enforce_quality(fetch_value))
+        assert inspect.isasyncgenfunction(enforce_quality(stream_values))
+        assert inspect.isgeneratorfunction(enforce_quality(count_up))
+
+    def test_coroutine_validated_off_event_loop(self):
+        """Validation of a coroutine runs in an executor thread."""
+        guarded = enforce_quality(fetch_value)
+        threads = []
+        original = QualityGuardValidator.validate_function
+
+        def record_thread(*args, **kwargs):
+            threads.append(threading.get_ident())
+            return original(*args, **kwargs)
+
+        with patch.object(QualityGuardValidator, "validate_function",
+                          autospec=True, side_effect=record_thread):
+            assert asyncio.run(guarded(5)) == 5
+            assert asyncio.run(guarded(6)) == 6
+
+        assert len(threads) == 1
+        assert threads[0] != threading.get_ident()
+
+    def test_coroutine_violation_raised_when_awaited(self):
+        """A failing coroutine raises once awaited."""
+        guarded = enforce_quality(undocumented_coroutine)
+
+        with pytest.raises(QualityGuardException):
+            asyncio.run(guarded(1))
+
+    def test_async_generator_delegates_send(self):
+        """Values and asend() pass through the async generator wrapper."""
+        guarded = enforce_quality(stream_values)
+
+        async def consume():
+            agen = guarded(3)
+            first = await agen.__anext__()
+            echoed = await agen.asend("ping")
+            rest = [value async for value in agen]
+            return first, echoed, rest
+
+        assert asyncio.run(consume()) == (0, "ping", [1, 2])
+
+    def test_generator_return_value_preserved(self):
+        """yield from keeps the generator's return value."""
+        gen = enforce_quality(count_up)(2)
+
+        assert next(gen) == 0
+        assert next(gen) == 1
+        with pytest.raises(StopIteration) as stop:
+            next(gen)
+        assert stop.value.value == 2
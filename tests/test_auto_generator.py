@@ -0,0 +1,140 @@
+"""
+Tests for AutoGenerator.generate_for_package batch generation.
+"""
+
+import ast
+from pathlib import Path
+
+import pytest
+
+from quality_guard_exceptions import AutoGenerator
+
+CORE_SOURCE = (
+    "# -*- coding: utf-8 -*-\r\n"
+    "def add(a, b):\r\n"
+    "    return a + b  # suma\r\n"
+    "\r\n"
+    "\r\n"
+    "class Calculator:\r\n"
+    "    def scale(self, x, factor=2):\r\n"
+    "        return x * factor\r\n"
+)
+
+UTILS_SOURCE = '''
+def documented(value):
+    """Returns the value unchanged."""
+    return value
+
+
+def _private(value):
+    return value
+'''
+
+
+class TestGenerateForPackage:
+    """Tests for whole-package test and docstring generation."""
+
+    @pytest.fixture(autouse=True)
+    def package(self, project_dir):
+        """Create a small package in the project directory."""
+        package = project_dir / "pkg"
+        (package / "sub").mkdir(parents=True)
+        (package / "__init__.py").write_text("")
+        (package / "core.py").write_bytes(CORE_SOURCE.encode())
+        for index in range(4):
+            (package / "sub" / f"utils{index}.py").write_text(UTILS_SOURCE)
+
+    def test_generates_tests_and_docstrings(self):
+        """Missing tests and docstrings are produced in one run."""
+        summary = AutoGenerator().generate_for_package("pkg", workers=2)
+
+        assert summary == {"files_scanned": 6, "tests": 5, "docstrings": 6, "files_written": 10}
+        test_core = Path("tests/test_core.py").read_text()
+        assert "from pkg.core import add" in test_core
+        assert "from pkg.sub.utils0 import documented" in Path("tests/test_sub_utils0.py").read_text()
+
+    def test_docstring_insertion_preserves_formatting(self):
+        """Only docstring lines are added; encoding, CRLF and comments survive."""
+        AutoGenerator().generate_for_package("pkg", workers=1)
+
+        rewritten = Path("pkg/core.py").read_bytes().decode()
+        tree = ast.parse(rewritten)
+        assert ast.get_docstring(tree.body[0]).startswith("Brief description of add.")
+        method = tree.body[1].body[0]
+        assert "factor: Description of factor" in ast.get_docstring(method)
+        assert "self:" not in ast.get_docstring(method)
+        assert "\n" not in rewritten.replace("\r\n", "")
+        assert "    return a + b  # suma\r\n" in rewritten
+        assert rewritten.startswith("# -*- coding: utf-8 -*-\r\n")
+
+    def test_second_run_writes_nothing(self):
+        """Existing tests and docstrings are detected and kept."""
+        generator = AutoGenerator()
+        generator.generate_for_package("pkg", workers=1)
+        before = Path("tests/test_core.py").read_text()
+
+        summary = generator.generate_for_package("pkg", workers=1)
+
+        assert summary["files_written"] == 0
+        assert Path("tests/test_core.py").read_text() == before
+
+    def test_multiline_signature_with_inline_body_is_skipped(self):
+        """A body sharing the closing line of the signature is left untouched."""
+        source = (
+            "def multi(a,\n"
+            "          b): return a + b\n"
+            "\n"
+            "\n"
+            "def split(a,\n"
+            "          b):\n"
+            "    return a - b\n"
+        )
+        Path("pkg/multi.py").write_text(source)
+
+        AutoGenerator().generate_for_package("pkg/multi.py", workers=1)
+
+        rewritten = Path("pkg/multi.py").read_text()
+        tree = ast.parse(rewritten)
+        assert ast.get_docstring(tree.body[0]) is None
+        assert ast.get_docstring(tree.body[1]).startswith("Brief description of split.")
+        assert rewritten.startswith("def multi(a,\n          b): return a + b\n")
+
+    def test_same_stem_modules_get_separate_tests(self):
+        """Modules sharing a file name in different subpackages keep all their tests."""
+        for sub in ("a", "b"):
+            (Path("pkg") / sub).mkdir()
+            (Path("pkg") / sub / "utils.py").write_text(UTILS_SOURCE.replace("documented", "helper"))
+        Path("pkg/a_utils.py").write_text(UTILS_SOURCE.replace("documented", "helper"))
+
+        AutoGenerator().generate_for_package("pkg", workers=1)
+
+        assert "from pkg.a.utils import helper\n" in Path("tests/test_a_utils.py").read_text()
+        assert "from pkg.b.utils import helper\n" in Path("tests/test_b_utils.py").read_text()
+        shared = Path("tests/test_a_utils.py").read_text()
+        assert "from pkg.a_utils import helper as pkg_a_utils_helper" in shared
+        assert "def test_pkg_a_utils_helper():" in shared
+        assert "def test_helper():" in shared
+
+    def test_conditionally_defined_functions_get_tests(self):
+        """Public functions under module-level if/try are generated too."""
+        Path("pkg/compat.py").write_text(
+            "import sys\n"
+            "if sys.version_info >= (3, 8):\n"
+            "    def modern(x):\n"
+            "        return x\n"
+            "else:\n"
+            "    def modern(x):\n"
+            "        return x\n"
+            "try:\n"
+            "    import json\n"
+            "except ImportError:\n"
+            "    def loads(text):\n"
+            "        return text\n"
+        )
+
+        AutoGenerator().generate_for_package("pkg/compat.py", workers=1)
+
+        test_compat = Path("tests/test_compat.py").read_text()
+        assert test_compat.count("def test_modern():") == 1
+        assert "def test_loads():" in test_compat
+        assert ast.get_docstring(ast.parse(Path("pkg/compat.py").read_text()).body[1].body[0])
@@ -0,0 +1,77 @@
+"""
+Tests for per-rule and per-function timing of validator checks.
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from conftest import documented_function
+from quality_guard_exceptions import (
+    QualityGuardValidator,
+    check_timings,
+    enable_stats,
+    reset_stats,
+    stats,
+)
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+@pytest.mark.usefixtures("project_dir")
+class TestCheckTimings:
+    """Tests for the stats() API."""
+
+    def setup_method(self):
+        """Start each test with empty timings."""
+        self.was_enabled = check_timings.enabled
+        reset_stats()
+
+    def teardown_method(self):
+        """Restore timing state."""
+        enable_stats(self.was_enabled)
+        reset_stats()
+
+    def test_disabled_records_nothing(self):
+        """Without enable_stats() validation leaves no timings."""
+        enable_stats(False)
+        QualityGuardValidator().validate_function(documented_function)
+
+        assert stats() == {"enabled": False, "rules": {}, "functions": {}}
+
+    def test_timings_per_rule_and_function(self):
+        """Each executed check is counted per rule and per function."""
+        enable_stats()
+        validator = QualityGuardValidator()
+        validator.validate_function(documented_function)
+        validator.validate_function(documented_function)
+
+        snapshot = stats()
+        assert set(snapshot["rules"]) == {"documentation", "function_length", "complexity"}
+        assert snapshot["rules"]["complexity"]["count"] == 2
+        (key, entry), = snapshot["functions"].items()
+        assert key.endswith(":documented_function")
+        assert entry["count"] == 6
+        assert entry["total_ns"] >= entry["max_ns"] >= entry["mean_ns"] >= 0
+
+    def test_stats_file_written_at_exit(self, project_dir):
+        """QG_STATS_FILE enables timing and dumps JSON when the process ends."""
+        stats_file = project_dir / "qg-stats.json"
+        script = (
+            "import quality_guard_exceptions as qg\n"
+            "def sample():\n"
+            "    '''Sample function used by the timing test.'''\n"
+            "qg.QualityGuardValidator().validate_function(sample)\n"
+        )
+        env = dict(os.environ, QG_STATS_FILE=str(stats_file),
+                   PYTHONPATH=os.pathsep.join([str(REPO_ROOT), os.environ.get("PYTHONPATH", "")]))
+        (project_dir / "run_sample.py").write_text(script)
+        subprocess.run([sys.executable, "run_sample.py"], cwd=project_dir, env=env, check=True)
+
+        dumped = json.loads(stats_file.read_text())
+        assert dumped["enabled"] is True
+        assert dumped["rules"]["documentation"]["count"] == 1
@@ -0,0 +1,115 @@
+"""
+Tests for the shared, mtime-aware configuration registry.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+from unittest.mock import patch
+
+import pytest
+
+from conftest import undocumented_function, write_config
+from quality_guard_exceptions import (
+    ConfigRegistry,
+    QualityConfig,
+    QualityGuardException,
+    QualityGuardValidator,
+    config_registry,
+    enforce_quality,
+    find_project_root,
+)
+
+
+class TestConfigRegistry:
+    """Tests for ConfigRegistry snapshots."""
+
+    def setup_method(self):
+        """Create a project with a config file and a nested working dir."""
+        self.temp_dir = os.path.realpath(tempfile.mkdtemp())
+        self.original_cwd = os.getcwd()
+        self.config_path = os.path.join(self.temp_dir, "quality-guard.json")
+        self._write_config({"max_complexity": 5})
+        os.makedirs(os.path.join(self.temp_dir, "src", "pkg"))
+        os.chdir(os.path.join(self.temp_dir, "src", "pkg"))
+        self.registry = ConfigRegistry(reload_interval=3600)
+
+    def teardown_method(self):
+        """Cleanup after each test."""
+        os.chdir(self.original_cwd)
+        shutil.rmtree(self.temp_dir)
+
+    def _write_config(self, data):
+        with open(self.config_path, "w") as f:
+            json.dump(data, f)
+
+    def test_resolves_config_against_project_root(self):
+        """The config is found from a nested working directory."""
+        assert str(find_project_root()) == self.temp_dir
+        assert self.registry.snapshot().get("max_complexity") == 5
+
+    def test_snapshot_is_immutable(self):
+        """Snapshots cannot be modified by callers."""
+        snapshot = self.registry.snapshot()
+
+        with pytest.raises(TypeError):
+            snapshot.config["max_complexity"] = 99
+        assert isinstance(snapshot.get("test_patterns"), tuple)
+
+    def test_snapshot_does_no_io_within_interval(self):
+        """Repeated snapshots reuse the cached config without reading."""
+        first = self.registry.snapshot()
+
+        with patch("builtins.open") as mock_file, patch("os.stat") as mock_stat:
+            assert self.registry.snapshot() is first
+            assert not mock_file.called
+            assert not mock_stat.called
+
+    def test_reload_picks_up_changes(self):
+        """An explicit reload re-reads a modified config file."""
+        self.registry.snapshot()
+        self._write_config({"max_complexity": 7, "max_function_lines": 20})
+
+        assert self.registry.reload().get("max_complexity") == 7
+
+    def test_validator_uses_shared_config(self):
+        """Validators built without config do not construct a new one."""
+        with patch.object(QualityConfig, "_load_config") as mock_load:
+            QualityGuardValidator()
+            QualityGuardValidator()
+            assert mock_load.call_count <= 1
+
+
+@pytest.mark.usefixtures("project_dir")
+class TestConfigChangeReachesWrappers:
+    """Tests for wrappers that already cached a verdict."""
+
+    def test_reload_revalidates_called_wrapper(self):
+        """A reloaded config replaces the verdict a lazy wrapper stored."""
+        write_config(require_docstrings=False)
+        guarded = enforce_quality(undocumented_function)
+        assert guarded(1) == 1
+
+        with open("quality-guard.json", "w") as f:
+            json.dump({"require_tests": False, "require_docstrings": True}, f)
+        config_registry.reload()
+        with pytest.raises(QualityGuardException):
+            guarded(1)
+
+        with open("quality-guard.json", "w") as f:
+            json.dump({"require_tests": False, "require_docstrings": False}, f)
+        config_registry.reload()
+        assert guarded(1) == 1
+
+    def test_unchanged_config_keeps_verdict(self):
+        """Reloading an identical config does not revalidate."""
+        guarded = enforce_quality(undocumented_function)
+        with pytest.raises(QualityGuardException):
+            guarded(1)
+
+        config_registry.reload()
+        with patch.object(QualityGuardValidator, "validate_function") as mock_validate:
+            with pytest.raises(QualityGuardException):
+                guarded(1)
+        assert not mock_validate.called
@@ -0,0 +1,168 @@
+"""
+Tests for the import-once behaviour of QualityGuardInstaller.install_globally.
+"""
+
+import importlib
+import sys
+import warnings
+from unittest.mock import patch
+
+import pytest
+
+from conftest import write_config
+from quality_guard_exceptions import (
+    QUALITY_GUARD_MARKER,
+    QualityGuardException,
+    QualityGuardImportFinder,
+    QualityGuardInstaller,
+    QualityGuardWarning,
+    enforce_quality,
+    static_violations,
+    verdict_cache,
+)
+
+MODULE_SOURCE = '''
+def greet(name):
+    """Returns a greeting for the given name."""
+    return "hello " + name
+
+
+def _private_helper():
+    return None
+
+
+class Greeter:
+    """Greets people by name."""
+
+    def greet(self, name):
+        """Returns a greeting for the given name."""
+        return "hello " + name
+'''
+
+BAD_MODULE_SOURCE = '''
+def shout(text):
+    return text.upper()
+'''
+
+
+class TestGlobalInstall:
+    """Tests for the meta_path based installer."""
+
+    @pytest.fixture(autouse=True)
+    def sample_module(self, project_dir, monkeypatch):
+        """Make a user module importable and install the hook; forget both afterwards."""
+        (project_dir / "qg_sample_module.py").write_text(MODULE_SOURCE)
+        monkeypatch.syspath_prepend(str(project_dir))
+        QualityGuardInstaller.install_globally()
+        yield
+        QualityGuardInstaller.uninstall_globally()
+        sys.modules.pop("qg_sample_module", None)
+
+    def test_installs_single_meta_path_finder(self):
+        """Repeated installs keep one finder in sys.meta_path."""
+        QualityGuardInstaller.install_globally()
+
+        finders = [f for f in sys.meta_path if isinstance(f, QualityGuardImportFinder)]
+        assert len(finders) == 1
+
+    def test_public_functions_wrapped_once(self):
+        """Public module functions are wrapped and marked."""
+        module = importlib.import_module("qg_sample_module")
+
+        assert getattr(module.greet, QUALITY_GUARD_MARKER, False)
+        assert module.greet.__wrapped__.__name__ == "greet"
+        assert not hasattr(module._private_helper, QUALITY_GUARD_MARKER)
+        assert module.greet("bob") == "hello bob"
+
+    def test_cached_imports_do_not_reprocess(self):
+        """Importing an already loaded module does not touch it again."""
+        module = importlib.import_module("qg_sample_module")
+        wrapped = module.greet
+
+        with patch.object(QualityGuardInstaller, "_add_quality_guard_to_module") as mock_add:
+            from qg_sample_module import greet
+            importlib.import_module("qg_sample_module")
+            assert not mock_add.called
+
+        assert greet is wrapped
+
+    def test_marked_callables_are_not_rewrapped(self):
+        """Processing a module skips callables that carry the marker."""
+        module = importlib.import_module("qg_sample_module")
+        wrapped = module.greet
+
+        QualityGuardInstaller._add_quality_guard_to_module(module)
+        importlib.reload(module)
+
+        assert module.greet is not wrapped
+        assert module.greet.__wrapped__.__name__ == "greet"
+        assert not hasattr(module.greet.__wrapped__, QUALITY_GUARD_MARKER)
+
+    def test_decorated_wrapper_carries_marker(self):
+        """Wrappers built by enforce_quality are marked."""
+        def sample():
+            """Sample function used by the marker test."""
+
+        assert getattr(enforce_quality(sample), QUALITY_GUARD_MARKER, False)
+
+    def test_classes_are_not_replaced(self):
+        """Wrap mode leaves classes usable with isinstance."""
+        module = importlib.import_module("qg_sample_module")
+
+        assert isinstance(module.Greeter(), module.Greeter)
+
+
+class TestStaticInstall:
+    """Tests for the wrapper-free static install mode."""
+
+    @pytest.fixture(autouse=True)
+    def sample_modules(self, project_dir, monkeypatch):
+        """Make user modules importable and install the hook; forget them afterwards."""
+        (project_dir / "qg_static_good.py").write_text(MODULE_SOURCE)
+        (project_dir / "qg_static_bad.py").write_text(BAD_MODULE_SOURCE)
+        monkeypatch.syspath_prepend(str(project_dir))
+        self._install("error")
+        yield
+        QualityGuardInstaller.uninstall_globally()
+        for name in ("qg_static_good", "qg_static_bad"):
+            sys.modules.pop(name, None)
+            static_violations.pop(name, None)
+
+    def _install(self, level):
+        write_config(enforcement_level=level)
+        QualityGuardInstaller.install_globally(mode="static")
+
+    def test_namespace_left_untouched(self):
+        """Functions and classes keep their identity and primed verdicts."""
+        module = importlib.import_module("qg_static_good")
+
+        assert not hasattr(module.greet, QUALITY_GUARD_MARKER)
+        assert not hasattr(module.greet, "__wrapped__")
+        assert isinstance(module.Greeter(), module.Greeter)
+        assert verdict_cache.get(module.greet.__code__).error is None
+
+    def test_error_level_blocks_import(self):
+        """A critical violation stops the module from being imported."""
+        with pytest.raises(QualityGuardException):
+            importlib.import_module("qg_static_bad")
+
+        assert "qg_static_bad" not in sys.modules
+
+    def test_warning_level_warns_and_records(self):
+        """Below error level the module imports with a recorded verdict."""
+        self._install("warning")
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            module = importlib.import_module("qg_static_bad")
+
+        assert module.shout("a") == "A"
+        assert any(issubclass(w.category, QualityGuardWarning) for w in caught)
+        assert [v.rule_name for v in static_violations["qg_static_bad"]] == ["missing_docstring"]
+
+    def test_switching_mode_replaces_finder(self):
+        """Installing another mode keeps a single finder with that mode."""
+        QualityGuardInstaller.install_globally(mode="wrap")
+
+        finders = [f for f in sys.meta_path if isinstance(f, QualityGuardImportFinder)]
+        assert [f.mode for f in finders] == ["wrap"]
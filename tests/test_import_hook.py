@@ -0,0 +1,135 @@
+"""
+Tests for the bytecode-cache-aware QualityGuardLoader in quality_guard_hook.
+"""
+
+import importlib.util
+import json
+import os
+import sys
+from importlib.machinery import SourceFileLoader
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from conftest import write_config
+from quality_guard_exceptions import (
+    PathClassifier,
+    QualityGuardValidator,
+    get_prevalidator,
+    verdict_cache,
+    verdicts_cache_path,
+)
+from quality_guard_hook import (
+    QualityGuardFinder,
+    QualityGuardLoader,
+    install_import_hook,
+    uninstall_import_hook,
+)
+
+# Importing the hook installs it; these tests drive the loader directly
+uninstall_import_hook()
+
+MODULE_SOURCE = '''
+def greet(name):
+    """Returns a greeting for the given name."""
+    return "hello " + name
+
+
+def shout(text):
+    return text.upper()
+'''
+
+
+class TestQualityGuardLoader:
+    """Tests for pyc reuse and persisted verdicts."""
+
+    @pytest.fixture(autouse=True)
+    def sample_module(self, project_dir, monkeypatch):
+        """Write a user module into the project directory, with bytecode writing on."""
+        self._write_config(10)
+        self.path = str(project_dir / "qg_hook_sample.py")
+        Path(self.path).write_text(MODULE_SOURCE)
+        monkeypatch.setattr(sys, "dont_write_bytecode", False)
+        yield
+        uninstall_import_hook()
+
+    def _write_config(self, max_complexity):
+        write_config(validation_mode="lazy", max_complexity=max_complexity)
+
+    def _load(self):
+        loader = QualityGuardLoader("qg_hook_sample", self.path)
+        spec = importlib.util.spec_from_file_location("qg_hook_sample", self.path, loader=loader)
+        module = importlib.util.module_from_spec(spec)
+        loader.exec_module(module)
+        return module
+
+    def test_writes_pyc_and_verdicts(self):
+        """The first import stores bytecode and verdicts in __pycache__."""
+        module = self._load()
+
+        assert module.greet("bob") == "hello bob"
+        assert os.path.exists(importlib.util.cache_from_source(self.path))
+        with open(verdicts_cache_path(self.path)) as f:
+            data = json.load(f)
+        assert [v["rule_name"] for v in data["violations"]["shout"]] == ["missing_docstring"]
+
+    def test_second_import_skips_compile_and_validation(self):
+        """An unchanged module is loaded from pyc with persisted verdicts."""
+        self._load()
+        verdict_cache.clear()
+
+        with patch.object(SourceFileLoader, "source_to_code") as mock_compile, \
+                patch.object(QualityGuardValidator, "validate_module") as mock_validate:
+            module = self._load()
+            assert module.greet("ann") == "hello ann"
+
+        assert not mock_compile.called
+        assert not mock_validate.called
+        assert verdict_cache.get(module.greet.__wrapped__.__code__).error is None
+
+    def test_config_change_revalidates(self):
+        """A different rule configuration invalidates the stored verdicts."""
+        self._load()
+        self._write_config(1)
+
+        with patch.object(QualityGuardValidator, "validate_module", autospec=True,
+                          side_effect=QualityGuardValidator.validate_module) as mock_validate:
+            self._load()
+
+        assert mock_validate.call_count == 1
+
+    def test_prevalidation_persists_verdicts(self):
+        """Install-time prevalidation leaves verdicts for the loader next to the pyc."""
+        install_import_hook(prevalidate=True)
+        assert get_prevalidator().wait(60)
+
+        with patch.object(QualityGuardValidator, "validate_module") as mock_validate:
+            module = self._load()
+
+        assert not mock_validate.called
+        assert os.path.exists(verdicts_cache_path(self.path))
+        assert module.greet("eve") == "hello eve"
+
+
+def test_project_module_with_stdlib_name_is_guarded(project_dir):
+    """A project package named like a stdlib module is still user code."""
+    (project_dir / "code").mkdir()
+    (project_dir / "code" / "__init__.py").write_text(MODULE_SOURCE)
+    finder = QualityGuardFinder(PathClassifier([project_dir]))
+
+    assert isinstance(finder.find_spec("code", [str(project_dir)]).loader, QualityGuardLoader)
+    assert not isinstance(finder.find_spec("json", None).loader, QualityGuardLoader)
+
+
+def test_hook_import_without_companion_module():
+    """Importing the hook without quality_guard_exceptions installs nothing."""
+    hook_path = Path(__file__).resolve().parent.parent / "quality_guard_hook.py"
+    spec = importlib.util.spec_from_file_location("qg_hook_standalone", hook_path)
+    module = importlib.util.module_from_spec(spec)
+    meta_path = list(sys.meta_path)
+
+    with patch.dict(sys.modules, {"quality_guard_exceptions": None}):
+        spec.loader.exec_module(module)
+
+    assert sys.meta_path == meta_path
@@ -0,0 +1,99 @@
+"""
+Tests for whole-module batch validation.
+"""
+
+import importlib.util
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import quality_guard_exceptions
+from quality_guard_exceptions import (
+    QualityConfig,
+    QualityGuardValidator,
+    prime_module_verdicts,
+    source_cache,
+    validate_module,
+    verdict_cache,
+)
+
+MODULE_SOURCE = '''
+def documented(x):
+    """Returns x unchanged for the test."""
+    return x
+
+
+def undocumented(x):
+    def inner(y):
+        return y
+    return inner(x)
+
+
+class Service:
+    def method(self):
+        """Method with enough documentation."""
+        return 1
+
+    @staticmethod
+    def helper():
+        return 2
+'''
+
+
+class TestModuleValidation:
+    """Tests for validate_module and verdict priming."""
+
+    def setup_method(self):
+        """Write and import a sample module from a temporary directory."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.module_path = os.path.join(self.temp_dir, "batch_module.py")
+        Path(self.module_path).write_text(MODULE_SOURCE)
+        spec = importlib.util.spec_from_file_location("batch_module", self.module_path)
+        self.module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(self.module)
+        self.config = QualityConfig("missing-config.json")
+        self.config.config["require_tests"] = False
+        source_cache.clear()
+        verdict_cache.clear()
+
+    def teardown_method(self):
+        """Cleanup after each test."""
+        shutil.rmtree(self.temp_dir)
+        source_cache.clear()
+        verdict_cache.clear()
+
+    def test_table_covers_all_qualnames(self):
+        """Functions, methods and nested functions get verdicts."""
+        verdicts = validate_module(self.module_path, self.config)
+
+        assert set(dict(verdicts.items())) == {
+            "documented",
+            "undocumented",
+            "undocumented.<locals>.inner",
+            "Service.method",
+            "Service.helper",
+        }
+        assert verdicts["documented"] == ()
+        assert verdicts["undocumented"][0].rule_name == "missing_docstring"
+        assert verdicts.verdict("Service.method").error is None
+
+    def test_single_parse_for_module(self):
+        """A module table costs one parse."""
+        with patch.object(quality_guard_exceptions.ast, "parse",
+                          wraps=quality_guard_exceptions.ast.parse) as mock_parse:
+            validate_module(self.module, self.config)
+            assert mock_parse.call_count == 1
+
+    def test_prime_fills_verdict_cache(self):
+        """Primed functions are answered from the cache without validation."""
+        verdicts = prime_module_verdicts(self.module)
+
+        assert len(verdicts) == 5
+        assert verdict_cache.get(self.module.documented.__code__) is not None
+        assert verdict_cache.get(self.module.Service.helper.__code__) is not None
+
+        with patch.object(QualityGuardValidator, "validate_function") as mock_validate:
+            verdict_cache.verdict_for(self.module.undocumented)
+            assert not mock_validate.called
@@ -0,0 +1,86 @@
+"""
+Tests for the PathClassifier used by the import hooks.
+"""
+
+import json
+import os
+import shutil
+import sysconfig
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+from quality_guard_exceptions import PathClassifier, config_registry
+
+
+class TestPathClassifier:
+    """Tests for longest-prefix user/library decisions."""
+
+    def setup_method(self):
+        """Create a project directory with a vendored virtualenv."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.project = Path(self.temp_dir, "project")
+        (self.project / "app").mkdir(parents=True)
+        self.classifier = PathClassifier([self.project])
+
+    def teardown_method(self):
+        """Remove the temporary directory."""
+        shutil.rmtree(self.temp_dir)
+        config_registry.reset()
+
+    def test_project_and_library_paths(self):
+        """Project files are user code, stdlib and site-packages are not."""
+        stdlib = sysconfig.get_paths()["stdlib"]
+
+        assert self.classifier.is_user_path(str(self.project / "app" / "views.py"))
+        assert not self.classifier.is_user_path(os.path.join(stdlib, "json", "__init__.py"))
+        assert not self.classifier.is_user_path(
+            str(self.project / ".venv" / "lib" / "site-packages" / "requests" / "api.py"))
+        assert not self.classifier.is_user_path("<frozen importlib._bootstrap>")
+
+    def test_longest_prefix_wins(self):
+        """A user root nested in a library root is user code."""
+        library = Path(self.temp_dir, "vendor")
+        classifier = PathClassifier([library / "ours"])
+        classifier.add(library, user=False)
+
+        assert classifier.is_user_path(str(library / "ours" / "mod.py"))
+        assert not classifier.is_user_path(str(library / "theirs" / "mod.py"))
+
+    def test_module_decision_is_memoized(self):
+        """Names are classified once; stdlib names skip the path lookup."""
+        origin = str(self.project / "app" / "views.py")
+        with patch.object(PathClassifier, "is_user_path", autospec=True,
+                          side_effect=PathClassifier.is_user_path) as mock_lookup:
+            assert self.classifier.is_user_module("app.views", origin)
+            assert self.classifier.is_user_module("app.views", origin)
+            assert not self.classifier.is_user_module("json.decoder", "/anywhere/json/decoder.py")
+            assert not self.classifier.is_user_module("quality_guard_exceptions", origin)
+
+        assert mock_lookup.call_count == 1
+
+    def test_stdlib_name_under_project_is_user_code(self):
+        """A project package called like a stdlib module is decided by its origin."""
+        stdlib = sysconfig.get_paths()["stdlib"]
+
+        assert self.classifier.is_user_module("parser", str(self.project / "parser" / "__init__.py"))
+        assert not self.classifier.is_user_module("code", os.path.join(stdlib, "code.py"))
+        assert not self.classifier.is_library_name("test.helpers")
+        assert self.classifier.is_library_name("quality_guard_hook")
+
+    def test_project_roots_from_config(self):
+        """Extra roots from the config are resolved against the project."""
+        os_cwd = os.getcwd()
+        os.chdir(self.project)
+        try:
+            with open("quality-guard.json", "w") as f:
+                json.dump({"project_roots": ["../shared"]}, f)
+            config_registry.reset()
+            classifier = PathClassifier.from_config()
+            classifier.add(self.temp_dir, user=False)
+        finally:
+            os.chdir(os_cwd)
+
+        assert classifier.is_user_path(str(Path(self.temp_dir, "shared", "lib.py")))
+        assert classifier.is_user_path(str(self.project / "app" / "views.py"))
+        assert not classifier.is_user_path(str(Path(self.temp_dir, "other", "lib.py")))
@@ -0,0 +1,171 @@
+"""
+Tests for background prevalidation of the project tree at hook install.
+"""
+
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import Future
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from conftest import write_config
+from quality_guard_exceptions import (
+    Prevalidator,
+    QualityGuardInstaller,
+    QualityGuardValidator,
+    QualityGuardWarning,
+    config_registry,
+    get_prevalidator,
+    prevalidated_verdicts,
+    static_violations,
+    stop_prevalidation,
+    validate_module,
+)
+
+MODULE_SOURCE = '''
+def greet(name):
+    """Returns a greeting for the given name."""
+    return "hello " + name
+
+
+def shout(text):
+    return text.upper()
+'''
+
+
+class TestPrevalidation:
+    """Tests for the shared verdict table filled by a process pool."""
+
+    @pytest.fixture(autouse=True)
+    def project(self, project_dir):
+        """Create a small project with a few user modules; stop the pool afterwards."""
+        write_config(install_mode="static", enforcement_level="warning")
+        for index in range(4):
+            (project_dir / f"qg_prevalidated_{index}.py").write_text(MODULE_SOURCE)
+        (project_dir / ".hidden").mkdir()
+        (project_dir / ".hidden" / "skipped.py").write_text(MODULE_SOURCE)
+        self.temp_dir = str(project_dir)
+        self.path = str(project_dir / "qg_prevalidated_0.py")
+        yield
+        stop_prevalidation()
+        QualityGuardInstaller.uninstall_globally()
+        for index in range(4):
+            sys.modules.pop(f"qg_prevalidated_{index}", None)
+        if self.temp_dir in sys.path:
+            sys.path.remove(self.temp_dir)
+        static_violations.clear()
+
+    def test_verdicts_match_inline_validation(self):
+        """Verdicts from the pool equal a direct validate_module call."""
+        prevalidator = Prevalidator([self.temp_dir], workers=2).start()
+        try:
+            assert prevalidator.wait(60)
+            verdicts = prevalidator.verdicts_for(self.path)
+        finally:
+            prevalidator.stop()
+
+        expected = validate_module(self.path)
+        assert len(prevalidator) == 4
+        assert verdicts.first_lines == expected.first_lines
+        assert list(verdicts["shout"]) == list(expected["shout"])
+        assert verdicts["greet"] == ()
+
+    def test_unsubmitted_file_is_claimed_by_loader(self):
+        """A file the pool has not reached is validated inline, not twice."""
+        prevalidator = Prevalidator([self.temp_dir], workers=2)
+        assert prevalidator.verdicts_for(self.path) is None
+
+        prevalidator.start()
+        try:
+            assert prevalidator.wait(60)
+            assert prevalidator.verdicts_for(self.path) is None
+        finally:
+            prevalidator.stop()
+        assert len(prevalidator) == 3
+
+    def test_changed_file_is_not_trusted(self):
+        """Verdicts for a file edited after prevalidation are discarded."""
+        prevalidator = Prevalidator([self.temp_dir], workers=2).start()
+        try:
+            assert prevalidator.wait(60)
+            stat = os.stat(self.path)
+            Path(self.path).write_text(MODULE_SOURCE + "\n\nVALUE = 1\n")
+            os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+            assert prevalidator.verdicts_for(self.path) is None
+        finally:
+            prevalidator.stop()
+
+    def test_changed_rules_are_not_trusted(self):
+        """Verdicts computed under rules replaced by a config reload are discarded."""
+        prevalidator = Prevalidator([self.temp_dir], workers=2).start()
+        try:
+            assert prevalidator.wait(60)
+            write_config(install_mode="static", enforcement_level="warning", max_complexity=1)
+            config_registry.reload()
+            assert prevalidator.verdicts_for(self.path) is None
+        finally:
+            prevalidator.stop()
+
+    def test_workers_start_before_feeder_thread(self):
+        """Worker processes are forked by start(), not by the background thread."""
+        prevalidator = Prevalidator([self.temp_dir], workers=2)
+        seen = []
+        with patch.object(Prevalidator, "_feed", lambda self: seen.append(len(self._pool._processes))):
+            prevalidator.start()
+            prevalidator._thread.join(10)
+        prevalidator.stop()
+        assert seen == [2]
+
+    @pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(), reason="no fork here")
+    def test_pool_forks_where_available(self):
+        """Workers are forked, so they do not re-import __main__."""
+        prevalidator = Prevalidator([self.temp_dir], workers=1).start()
+        try:
+            assert prevalidator._pool._mp_context.get_start_method() == "fork"
+        finally:
+            prevalidator.stop()
+
+    def test_start_in_worker_process_is_noop(self):
+        """A child process re-running the install does not start its own pool."""
+        prevalidator = Prevalidator([self.temp_dir], workers=1)
+        with patch.object(multiprocessing, "current_process",
+                          return_value=SimpleNamespace(name="SpawnProcess-1")):
+            prevalidator.start()
+
+        assert prevalidator._pool is None
+        assert prevalidator.verdicts_for(self.path) is None
+        prevalidator.stop()
+
+    def test_stuck_worker_falls_back_to_inline_validation(self):
+        """A file whose worker never answers is validated inline after the timeout."""
+        prevalidator = Prevalidator([self.temp_dir], workers=1, timeout=0.1)
+        stuck = Future()
+        stuck.set_running_or_notify_cancel()
+        prevalidator._futures[self.path] = stuck
+
+        started = time.monotonic()
+        assert prevalidator.verdicts_for(self.path) is None
+        assert time.monotonic() - started < 5
+
+    def test_install_uses_prevalidated_verdicts(self):
+        """Imports after install take their verdict from the shared table."""
+        sys.path.insert(0, self.temp_dir)
+        QualityGuardInstaller.install_globally(prevalidate=True)
+        assert prevalidated_verdicts(str(Path(self.temp_dir, "unknown.py"))) is None
+
+        assert get_prevalidator().wait(60)
+
+        with patch.object(QualityGuardValidator, "validate_module") as mock_validate, \
+                pytest.warns(QualityGuardWarning):
+            import qg_prevalidated_1
+        assert not mock_validate.called
+        assert [v.function_name for v in static_violations["qg_prevalidated_1"]] == ["shout"]
+        assert qg_prevalidated_1.greet("x") == "hello x"
+
+        QualityGuardInstaller.uninstall_globally()
+        assert prevalidated_verdicts(self.path) is None
@@ -0,0 +1,72 @@
+"""
+Tests for the Prometheus text exposition of enforcement metrics.
+"""
+
+import pytest
+
+from conftest import documented_function, undocumented_function
+from quality_guard_exceptions import (
+    QualityGuardException,
+    dump_prometheus_metrics,
+    enforce_quality,
+    enforcement_metrics,
+    prometheus_metrics,
+)
+
+
+def _samples(text):
+    samples = {}
+    for line in text.splitlines():
+        if line and not line.startswith("#"):
+            name, value = line.rsplit(" ", 1)
+            samples[name] = float(value)
+    return samples
+
+
+@pytest.mark.usefixtures("project_dir")
+class TestPrometheusMetrics:
+    """Tests for counters, histogram and text format."""
+
+    def setup_method(self):
+        """Start each test with empty metrics."""
+        enforcement_metrics.reset()
+
+    def teardown_method(self):
+        """Drop the metrics recorded by the test."""
+        enforcement_metrics.reset()
+
+    def test_counters_follow_enforcement(self):
+        """Validations, cache lookups and violations by rule are counted."""
+        good = enforce_quality(documented_function)
+        good(1, 2)
+        good(1, 2)
+        enforce_quality(documented_function)(1, 2)
+        with pytest.raises(QualityGuardException):
+            enforce_quality(undocumented_function)(1)
+
+        samples = _samples(prometheus_metrics())
+        assert samples["quality_guard_validations_total"] == 2
+        assert samples['quality_guard_verdict_cache_requests_total{result="miss"}'] == 2
+        assert samples['quality_guard_verdict_cache_requests_total{result="hit"}'] == 1
+        assert samples['quality_guard_violations_total{rule="missing_docstring"}'] == 1
+
+    def test_overhead_histogram_is_cumulative(self):
+        """Bucket counts are cumulative and end with +Inf equal to count."""
+        for elapsed in (50, 5_000, 5_000_000, 10 ** 9):
+            enforcement_metrics.observe_overhead(elapsed)
+
+        samples = _samples(prometheus_metrics())
+        assert samples['quality_guard_wrapper_overhead_ns_bucket{le="100"}'] == 1
+        assert samples['quality_guard_wrapper_overhead_ns_bucket{le="10000"}'] == 2
+        assert samples['quality_guard_wrapper_overhead_ns_bucket{le="+Inf"}'] == 4
+        assert samples["quality_guard_wrapper_overhead_ns_count"] == 4
+        assert samples["quality_guard_wrapper_overhead_ns_sum"] == 50 + 5_000 + 5_000_000 + 10 ** 9
+
+    def test_dump_writes_textfile(self, project_dir):
+        """The textfile dump matches the callable output."""
+        path = project_dir / "textfile" / "quality_guard.prom"
+        dump_prometheus_metrics(path)
+
+        text = path.read_text()
+        assert text == prometheus_metrics()
+        assert "# TYPE quality_guard_wrapper_overhead_ns histogram" in text
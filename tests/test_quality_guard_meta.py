@@ -0,0 +1,129 @@
+"""
+Tests for class-level validation in QualityGuardMeta.
+"""
+
+import pytest
+
+from conftest import write_config
+from quality_guard_exceptions import (
+    QUALITY_GUARD_MARKER,
+    QualityGuardException,
+    QualityGuardMeta,
+    get_telemetry_sink,
+    reset_sampling_stats,
+    sampling_summary,
+)
+
+
+@pytest.mark.usefixtures("project_dir")
+class TestQualityGuardMeta:
+    """Tests for validate-at-class-creation behaviour."""
+
+    def setup_method(self):
+        """Start each test with empty sampling counters."""
+        reset_sampling_stats()
+
+    def teardown_method(self):
+        """Drop the sampling counters of the test."""
+        reset_sampling_stats()
+
+    def test_passing_methods_left_unwrapped(self):
+        """Methods, static/class methods and properties stay untouched."""
+        def process(self, data):
+            """Doubles the given data value."""
+            return data * 2
+
+        class Service(metaclass=QualityGuardMeta):
+            run = process
+
+            @staticmethod
+            def build():
+                """Builds a default service value."""
+                return 1
+
+            @classmethod
+            def create(cls):
+                """Creates a new service instance."""
+                return cls()
+
+            @property
+            def name(self):
+                """Returns the service name string."""
+                return "service"
+
+        assert Service.__dict__["run"] is process
+        assert isinstance(Service.__dict__["build"], staticmethod)
+        assert isinstance(Service.__dict__["create"], classmethod)
+        assert Service().name == "service"
+        assert Service().run(2) == 4
+        assert Service.__quality_violations__ == []
+
+    def test_violation_raised_at_class_creation(self):
+        """error level raises while the class is being defined."""
+        with pytest.raises(QualityGuardException) as exc_info:
+            class Service(metaclass=QualityGuardMeta):
+                @staticmethod
+                def build():
+                    return 1
+
+        assert exc_info.value.violations[0].function_name == "build"
+
+    def test_violation_recorded_below_error_level(self):
+        """warning level records violations without raising."""
+        write_config(enforcement_level="warning")
+
+        class Service(metaclass=QualityGuardMeta):
+            def run(self):
+                return 1
+
+        assert Service.__quality_violations__[0].rule_name == "missing_docstring"
+        assert not hasattr(Service.run, QUALITY_GUARD_MARKER)
+
+    def test_opt_in_telemetry_wrapper(self):
+        """quality_telemetry adds a sampled wrapper and keeps descriptor kinds."""
+        class Service(metaclass=QualityGuardMeta, quality_telemetry={"every_n": 10}):
+            def run(self):
+                """Runs the service once and returns one."""
+                return 1
+
+            @staticmethod
+            def build():
+                """Builds a default service value."""
+                return 2
+
+        assert getattr(Service.run, QUALITY_GUARD_MARKER, False)
+        assert isinstance(Service.__dict__["build"], staticmethod)
+        for _ in range(20):
+            Service().run()
+
+        summary = sampling_summary()
+        run_stats = next(v for k, v in summary.items() if k.endswith("Service.run"))
+        assert run_stats == {"calls": 20, "sampled": 2, "skipped": 18}
+
+    def test_telemetry_wrapper_never_raises(self):
+        """Sampled calls of a violating method are recorded, not raised."""
+        write_config(enforcement_level="warning")
+
+        class Service(metaclass=QualityGuardMeta, quality_telemetry={"every_n": 1}):
+            def run(self):
+                return 1
+
+        assert Service.__quality_violations__[0].rule_name == "missing_docstring"
+        for _ in range(3):
+            assert Service().run() == 1
+
+        sink = get_telemetry_sink()
+        assert sink.flush()
+        counts = [count for (rule, function, _), count in sink.counters().items()
+                  if rule == "missing_docstring" and function == "run"]
+        assert counts == [3]
+
+    def test_class_without_source_is_defined(self):
+        """Methods with no retrievable source are skipped, not fatal."""
+        namespace = {"QualityGuardMeta": QualityGuardMeta}
+        exec("class Service(metaclass=QualityGuardMeta):\n"
+             "    def run(self):\n"
+             "        return 1\n", namespace)
+
+        assert namespace["Service"]().run() == 1
+        assert namespace["Service"].__quality_violations__ == []
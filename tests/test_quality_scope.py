@@ -0,0 +1,103 @@
+"""
+Tests for QualityScope - validation of functions called inside a with block.
+"""
+
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from conftest import write_config
+from quality_guard_exceptions import (
+    QualityGuardException,
+    QualityGuardValidator,
+    QualityScope,
+)
+
+
+# Each test calls its own functions: on Python 3.12+ a function reported in one
+# scope stays disabled for the monitoring tool and is not reported by later ones
+
+
+def passing_function(x, y):
+    """Adds two numbers and returns the result."""
+    return x + y
+
+
+def repeated_function(x, y):
+    """Adds two numbers and returns the result."""
+    return x + y
+
+
+def raising_function(x):
+    return x
+
+
+def recorded_function(x):
+    return x
+
+
+def reported_once_function(x):
+    return x
+
+
+@pytest.mark.usefixtures("project_dir")
+class TestQualityScope:
+    """Tests for scoped enforcement without wrappers."""
+
+    def test_passing_functions_run_untouched(self):
+        """Calls inside the scope behave normally and leave no violations."""
+        with QualityScope() as scope:
+            assert passing_function(1, 2) == 3
+
+        assert scope.violations == []
+
+    def test_violation_raised_on_exit(self):
+        """A critical violation is reported when the block ends."""
+        with pytest.raises(QualityGuardException):
+            with QualityScope():
+                assert raising_function(5) == 5
+
+    def test_warning_level_only_records(self):
+        """Below error level violations are collected, not raised."""
+        write_config(enforcement_level="warning")
+
+        with QualityScope() as scope:
+            recorded_function(1)
+
+        assert [v.rule_name for v in scope.violations] == ["missing_docstring"]
+
+    def test_each_function_validated_once(self):
+        """Repeated calls do not trigger another validation."""
+        with patch.object(QualityGuardValidator, "validate_code", autospec=True,
+                          side_effect=QualityGuardValidator.validate_code) as mock_validate:
+            with QualityScope():
+                for i in range(10):
+                    repeated_function(i, i)
+
+        assert mock_validate.call_count == 1
+
+    @pytest.mark.skipif(not hasattr(sys, "monitoring"), reason="sys.monitoring needs Python 3.12+")
+    def test_other_tools_keep_disabled_events(self):
+        """Entering a scope does not re-enable events other tools disabled."""
+        write_config(enforcement_level="warning")
+        with patch.object(sys.monitoring, "restart_events") as mock_restart:
+            with QualityScope() as first:
+                reported_once_function(1)
+            with QualityScope() as second:
+                reported_once_function(1)
+
+        assert not mock_restart.called
+        assert len(first.violations) == 1
+        assert second.violations == []
+
+    def test_hooks_removed_on_exit(self):
+        """The profiler or monitoring tool is released after the block."""
+        previous = sys.getprofile()
+        with QualityScope():
+            pass
+
+        assert sys.getprofile() is previous
+        monitoring = getattr(sys, "monitoring", None)
+        if monitoring is not None:
+            assert monitoring.get_tool(monitoring.PROFILER_ID) is None
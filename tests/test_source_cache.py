@@ -0,0 +1,171 @@
+"""
+Tests for the shared per-module source and AST cache.
+"""
+
+import ast
+import importlib.util
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import quality_guard_exceptions
+from quality_guard_exceptions import (
+    QualityConfig,
+    QualityGuardValidator,
+    SourceCache,
+    source_cache,
+    validate_module,
+)
+
+MODULE_SOURCE = '''
+def plain(x):
+    """Returns x unchanged for the test."""
+    return x
+
+
+def decorated_helper(func):
+    return func
+
+
+@decorated_helper
+def decorated(x):
+    """Decorated function with a branch."""
+    if x:
+        return 1
+    return 0
+
+
+class Service:
+    def method(self, value):
+        """Method with a loop."""
+        for item in value:
+            if item:
+                return item
+'''
+
+
+BRANCHY_SOURCE = '''
+import sys
+
+if sys.platform:
+    def chosen(x):
+        """Returns x."""
+        return (x,
+                x)
+    # trailing comment
+else:
+    def chosen(x):
+        return x
+
+
+def last(value):
+    """Counts down."""
+    while value:
+        value -= 1
+    return value
+'''
+
+
+_ast_parse = ast.parse
+
+
+def _parse_without_end_lines(source, *args, **kwargs):
+    """ast.parse as on Python 3.7, which has no end_lineno."""
+    tree = _ast_parse(source, *args, **kwargs)
+    for node in ast.walk(tree):
+        node.__dict__.pop("end_lineno", None)
+    return tree
+
+
+class TestSourceCache:
+    """Tests for SourceCache parsing and invalidation."""
+
+    def setup_method(self):
+        """Write a sample module to a temporary directory and import it."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.module_path = os.path.join(self.temp_dir, "sample_module.py")
+        Path(self.module_path).write_text(MODULE_SOURCE)
+        spec = importlib.util.spec_from_file_location("sample_module", self.module_path)
+        self.module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(self.module)
+        source_cache.clear()
+
+    def teardown_method(self):
+        """Cleanup after each test."""
+        shutil.rmtree(self.temp_dir)
+        source_cache.clear()
+
+    def test_maps_functions_to_nodes(self):
+        """Plain, decorated and method functions resolve to their nodes."""
+        cache = SourceCache()
+
+        assert cache.function_source(self.module.plain).node.name == "plain"
+        decorated = cache.function_source(self.module.decorated)
+        assert decorated.node.name == "decorated"
+        assert decorated.lines[0].startswith("@decorated_helper")
+        assert cache.function_source(self.module.Service.method).node.name == "method"
+
+    def test_function_metrics_cached_on_source(self):
+        """Metrics are computed once and reused for the same function."""
+        cache = SourceCache()
+        source = cache.function_source(self.module.Service.method)
+
+        assert source.metrics.complexity == 3
+        assert source.metrics.depth == 2
+        assert source.metrics.params == 2
+        assert cache.function_source(self.module.Service.method).metrics is source.metrics
+
+    def test_module_parsed_once_for_all_functions(self):
+        """Validating every function in a module costs one parse."""
+        config = QualityConfig("missing-config.json")
+        config.config["require_tests"] = False
+        validator = QualityGuardValidator(config)
+
+        with patch.object(quality_guard_exceptions.ast, "parse",
+                          wraps=quality_guard_exceptions.ast.parse) as mock_parse:
+            for func in (self.module.plain, self.module.decorated, self.module.Service.method):
+                validator.validate_function(func)
+            assert mock_parse.call_count == 1
+
+    def test_invalidated_when_file_changes(self):
+        """A modified file is parsed again."""
+        cache = SourceCache()
+        first = cache.module(self.module_path)
+
+        Path(self.module_path).write_text(MODULE_SOURCE + "\n\ndef extra():\n    pass\n")
+        second = cache.module(self.module_path)
+
+        assert second is not first
+        assert len(second.functions) == len(first.functions) + 1
+
+    def test_lru_eviction(self):
+        """The least recently used module is evicted past max_files."""
+        cache = SourceCache(max_files=1)
+        other_path = os.path.join(self.temp_dir, "other_module.py")
+        Path(other_path).write_text("def other():\n    pass\n")
+
+        cache.module(self.module_path)
+        cache.module(other_path)
+
+        assert len(cache) == 1
+        assert cache.module(other_path) is cache.module(other_path)
+
+    def test_end_lines_filled_without_end_lineno(self):
+        """Function spans match the real ones when the parser omits end_lineno."""
+        Path(self.module_path).write_text(MODULE_SOURCE + BRANCHY_SOURCE)
+        expected = {(node.name, node.lineno): node.end_lineno
+                    for node in ast.walk(ast.parse(MODULE_SOURCE + BRANCHY_SOURCE))
+                    if isinstance(node, ast.FunctionDef)}
+        real_verdicts = validate_module(self.module_path)
+        source_cache.clear()
+
+        with patch.object(quality_guard_exceptions.ast, "parse", _parse_without_end_lines):
+            module = source_cache.module(self.module_path)
+            verdicts = validate_module(self.module_path)
+
+        filled = {(node.name, node.lineno): node.end_lineno
+                  for node in ast.walk(module.tree) if isinstance(node, ast.FunctionDef)}
+        assert filled == expected
+        assert dict(verdicts.items()) == dict(real_verdicts.items())
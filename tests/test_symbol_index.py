@@ -0,0 +1,140 @@
+"""
+Tests for the persistent symbol indexes used by require_tests and
+require_architecture_docs.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+from quality_guard_exceptions import (
+    DocSymbolIndex,
+    UnitTestIndex,
+    _extract_doc_symbols,
+    _extract_test_names,
+)
+
+
+class TestUnitTestIndex:
+    """Tests for UnitTestIndex lookups and cache invalidation."""
+
+    def setup_method(self):
+        """Create a small test tree in a temporary directory."""
+        self.root = Path(tempfile.mkdtemp())
+        (self.root / "tests").mkdir()
+        self._write("tests/test_math.py", '''
+def test_add_numbers():
+    assert True
+
+class TestParser:
+    def test_parse_line_edge_cases(self):
+        assert True
+''')
+
+    def teardown_method(self):
+        """Cleanup after each test."""
+        shutil.rmtree(self.root)
+
+    def _write(self, rel_path, content):
+        (self.root / rel_path).write_text(content)
+
+    def _index(self):
+        return UnitTestIndex(["tests/test_*.py"], root=self.root)
+
+    def test_finds_functions_and_methods(self):
+        """Top-level tests and test class methods are indexed."""
+        index = self._index()
+
+        assert index.has_test_for("add_numbers")
+        assert index.has_test_for("parse_line")
+        assert index.has_test_for("Parser")
+        assert not index.has_test_for("subtract")
+
+    def test_prefix_matches_only_on_name_boundary(self):
+        """test_add_numbers covers add and add_numbers but not add_num."""
+        index = self._index()
+
+        assert index.has_test_for("add")
+        assert not index.has_test_for("add_num")
+
+    def test_cache_file_reused_for_unchanged_files(self):
+        """A new index reads names from the cache instead of parsing."""
+        self._index().refresh()
+        cache_file = self.root / ".quality_guard_cache" / "test_index.json"
+        assert "tests/test_math.py" in json.loads(cache_file.read_text())["files"]
+
+        with patch("quality_guard_exceptions._extract_test_names") as mock_extract:
+            assert self._index().has_test_for("add_numbers")
+            assert not mock_extract.called
+
+    def test_refresh_reparses_changed_file(self):
+        """A modified test file is re-indexed on refresh."""
+        index = self._index()
+        assert not index.has_test_for("multiply")
+
+        self._write("tests/test_math.py", "def test_multiply():\n    assert True\n")
+        os.utime(self.root / "tests" / "test_math.py", ns=(1, 1))
+        index.refresh()
+
+        assert index.has_test_for("multiply")
+        assert not index.has_test_for("add_numbers")
+
+    def test_invalid_syntax_falls_back_to_tokens(self):
+        """Names are still extracted from files that do not parse."""
+        assert "test_broken" in _extract_test_names("def test_broken(:\n")
+
+
+class TestDocSymbolIndex:
+    """Tests for DocSymbolIndex identifier extraction and lookups."""
+
+    def setup_method(self):
+        """Create architecture docs in a temporary directory."""
+        self.root = Path(tempfile.mkdtemp())
+        (self.root / "docs").mkdir()
+        (self.root / "docs" / "API.md").write_text(
+            "# API\n"
+            "\n"
+            "## UserService.get_user\n"
+            "\n"
+            "Call `create_order(items)` to place an order.\n"
+            "Plain prose mentions delete_account without markup.\n"
+            "\n"
+            "```python\n"
+            "def refresh_cache(): ...\n"
+            "```\n"
+        )
+
+    def teardown_method(self):
+        """Cleanup after each test."""
+        shutil.rmtree(self.root)
+
+    def test_indexes_headings_spans_and_fences(self):
+        """Identifiers from headings, code spans and fences are found."""
+        index = DocSymbolIndex(["README.md", "docs/API.md"], root=self.root)
+
+        assert index.is_documented("get_user")
+        assert index.is_documented("UserService")
+        assert index.is_documented("create_order")
+        assert index.is_documented("refresh_cache")
+        assert not index.is_documented("delete_account")
+
+    def test_matches_whole_identifiers_only(self):
+        """get does not match get_user."""
+        index = DocSymbolIndex(["docs/API.md"], root=self.root)
+
+        assert not index.is_documented("get")
+        assert not index.is_documented("create")
+
+    def test_cache_file_written(self):
+        """The index is persisted next to the project."""
+        DocSymbolIndex(["docs/API.md"], root=self.root).refresh()
+
+        cache_file = self.root / ".quality_guard_cache" / "doc_index.json"
+        assert "docs/API.md" in json.loads(cache_file.read_text())["files"]
+
+    def test_unclosed_fence_is_tolerated(self):
+        """An unterminated fence still yields its identifiers."""
+        assert "build_report" in _extract_doc_symbols("```\nbuild_report()\n")
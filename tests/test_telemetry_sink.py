@@ -0,0 +1,112 @@
+"""
+Tests for the JSONL violation telemetry sink.
+"""
+
+import json
+import shutil
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from conftest import undocumented_function, write_config
+from quality_guard_exceptions import (
+    QualityLevel,
+    QualityViolation,
+    TelemetrySink,
+    enforce_quality,
+    get_telemetry_sink,
+    verdict_cache,
+)
+
+
+def _violation(rule_name="missing_docstring", function_name="handler"):
+    return QualityViolation(rule_name, "message", "suggestion", QualityLevel.ERROR,
+                            file_path="app/handlers.py", line_number=7, function_name=function_name)
+
+
+def _records(path):
+    return [json.loads(line) for line in Path(path).read_text().splitlines()]
+
+
+class TestTelemetrySink:
+    """Tests for batching, dedupe, rotation and back-pressure."""
+
+    def setup_method(self):
+        """Write telemetry into a temporary directory."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = Path(self.temp_dir, "violations.jsonl")
+
+    def teardown_method(self):
+        """Remove telemetry files."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_batch_is_deduplicated_with_counts(self):
+        """Repeated violations become one record with a counter."""
+        sink = TelemetrySink(self.path, flush_interval=0.2)
+        for _ in range(50):
+            sink.record([_violation()])
+        sink.record([_violation(function_name="other")])
+        assert sink.flush()
+
+        records = _records(self.path)
+        assert sum(r["count"] for r in records if r["function"] == "handler") == 50
+        assert len(records) <= 3
+        assert sink.counters()[("missing_docstring", "handler", "app/handlers.py")] == 50
+        assert records[0]["rule"] == "missing_docstring" and records[0]["line"] == 7
+
+    def test_full_queue_drops_without_blocking(self):
+        """A full queue counts dropped records instead of waiting."""
+        sink = TelemetrySink(self.path, queue_size=2)
+        with patch.object(TelemetrySink, "_start"):
+            results = [sink.record([_violation()]) for _ in range(5)]
+
+        assert results == [True, True, False, False, False]
+        assert sink.dropped == 3
+
+    def test_rotation(self):
+        """The file is rotated once it reaches max_bytes."""
+        sink = TelemetrySink(self.path, max_bytes=1, backup_count=2, flush_interval=0)
+        for rule in ("a", "b", "c"):
+            sink.record([_violation(rule_name=rule)])
+            assert sink.flush()
+
+        assert [r["rule"] for r in _records(self.path)] == ["c"]
+        assert [r["rule"] for r in _records(f"{self.path}.1")] == ["b"]
+        assert [r["rule"] for r in _records(f"{self.path}.2")] == ["a"]
+
+
+class TestWarningLevelDecorators:
+    """Tests for decorators recording instead of raising."""
+
+    @pytest.fixture(autouse=True)
+    def warning_config(self, project_dir):
+        """Record violations into telemetry.jsonl instead of raising."""
+        write_config(enforcement_level="warning",
+                     telemetry={"path": "telemetry.jsonl", "flush_interval": 0})
+
+    def test_violating_calls_are_recorded(self):
+        """Every call of a violating function is counted, none raises."""
+        guarded = enforce_quality(undocumented_function)
+        for i in range(3):
+            assert guarded(i) == i
+
+        sink = get_telemetry_sink()
+        assert sink.flush()
+        assert sum(r["count"] for r in _records("telemetry.jsonl")) == 3
+
+    def test_violations_checked_once(self):
+        """After the first call only the cached violations are recorded."""
+        guarded = enforce_quality(undocumented_function)
+        guarded(0)
+
+        sink = get_telemetry_sink()
+        with patch.object(verdict_cache, "verdict_for") as mock_verdict, \
+                patch.object(sink, "record", wraps=sink.record) as mock_record:
+            for i in range(5):
+                assert guarded(i) == i
+
+        assert not mock_verdict.called
+        assert mock_record.call_count == 5
+        assert mock_record.call_args[0][0][0].rule_name == "missing_docstring"
@@ -0,0 +1,79 @@
+"""
+Tests for concurrent use of QualityGuardValidator and the decorators.
+"""
+
+import threading
+
+import pytest
+
+from conftest import documented_function, undocumented_function
+from quality_guard_exceptions import (
+    QualityGuardException,
+    QualityGuardValidator,
+    ValidationResult,
+    enforce_quality,
+    verdict_cache,
+)
+
+
+def _run_threads(target, count=32):
+    barrier = threading.Barrier(count)
+    errors = []
+
+    def worker():
+        barrier.wait()
+        try:
+            target()
+        except Exception as e:  # pragma: no cover - reported below
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return errors
+
+
+@pytest.mark.usefixtures("project_dir")
+class TestThreadSafety:
+    """Tests for a shared validator and shared wrappers under 32 threads."""
+
+    def test_result_is_immutable_and_fresh(self):
+        """Each call returns a new tuple-based result."""
+        validator = QualityGuardValidator()
+        first = validator.validate_function(undocumented_function)
+        second = validator.validate_function(undocumented_function)
+
+        assert isinstance(first, ValidationResult)
+        assert first is not second
+        assert first[0].rule_name == second[0].rule_name == "missing_docstring"
+        with pytest.raises(AttributeError):
+            first.append(None)
+        assert not hasattr(validator, "violations")
+
+    def test_shared_validator_under_contention(self):
+        """Results from interleaved validations never leak into each other."""
+        validator = QualityGuardValidator()
+
+        def target():
+            for _ in range(20):
+                assert validator.validate_function(documented_function) == ()
+                bad = validator.validate_function(undocumented_function)
+                assert [v.rule_name for v in bad] == ["missing_docstring"]
+
+        assert _run_threads(target) == []
+
+    def test_shared_wrappers_under_contention(self):
+        """Guarded functions give the same answers from 32 threads."""
+        good = enforce_quality(documented_function)
+        bad = enforce_quality(undocumented_function)
+
+        def target():
+            for i in range(50):
+                assert good(i, 1) == i + 1
+                with pytest.raises(QualityGuardException):
+                    bad(i)
+
+        assert _run_threads(target) == []
+        assert len(verdict_cache) == 2
@@ -0,0 +1,129 @@
+"""
+Tests for the eager, lazy and per_call validation modes of the decorators.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from conftest import documented_function, undocumented_function, write_config
+from quality_guard_exceptions import (
+    MissingDocumentationException,
+    QualityGuardException,
+    QualityGuardValidator,
+    SamplingPolicy,
+    SamplingStats,
+    enforce_quality,
+    require_docs,
+    reset_sampling_stats,
+    sampling_summary,
+    verdict_cache,
+)
+
+
+@pytest.mark.usefixtures("project_dir")
+class TestValidationModes:
+    """Tests for the validation_mode setting."""
+
+    def test_eager_returns_original_function(self):
+        """Eager mode leaves passing functions untouched."""
+        write_config(validation_mode="eager")
+
+        assert enforce_quality(documented_function) is documented_function
+        assert require_docs(documented_function) is documented_function
+
+    def test_eager_raises_at_decoration(self):
+        """Eager mode reports violations before the first call."""
+        write_config(validation_mode="eager")
+
+        with pytest.raises(MissingDocumentationException):
+            require_docs(undocumented_function)
+        with pytest.raises(QualityGuardException):
+            enforce_quality(undocumented_function)
+
+    def test_eager_skips_function_without_source(self):
+        """Eager mode lets through functions whose source cannot be read."""
+        write_config(validation_mode="eager")
+        namespace = {}
+        exec("def generated(x):\n    return x\n", namespace)
+
+        assert enforce_quality(namespace["generated"]) is namespace["generated"]
+
+    def test_lazy_defers_validation_to_first_call(self):
+        """Lazy mode validates on the first call only."""
+        write_config(validation_mode="lazy")
+        original = QualityGuardValidator.validate_function
+
+        with patch.object(QualityGuardValidator, "validate_function",
+                          autospec=True, side_effect=original) as mock_validate:
+            guarded = enforce_quality(documented_function)
+            assert mock_validate.call_count == 0
+
+            guarded(1, 2)
+            guarded(1, 2)
+            assert mock_validate.call_count == 1
+
+    def test_per_call_validates_every_call(self):
+        """per_call mode bypasses the verdict cache."""
+        write_config(validation_mode="per_call")
+        original = QualityGuardValidator.validate_function
+
+        with patch.object(QualityGuardValidator, "validate_function",
+                          autospec=True, side_effect=original) as mock_validate:
+            guarded = enforce_quality(documented_function)
+            guarded(1, 2)
+            guarded(1, 2)
+            assert mock_validate.call_count == 2
+
+        assert len(verdict_cache) == 0
+
+
+@pytest.mark.usefixtures("project_dir")
+class TestSampling:
+    """Tests for sampled per_call validation."""
+
+    def setup_method(self):
+        """Start each test with empty sampling counters."""
+        reset_sampling_stats()
+
+    def teardown_method(self):
+        """Drop the sampling counters of the test."""
+        reset_sampling_stats()
+
+    def test_validates_one_in_n_calls(self):
+        """every_n validates the first of each group of N calls."""
+        write_config(validation_mode="per_call", sampling={"every_n": 5})
+        original = QualityGuardValidator.validate_function
+
+        with patch.object(QualityGuardValidator, "validate_function",
+                          autospec=True, side_effect=original) as mock_validate:
+            guarded = enforce_quality(documented_function)
+            for _ in range(10):
+                guarded(1, 2)
+            assert mock_validate.call_count == 2
+
+        summary = sampling_summary()[f"{documented_function.__module__}.documented_function"]
+        assert summary == {"calls": 10, "sampled": 2, "skipped": 8}
+
+    def test_sampled_call_still_raises(self):
+        """A sampled call enforces the verdict, skipped calls pass."""
+        write_config(validation_mode="per_call", sampling={"every_n": 2})
+        guarded = enforce_quality(undocumented_function)
+
+        with pytest.raises(QualityGuardException):
+            guarded(1)
+        assert guarded(1) == 1
+
+    def test_min_interval_and_warmup(self):
+        """Rate limit and warm-up window both suppress validation."""
+        stats = SamplingStats("f")
+        limited = SamplingPolicy(min_interval=3600)
+        assert limited.should_sample(stats)
+        assert not limited.should_sample(stats)
+
+        expired = SamplingPolicy(warmup_seconds=0)
+        assert not expired.should_sample(SamplingStats("g"))
+
+    def test_default_policy_samples_everything(self):
+        """Without sampling settings every call is validated."""
+        assert SamplingPolicy.from_config({}).samples_everything
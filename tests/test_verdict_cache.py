@@ -0,0 +1,59 @@
+"""
+Tests for the process-wide verdict cache used by enforce_quality.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from conftest import documented_function, undocumented_function
+from quality_guard_exceptions import (
+    QualityGuardException,
+    QualityGuardValidator,
+    enforce_quality,
+    verdict_cache,
+)
+
+
+@pytest.mark.usefixtures("project_dir")
+class TestVerdictCache:
+    """Tests for validate-once behaviour of enforce_quality."""
+
+    def test_validates_only_on_first_call(self):
+        """The validator runs once, later calls hit the cache."""
+        guarded = enforce_quality(documented_function)
+        original = QualityGuardValidator.validate_function
+
+        with patch.object(QualityGuardValidator, "validate_function",
+                          autospec=True, side_effect=original) as mock_validate:
+            assert guarded(1, 2) == 3
+            assert guarded(3, 4) == 7
+            assert mock_validate.call_count == 1
+
+        assert verdict_cache.get(documented_function.__code__).error is None
+
+    def test_cached_failure_is_reraised(self):
+        """A failing verdict is raised again without revalidation."""
+        guarded = enforce_quality(undocumented_function)
+
+        with pytest.raises(QualityGuardException) as first:
+            guarded(1)
+        with pytest.raises(QualityGuardException) as second:
+            guarded(1)
+
+        assert first.value is second.value
+        assert second.value.violations[0].rule_name == "missing_docstring"
+
+    def test_verdict_shared_between_wrappers(self):
+        """Wrappers of the same function share one cache entry."""
+        enforce_quality(documented_function)(1, 2)
+        enforce_quality(documented_function)(1, 2)
+
+        assert len(verdict_cache) == 1
+
+    def test_refresh_keeps_unchanged_sources(self):
+        """refresh() drops nothing while source files are unchanged."""
+        enforce_quality(documented_function)(1, 2)
+
+        assert verdict_cache.refresh() == 0
+        assert len(verdict_cache) == 1
@@ -0,0 +1,102 @@
+"""
+Tests for the slotted QualityViolation record and lazy report rendering.
+"""
+
+import pickle
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from quality_guard_exceptions import (
+    MISSING_DOCSTRING_MESSAGE,
+    MissingTestException,
+    QualityGuardException,
+    QualityLevel,
+    QualityViolation,
+)
+
+
+def _violation(**kwargs):
+    fields = dict(rule_name="missing_docstring", message=MISSING_DOCSTRING_MESSAGE,
+                  suggestion="Dodaj docstring do {func_name}", level=QualityLevel.ERROR,
+                  file_path="pkg/module.py", line_number=3, function_name="handler",
+                  params={"func_name": "handler"})
+    fields.update(kwargs)
+    return QualityViolation(**fields)
+
+
+class TestQualityViolation:
+    """Tests for the violation record."""
+
+    def test_slotted_and_interned(self):
+        """Records carry no __dict__ and share rule name and path strings."""
+        violation = _violation(rule_name="".join(["missing_", "docstring"]))
+
+        assert not hasattr(violation, "__dict__")
+        assert violation.rule_name is sys.intern("missing_docstring")
+        assert violation.file_path is _violation().file_path
+
+    def test_templates_rendered_on_access(self):
+        """Message and suggestion are formatted only when read."""
+        broken = _violation(message="{missing_key}")
+
+        assert broken.suggestion == "Dodaj docstring do handler"
+        with pytest.raises(KeyError):
+            broken.message
+
+    def test_plain_strings_kept_verbatim(self):
+        """Without params the texts are returned unchanged."""
+        violation = _violation(message="{not a template}", params=None)
+
+        assert violation.message == "{not a template}"
+
+    def test_equality_uses_rendered_fields(self):
+        """Two violations with the same content compare equal."""
+        plain = _violation(message="Funkcja 'handler' nie ma odpowiedniej dokumentacji",
+                           suggestion="Dodaj docstring do handler", params=None)
+
+        assert _violation() == plain
+
+
+class TestLazyExceptionMessage:
+    """Tests for deferred formatting of QualityGuardException."""
+
+    def test_report_formatted_only_when_read(self):
+        """Creating and catching the exception does not build the report."""
+        with patch.object(QualityGuardException, "_format_message",
+                          autospec=True, return_value="report") as mock_format:
+            try:
+                raise QualityGuardException([_violation()])
+            except QualityGuardException as e:
+                error = e
+            assert mock_format.call_count == 0
+
+            assert str(error) == "report"
+            assert str(error) == "report"
+            assert mock_format.call_count == 1
+
+    def test_report_contains_violation(self):
+        """The rendered report includes message and location."""
+        report = str(QualityGuardException([_violation()]))
+
+        assert "MISSING_DOCSTRING" in report
+        assert "pkg/module.py:3" in report
+        assert "Funkcja 'handler' nie ma odpowiedniej dokumentacji" in report
+
+    def test_args_and_repr_hold_the_report(self):
+        """args and repr() show the rendered report, as for Exception(message)."""
+        error = QualityGuardException([_violation()])
+
+        assert error.args == (str(error),)
+        assert repr(error) == f"QualityGuardException({str(error)!r})"
+
+    def test_pickle_round_trip(self):
+        """Subclasses with their own constructor arguments survive pickling."""
+        error = MissingTestException("handler", "pkg/module.py", 3)
+
+        restored = pickle.loads(pickle.dumps(error))
+
+        assert type(restored) is MissingTestException
+        assert restored.args == error.args
+        assert [v.rule_name for v in restored.violations] == ["missing_unit_test"]